@@ -5,10 +5,116 @@ from settings import (
     ENEMY_SIZE, ENEMY_SPEED,
     WORLD_WIDTH, WORLD_HEIGHT,
 )
+from utils.surface_factory import COLORKEY, to_display, to_display_colorkey, register_cache
 
-# Caché visual: Guarda tuplas (imagen_normal, imagen_flash)
+class SpriteSet:
+    """
+    Sprites de un tipo de enemigo (imagen normal + frames de flash).
+    Los enemigos guardan la referencia al objeto, así una reconversión de
+    formato (cambio de modo de video) les llega sin tocarlos uno por uno.
+    """
+    __slots__ = ('image', 'flash_frames', 'scaled')
+    def __init__(self, image, flash_frames):
+        self.image = image
+        self.flash_frames = flash_frames
+        self.scaled = {}
+
+    def get_scaled(self, scale):
+        """Versión reducida para la resolución dinámica (cacheada por escala)"""
+        if scale == 1.0:
+            return self
+        sprites = self.scaled.get(scale)
+        if sprites is None:
+            w, h = self.image.get_size()
+            size = (max(1, int(w * scale)), max(1, int(h * scale)))
+            image = to_display_colorkey(pygame.transform.scale(self.image, size))
+            flash_frames = tuple(to_display(pygame.transform.scale(f, size)) for f in self.flash_frames)
+            sprites = SpriteSet(image, flash_frames)
+            self.scaled[scale] = sprites
+        return sprites
+
+# Caché visual: (size, total_size, color) -> SpriteSet
 SPRITE_CACHE = {}
 
+# Niveles de alpha pre-horneados del flash de daño (damage_flash va de 10 a 0)
+FLASH_ALPHA_LEVELS = (51, 102, 153, 204, 255)
+FLASH_MAX = 10
+
+# Barras de vida pre-renderizadas: clave (ancho, alto, paso de vida)
+HEALTH_BAR_CACHE = {}
+HEALTH_BAR_STEPS = 20
+HEALTH_BAR_HEIGHT = 4
+
+def _flash_index(damage_flash):
+    """Convierte el timer de flash en el índice del frame pre-horneado"""
+    index = int(damage_flash * len(FLASH_ALPHA_LEVELS) / FLASH_MAX)
+    return min(index, len(FLASH_ALPHA_LEVELS) - 1)
+
+def get_health_bar(width, health_ratio, height=HEALTH_BAR_HEIGHT):
+    """Barra de vida cuantizada en HEALTH_BAR_STEPS pasos (fondo + relleno en una superficie)"""
+    step = max(1, min(HEALTH_BAR_STEPS, math.ceil(health_ratio * HEALTH_BAR_STEPS)))
+    key = (width, height, step)
+    surf = HEALTH_BAR_CACHE.get(key)
+    if surf is None:
+        surf = pygame.Surface((width, height))
+        surf.fill((60, 0, 0))
+        ratio = step / HEALTH_BAR_STEPS
+        health_color = (255, 0, 0) if ratio < 0.3 else (255, 100, 0)
+        surf.fill(health_color, (0, 0, int(width * ratio), height))
+        surf = to_display(surf, alpha=False)
+        HEALTH_BAR_CACHE[key] = surf
+    return surf
+
+def convert_sprite_cache():
+    """Reconvierte sprites y barras de vida al formato actual del display"""
+    for sprites in SPRITE_CACHE.values():
+        sprites.image = to_display_colorkey(sprites.image)
+        sprites.flash_frames = tuple(to_display(frame) for frame in sprites.flash_frames)
+        sprites.scaled.clear()
+    for key, surf in HEALTH_BAR_CACHE.items():
+        HEALTH_BAR_CACHE[key] = to_display(surf, alpha=False)
+
+register_cache(convert_sprite_cache)
+
+def render_enemies(screen, states, camera, show_health_bars=True, alpha=1.0):
+    """
+    Pasada de render por lotes: arma UNA secuencia para screen.blits con los
+    sprites por tipo, el frame de flash que toque y las barras de vida cacheadas.
+    states: tuplas de Enemy.get_render_state() (copias, no los enemigos vivos).
+    alpha: fracción entre la posición del tick anterior y la actual (interpolación).
+    """
+    cam_x = camera.offset_x
+    cam_y = camera.offset_y
+    scale = camera.render_scale
+    bar_height = max(1, int(HEALTH_BAR_HEIGHT * scale))
+    blit_sequence = []
+    bar_sequence = []
+    append = blit_sequence.append
+    
+    for _, sprites, prev_x, prev_y, x, y, damage_flash, size, bar_offset, health_ratio in states:
+        if alpha < 1.0:
+            x = prev_x + (x - prev_x) * alpha
+            y = prev_y + (y - prev_y) * alpha
+        if scale == 1.0:
+            pos = (int(x + cam_x), int(y + cam_y))
+        else:
+            pos = (int((x + cam_x) * scale), int((y + cam_y) * scale))
+            sprites = sprites.get_scaled(scale)
+        append((sprites.image, pos))
+        
+        if damage_flash > 0:
+            append((sprites.flash_frames[_flash_index(damage_flash)], pos))
+        
+        if show_health_bars and health_ratio < 1.0:
+            offset = bar_offset * scale
+            bar = get_health_bar(max(1, int(size * scale)), health_ratio, bar_height)
+            bar_sequence.append((bar, (pos[0] + offset, pos[1] + offset - 7 * scale)))
+    
+    # Las barras van encima de todos los cuerpos
+    blit_sequence.extend(bar_sequence)
+    if blit_sequence:
+        screen.blits(blit_sequence, doreturn=False)
+
 class Enemy:
     TYPES = {
         'small': {'size_mult': 0.9, 'health': 30, 'speed_mult': 1.1, 'damage': 5, 'color': (160, 240, 160), 'points': 5},
@@ -20,6 +126,9 @@ class Enemy:
     def __init__(self, x, y, speed_multiplier=1.0, enemy_type='normal'):
         self.x = x
         self.y = y
+        # Posición del tick anterior (interpolación de render)
+        self.prev_x = x
+        self.prev_y = y
         self.enemy_type = enemy_type
         type_data = self.TYPES[enemy_type]
         
@@ -35,8 +144,10 @@ class Enemy:
         self.hitbox_padding = 10
         self.hitbox_total = self.size + self.hitbox_padding
         
-        # Generamos (o recuperamos) las DOS imágenes
-        self.image, self.flash_image = self._get_cached_sprite(self.size, self.hitbox_total, self.color)
+        self.bar_offset = (self.hitbox_total - self.size) // 2
+        
+        # Generamos (o recuperamos) la imagen normal y los frames de flash
+        self.sprites = self._get_cached_sprite(self.size, self.hitbox_total, self.color)
         
         self.rect = pygame.Rect(0, 0, self.hitbox_total, self.hitbox_total)
         self.rect.center = (self.x, self.y)
@@ -65,9 +176,10 @@ class Enemy:
 
     def _get_cached_sprite(self, size, total_size, color):
         """
-        Genera dos sprites:
-        1. Normal: Tu diseño original.
-        2. Flash: Cuerpo BLANCO, pero bordes y centro oscuros (para el efecto de daño).
+        Genera los sprites de un tipo:
+        1. Normal: Tu diseño original (color clave + RLE, sin alpha por pixel).
+        2. Flash: Cuerpo BLANCO, pero bordes y centro oscuros (para el efecto de daño),
+           pre-horneado en cada nivel de FLASH_ALPHA_LEVELS (sin set_alpha compartido).
         """
         key = (size, total_size, color)
         if key not in SPRITE_CACHE:
@@ -81,7 +193,8 @@ class Enemy:
             center_rect = (c_pos, c_pos, center_size, center_size)
 
             # IMAGEN NORMAL
-            surf = pygame.Surface((total_size, total_size), pygame.SRCALPHA)
+            surf = pygame.Surface((total_size, total_size))
+            surf.fill(COLORKEY)
             pygame.draw.rect(surf, color, draw_rect)
             pygame.draw.rect(surf, border_color, draw_rect, 2)
             pygame.draw.rect(surf, border_color, center_rect)
@@ -92,7 +205,13 @@ class Enemy:
             pygame.draw.rect(surf_flash, border_color, draw_rect, 2)
             pygame.draw.rect(surf_flash, border_color, center_rect)
             
-            SPRITE_CACHE[key] = (surf, surf_flash)
+            flash_frames = []
+            for alpha in FLASH_ALPHA_LEVELS:
+                frame = surf_flash.copy()
+                frame.fill((255, 255, 255, alpha), special_flags=pygame.BLEND_RGBA_MULT)
+                flash_frames.append(to_display(frame))
+            
+            SPRITE_CACHE[key] = SpriteSet(to_display_colorkey(surf), tuple(flash_frames))
             
         return SPRITE_CACHE[key]
     
@@ -149,6 +268,8 @@ class Enemy:
     def update_physics(self, dt=1.0):
         if not self.is_alive: return
         
+        self.prev_x = self.x
+        self.prev_y = self.y
         self.x += (self.vx + self.knockback_x) * dt
         self.y += (self.vy + self.knockback_y) * dt
         
@@ -205,6 +326,16 @@ class Enemy:
             return True
         return False
     
+    def get_render_state(self):
+        """
+        Copia de lo que necesita render_enemies (la identidad va primero).
+        Esquina superior izquierda del tick anterior y del actual.
+        """
+        half = self.hitbox_total // 2
+        return (id(self), self.sprites, self.prev_x - half, self.prev_y - half,
+                self.x - half, self.y - half, self.damage_flash,
+                self.size, self.bar_offset, self.health / self.max_health)
+    
     def apply_knockback(self, projectile_x, projectile_y, force=5):
         dx = self.x - projectile_x
         dy = self.y - projectile_y
@@ -217,34 +348,13 @@ class Enemy:
             self.knockback_x = dx * force * size_factor
             self.knockback_y = dy * force * size_factor
 
-    def render(self, screen, camera):
+    def render(self, screen, camera, show_health_bar=True):
         if not self.is_alive: return
         
         if not camera.is_on_screen(self.rect):
             return
 
-        screen_pos = camera.apply_coords(self.rect.x, self.rect.y)
-        
-        screen.blit(self.image, screen_pos)
-        
-        if self.damage_flash > 0:
-            alpha = int(min(255, max(0, self.damage_flash * 25.5))) 
-            self.flash_image.set_alpha(alpha)
-            screen.blit(self.flash_image, screen_pos)
-
-        if self.health < self.max_health:
-            bar_width = self.size
-            bar_height = 4
-            health_width = (self.health / self.max_health) * bar_width
-            
-            offset = (self.hitbox_total - self.size) // 2
-            bar_x = screen_pos[0] + offset
-            bar_y = screen_pos[1] + offset - 7
-            
-            pygame.draw.rect(screen, (60, 0, 0), (bar_x, bar_y, bar_width, bar_height))
-            
-            health_color = (255, 0, 0) if self.health < self.max_health * 0.3 else (255, 100, 0)
-            pygame.draw.rect(screen, health_color, (bar_x, bar_y, health_width, bar_height))
+        render_enemies(screen, (self.get_render_state(),), camera, show_health_bar)
 
     @staticmethod
     def spawn_random(speed_multiplier=1.0, wave=1):
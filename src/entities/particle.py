@@ -54,18 +54,55 @@ class Particle:
         if self.lifetime <= 0:
             self.is_alive = False
 
+# --- TABLAS PRECALCULADAS PARA RÁFAGAS ---
+# Direcciones unitarias (cos, sin) en pasos fijos: evita cos/sin por partícula
+DIRECTION_STEPS = 64
+DIRECTION_STEPS_PER_RAD = DIRECTION_STEPS / (math.pi * 2)
+DIRECTION_TABLE = tuple(
+    (math.cos(i / DIRECTION_STEPS_PER_RAD), math.sin(i / DIRECTION_STEPS_PER_RAD))
+    for i in range(DIRECTION_STEPS)
+)
+
+DRIP_COLORS = (BLOOD_RED, DARK_BLOOD)
+DRIP_DARK_COLORS = (DARK_BLOOD,)
+
 class ParticleSystem:
+    # Presets de ráfaga: parámetros de ParticlePool.emit_burst
+    # Rangos (min, max) inclusivos para tamaño y vida, continuos para velocidad
+    PRESETS = {
+        'splatter': {'colors': (BLOOD_RED, BRIGHT_RED, DARK_BLOOD), 'size_range': (2, 5), 'lifetime_range': (40, 80),
+                     'speed_range': (2, 6), 'spread': 0.5, 'friction': 0.85},
+        'drip': {'colors': DRIP_COLORS, 'size_range': (2, 5), 'lifetime_range': (100, 200),
+                 'speed_range': (0, 0), 'friction': 0, 'scatter': 4},
+        'pool': {'colors': (DARK_BLOOD,), 'size_range': (10, 22), 'lifetime_range': (900, 1500),
+                 'speed_range': (0, 0), 'friction': 0},
+        'mist': {'colors': (BLOOD_RED, BRIGHT_RED), 'size_range': (3, 6), 'lifetime_range': (20, 45),
+                 'speed_range': (3, 10), 'friction': 0.9},
+        'chunk': {'colors': (DARK_BLOOD, GUTS_PINK), 'size_range': (4, 9), 'lifetime_range': (100, 300),
+                  'speed_range': (5, 12), 'friction': 0.92, 'is_chunk': True},
+    }
+
     def __init__(self):
         self.pool = None
         self.max_active_particles = 800
         self.particle_count = 0
         self.quality = 2 # 0=Low, 1=Mid, 2=High
+        self.burst_scale = 1.0 # Multiplicador de ráfagas (lo ajusta el QualityGovernor)
         
     def set_pool(self, particle_pool):
         self.pool = particle_pool
 
     def set_quality(self, level):
         self.quality = level
+
+    def set_burst_scale(self, scale):
+        self.burst_scale = scale
+
+    def _scaled(self, count):
+        """Aplica el multiplicador de ráfaga (mínimo 1 si se pidió algo)"""
+        if count <= 0:
+            return 0
+        return max(1, int(count * self.burst_scale))
     
     def _can_spawn(self, count):
         if not hasattr(self, 'pool'): return False
@@ -74,10 +111,26 @@ class ParticleSystem:
         # (Para una implementación estricta, contaríamos activas, pero es lento en Python)
         return True 
     
-    def create_blood_splatter(self, x, y, direction_vector=None, force=1.2, count=4):
+    def emit_burst(self, preset, x, y, count, direction=None, **overrides):
+        """
+        Emite una ráfaga de N partículas con un preset de PRESETS en una sola llamada.
+        direction: ángulo en radianes (cono de 'spread') o None (todas direcciones).
+        overrides: reemplaza parámetros del preset (colors, speed_range, etc).
+        """
+        if count <= 0 or self.pool is None:
+            return 0
+        params = self.PRESETS[preset]
+        if overrides:
+            params = {**params, **overrides}
+        return self.pool.emit_burst(x, y, count, direction=direction, **params)
+
+    def create_blood_splatter(self, x, y, direction_vector=None, force=1.2, count=4, scale=1.0, max_count=None):
         """
         Sangrado direccional (Impactos de bala).
         Si hay vector de dirección, la sangre sigue la inercia del disparo.
+        scale multiplica la cantidad (efectos fusionados por el EffectCoalescer).
+        max_count: tope de partículas a emitir (presupuesto restante del frame).
+        Retorna cuántas partículas se emitieron.
         """
         if self.quality == 2:
             actual_count = count * 3  # ¡Mucho más sangre en calidad alta!
@@ -85,37 +138,16 @@ class ParticleSystem:
             actual_count = count
         else:
             actual_count = 2
+        actual_count = self._scaled(actual_count * scale)
+        if max_count is not None:
+            actual_count = min(actual_count, max_count)
 
-        for _ in range(actual_count):
-            # Cálculo de ángulo: Si hay dirección (bala), usamos un cono de dispersión
-            if direction_vector:
-                base_angle = math.atan2(direction_vector[1], direction_vector[0])
-                # Dispersión de 45 grados aprox (0.8 radianes)
-                spread = random.uniform(-0.5, 0.5)
-                angle = base_angle + spread
-                # La sangre sale rápido
-                speed = random.uniform(4, 12) * force
-            else:
-                angle = random.uniform(0, math.pi * 2)
-                speed = random.uniform(2, 6)
-
-            velocity = (math.cos(angle) * speed, math.sin(angle) * speed)
-            
-            # Variedad de color: Sangre fresca, oscura o brillante
-            color = random.choice([BLOOD_RED, BRIGHT_RED, DARK_BLOOD])
-            
-            # Tamaño variado
-            size = random.randint(2, 5)
-            
-            self.pool.get(
-                x, y, color,
-                size=size,
-                lifetime=random.randint(40, 80),
-                velocity=velocity,
-                gravity=0,
-                friction=0.85, # Se frena al tocar el suelo
-                is_liquid=True
-            )
+        if direction_vector:
+            # Cono de dispersión de ~1 radián; la sangre sale rápido
+            direction = math.atan2(direction_vector[1], direction_vector[0])
+            return self.emit_burst('splatter', x, y, actual_count, direction=direction,
+                                   speed_range=(4 * force, 12 * force))
+        return self.emit_burst('splatter', x, y, actual_count)
 
     def create_blood_drip(self, x, y, intensity=1.0):
         """
@@ -128,44 +160,20 @@ class ParticleSystem:
         if self.quality == 0: 
             return
 
-        # Calculamos tamaño base según intensidad
         # Mínimo 2px, Máximo 10px
         base_size = min(10, 2 + int(intensity * 0.3))
         
         # Si la intensidad es MUY alta (ej. escopetazo reciente), soltamos más de una gota
-        # para hacer el rastro más denso.
         drops_count = 1
         if intensity > 15:
             drops_count = random.randint(1, 2)
         
-        for _ in range(drops_count):
-            # Pequeña dispersión aleatoria cerca de los pies del enemigo
-            spawn_x = x + random.uniform(-4, 4)
-            spawn_y = y + random.uniform(-4, 4)
-            
-            # Color: Cuanto más intenso, más oscura la sangre (arterial/profunda)
-            if intensity > 10:
-                color = DARK_BLOOD
-            else:
-                color = random.choice([BLOOD_RED, DARK_BLOOD])
-
-            # Variación de tamaño para que no se vea artificial
-            size = random.randint(base_size, base_size + 3)
-            
-            self.pool.get(
-                spawn_x, spawn_y,
-                color,
-                size=size,
-                # Vida larga para que el sistema de "Baking" (Paso anterior)
-                # tenga tiempo de detectarlo quieto y pegarlo al suelo.
-                lifetime=random.randint(100, 200), 
-                velocity=(0, 0), # Cae directo al suelo (quieto)
-                gravity=0,
-                friction=0,
-                is_liquid=True
-            )
+        # Cuanto más intenso, más oscura la sangre (arterial/profunda)
+        colors = DRIP_DARK_COLORS if intensity > 10 else DRIP_COLORS
+        self.emit_burst('drip', x, y, drops_count, colors=colors,
+                        size_range=(base_size, base_size + 3))
     
-    def create_blood_pool(self, x, y):
+    def create_blood_pool(self, x, y, scale=1.0, spread_radius=0, max_count=None):
         """
         Charco grande irregular.
         En High Quality crea múltiples 'blobs' para dar forma orgánica.
@@ -175,30 +183,21 @@ class ParticleSystem:
             blobs = random.randint(3, 6) # Charcos más complejos
         elif self.quality == 1:
             blobs = 2
-            
-        for _ in range(blobs):
-            # Desplazamiento aleatorio para que no sea un círculo perfecto
-            offset_dist = random.uniform(0, 15) if blobs > 1 else 0
-            offset_angle = random.uniform(0, math.pi * 2)
-            px = x + math.cos(offset_angle) * offset_dist
-            py = y + math.sin(offset_angle) * offset_dist
-            
-            # Tamaño aleatorio grande
-            size = random.randint(10, 22)
-            
-            self.pool.get(
-                px, py,
-                DARK_BLOOD, # Sangre coagulada en el piso
-                size=size,
-                lifetime=random.randint(900, 1500), # Duran mucho (15-25 seg)
-                velocity=(0, 0),
-                gravity=0,
-                friction=0,
-                is_liquid=True
-            )
+        blobs = self._scaled(blobs * scale)
+        if max_count is not None:
+            blobs = min(blobs, max_count)
+        
+        # Desplazamiento aleatorio para que no sea un círculo perfecto
+        scatter = 15 + spread_radius if blobs > 1 else 0
+        return self.emit_burst('pool', x, y, blobs, scatter=scatter)
 
-    def create_viscera_explosion(self, x, y):
-        """Muerte gore: Niebla roja + Trozos de carne + Charco"""
+    def create_viscera_explosion(self, x, y, scale=1.0, spread_radius=0, max_count=None):
+        """
+        Muerte gore: Niebla roja + Trozos de carne + Charco
+        scale/spread_radius agrandan el efecto cuando representa varias muertes.
+        max_count: tope total de partículas (se reparte en orden charco, niebla, trozos).
+        Retorna cuántas partículas se emitieron.
+        """
         
         # Ajuste de cantidad según calidad
         if self.quality == 2: # ULTRA GORE
@@ -213,46 +212,24 @@ class ParticleSystem:
             mist_count = 5
             chunk_count = 0
             pool_spawn = False
+        mist_count = self._scaled(mist_count * scale)
+        chunk_count = self._scaled(chunk_count * scale)
+        emitted = 0
 
         # 1. Charco base grande
         if pool_spawn:
-            self.create_blood_pool(x, y)
+            emitted += self.create_blood_pool(x, y, scale, spread_radius, max_count)
 
         # 2. Niebla de sangre (rápida y efímera, sale en todas direcciones)
-        for _ in range(mist_count):
-            angle = random.uniform(0, math.pi * 2)
-            speed = random.uniform(3, 10)
-            velocity = (math.cos(angle) * speed, math.sin(angle) * speed)
-            
-            color = random.choice([BLOOD_RED, BRIGHT_RED])
-            
-            self.pool.get(
-                x, y, color, 
-                size=random.randint(3, 6), 
-                lifetime=random.randint(20, 45), # Desaparece rápido
-                velocity=velocity,
-                gravity=0,
-                friction=0.9
-            )
+        if max_count is not None:
+            mist_count = min(mist_count, max_count - emitted)
+        emitted += self.emit_burst('mist', x, y, mist_count, scatter=spread_radius)
 
         # 3. Trozos de carne (Chunks) - Se deslizan lejos
-        for _ in range(chunk_count):
-            angle = random.uniform(0, math.pi * 2)
-            speed = random.uniform(5, 12) # Salen disparados
-            velocity = (math.cos(angle) * speed, math.sin(angle) * speed)
-            
-            # Color carne o sangre oscura
-            color = random.choice([DARK_BLOOD, GUTS_PINK])
-            
-            p = self.pool.get(
-                x, y, color,
-                size=random.randint(4, 9),
-                lifetime=random.randint(100, 300), # Se quedan un rato
-                velocity=velocity,
-                gravity=0,
-                friction=0.92, # Patinan más antes de frenar
-                is_chunk=True
-            )
+        if max_count is not None:
+            chunk_count = min(chunk_count, max_count - emitted)
+        emitted += self.emit_burst('chunk', x, y, chunk_count, scatter=spread_radius)
+        return emitted
     
     def update(self, dt=1.0): pass
     def render(self, screen, camera): pass
@@ -3,16 +3,67 @@ Jugador optimizado con DeltaTime + Cambio de Armas + Curación
 """
 import pygame
 import math
+from collections import namedtuple
 from settings import (
     PLAYER_SIZE, PLAYER_SPEED, PLAYER_ACCEL, PLAYER_FRICTION,
     WHITE, WORLD_WIDTH, WORLD_HEIGHT
 )
 from entities.weapon import PistolWeapon, ShotgunWeapon, LaserWeapon, AssaultRifleWeapon
 
+# Copia de lo que leen el render del jugador y el HUD (mismos nombres que Player)
+PlayerState = namedtuple('PlayerState', (
+    'prev_x', 'prev_y', 'x', 'y', 'size', 'color', 'angle', 'is_alive', 'health', 'max_health',
+    'damage_flash', 'invulnerable_frames', 'dash_active', 'dash_vector',
+    'dash_cooldown', 'dash_cooldown_timer',
+))
+
+def render_player(screen, player, camera, alpha=1.0):
+    """
+    Dibuja al jugador; 'player' puede ser un Player o un PlayerState
+    alpha: fracción entre la posición del tick anterior y la actual.
+    """
+    if not player.is_alive:
+        return
+    x = player.prev_x + (player.x - player.prev_x) * alpha
+    y = player.prev_y + (player.y - player.prev_y) * alpha
+    screen_pos = camera.apply_coords(x, y)
+    screen_x, screen_y = int(screen_pos[0]), int(screen_pos[1])
+
+    if player.invulnerable_frames > 0 and int(player.invulnerable_frames) % 6 < 3:
+        return
+    
+    scale = camera.render_scale
+    size = max(1, int(player.size * scale))
+    
+    if player.dash_active:
+        for i in range(3):
+            ghost_alpha = 100 - i * 30
+            ghost_surf = pygame.Surface((size, size), pygame.SRCALPHA)
+            ghost_surf.fill((*player.color[:3], ghost_alpha))
+            ghost_x = screen_x - player.dash_vector[0] * (i+1) * 15 * scale
+            ghost_y = screen_y - player.dash_vector[1] * (i+1) * 15 * scale
+            screen.blit(ghost_surf, (int(ghost_x - size//2), int(ghost_y - size//2)))
+
+    render_color = player.color
+    if player.damage_flash > 0:
+        flash = int(255 * (player.damage_flash / 15))
+        # Rojo si es daño, Verde si nos estamos curando (opcional, aquí sigue siendo rojo por simpleza)
+        render_color = (255, max(0, 255 - flash), max(0, 255 - flash))
+    
+    pygame.draw.rect(screen, render_color, (screen_x - size//2, screen_y - size//2, size, size))
+    
+    # Línea de dirección
+    end_x = screen_x + math.cos(player.angle) * (size * 1.2)
+    end_y = screen_y + math.sin(player.angle) * (size * 1.2)
+    pygame.draw.line(screen, render_color, (screen_x, screen_y), (end_x, end_y), max(1, int(3 * scale)))
+
 class Player:
     def __init__(self, x, y):
         self.x = x
         self.y = y
+        # Posición del tick anterior (interpolación de render)
+        self.prev_x = x
+        self.prev_y = y
         self.size = PLAYER_SIZE
         self.color = WHITE
         
@@ -162,6 +213,9 @@ class Player:
         if not self.is_alive:
             return
         
+        self.prev_x = self.x
+        self.prev_y = self.y
+        
         if self.dash_cooldown_timer > 0:
             self.dash_cooldown_timer -= 1 * dt
             
@@ -221,36 +275,15 @@ class Player:
             
         return did_shoot
 
-    def render(self, screen, camera):
-        if not self.is_alive:
-            return
-        screen_pos = camera.apply_coords(self.x, self.y)
-        screen_x, screen_y = int(screen_pos[0]), int(screen_pos[1])
-
-        if self.invulnerable_frames > 0 and int(self.invulnerable_frames) % 6 < 3:
-            return
-        
-        if self.dash_active:
-            for i in range(3):
-                ghost_alpha = 100 - i * 30
-                ghost_surf = pygame.Surface((self.size, self.size), pygame.SRCALPHA)
-                ghost_surf.fill((*self.color[:3], ghost_alpha))
-                ghost_x = screen_x - self.dash_vector[0] * (i+1) * 15
-                ghost_y = screen_y - self.dash_vector[1] * (i+1) * 15
-                screen.blit(ghost_surf, (int(ghost_x - self.size//2), int(ghost_y - self.size//2)))
+    def get_render_state(self):
+        return PlayerState(
+            self.prev_x, self.prev_y, self.x, self.y, self.size, self.color, self.angle, self.is_alive,
+            self.health, self.max_health, self.damage_flash, self.invulnerable_frames,
+            self.dash_active, self.dash_vector, self.dash_cooldown, self.dash_cooldown_timer,
+        )
 
-        render_color = self.color
-        if self.damage_flash > 0:
-            flash = int(255 * (self.damage_flash / 15))
-            # Rojo si es daño, Verde si nos estamos curando (opcional, aquí sigue siendo rojo por simpleza)
-            render_color = (255, max(0, 255 - flash), max(0, 255 - flash))
-        
-        pygame.draw.rect(screen, render_color, (screen_x - self.size//2, screen_y - self.size//2, self.size, self.size))
-        
-        # Línea de dirección
-        end_x = screen_x + math.cos(self.angle) * (self.size * 1.2)
-        end_y = screen_y + math.sin(self.angle) * (self.size * 1.2)
-        pygame.draw.line(screen, render_color, (screen_x, screen_y), (end_x, end_y), 3)
+    def render(self, screen, camera):
+        render_player(screen, self, camera)
     
     def get_position(self):
         return (self.x, self.y)
\ No newline at end of file
@@ -2,15 +2,43 @@ import pygame
 import math
 from settings import YELLOW, WORLD_WIDTH, WORLD_HEIGHT
 
+def render_projectiles(screen, states, camera, alpha=1.0):
+    """
+    Dibuja proyectiles a partir de sus tuplas de Projectile.get_render_state()
+    alpha: fracción entre la posición del tick anterior y la actual.
+    """
+    scale = camera.render_scale
+    for _, prev_x, prev_y, x, y, size, color, image_type, lifetime in states:
+        if alpha < 1.0:
+            x = prev_x + (x - prev_x) * alpha
+            y = prev_y + (y - prev_y) * alpha
+        screen_x, screen_y = camera.apply_coords(x, y)
+        center = (int(screen_x), int(screen_y))
+        size = max(1, int(size * scale))
+
+        if image_type == 'circle':
+            # Dibuja usando size (6px) para que se vea nítido
+            pygame.draw.circle(screen, color, center, size)
+            pygame.draw.circle(screen, (255, 255, 200), center, max(1, size // 2))
+        elif image_type == 'square':
+            # Dibuja el cuadrado visual
+            rect_surf = pygame.Surface((size*2, size*2), pygame.SRCALPHA)
+            pygame.draw.rect(rect_surf, color, (0, 0, size*2, size*2))
+            rotated_surf = pygame.transform.rotate(rect_surf, lifetime * 10)
+            screen.blit(rotated_surf, (screen_x - rotated_surf.get_width()//2,
+                                      screen_y - rotated_surf.get_height()//2))
+
 class Projectile:
     __slots__ = (
-        'x', 'y', 'angle', 'speed', 'size', 'color', 'damage', 
+        'x', 'y', 'prev_x', 'prev_y', 'angle', 'speed', 'size', 'color', 'damage', 
         'penetration', 'lifetime', 'is_alive', 'image_type', 
         'hit_enemies', 'vel_x', 'vel_y', 'rect', 'hitbox_size'
     )
     def __init__(self, x, y, angle, speed=10, damage=25, penetration=1, lifetime=120, image_type='circle'):
         self.x = x
         self.y = y
+        self.prev_x = x
+        self.prev_y = y
         self.angle = angle
         self.speed = speed
         self.size = 6
@@ -37,6 +65,8 @@ class Projectile:
         if not self.is_alive:
             return
         
+        self.prev_x = self.x
+        self.prev_y = self.y
         self.x += self.vel_x * dt
         self.y += self.vel_y * dt
         
@@ -70,26 +100,11 @@ class Projectile:
                     return enemy
         return None
 
-    # (El resto de métodos check_collision y render se mantienen igual, 
-    #  render usará self.size así que visualmente no cambia nada)
+    def get_render_state(self):
+        """Copia de lo que necesita render_projectiles (la identidad va primero)"""
+        return (id(self), self.prev_x, self.prev_y, self.x, self.y, self.size, self.color, self.image_type, self.lifetime)
+
     def render(self, screen, camera):
         if not self.is_alive:
             return
-            
-        screen_pos = camera.apply_coords(self.x, self.y)
-        try:
-            center = (int(screen_pos[0]), int(screen_pos[1]))
-        except:
-            return
-
-        if self.image_type == 'circle':
-            # Dibuja usando self.size (6px) para que se vea nítido
-            pygame.draw.circle(screen, self.color, center, self.size)
-            pygame.draw.circle(screen, (255, 255, 200), center, max(1, self.size // 2))
-        elif self.image_type == 'square':
-            # Dibuja el cuadrado visual
-            rect_surf = pygame.Surface((self.size*2, self.size*2), pygame.SRCALPHA)
-            pygame.draw.rect(rect_surf, self.color, (0, 0, self.size*2, self.size*2))
-            rotated_surf = pygame.transform.rotate(rect_surf, self.lifetime * 10)
-            screen.blit(rotated_surf, (screen_pos[0] - rotated_surf.get_width()//2, 
-                                      screen_pos[1] - rotated_surf.get_height()//2))
\ No newline at end of file
+        render_projectiles(screen, (self.get_render_state(),), camera)
@@ -2,22 +2,8 @@
 Sistema de armas optimizado para Disparo Manual (Top-Down Shooter)
 Estructura limpia: Pistola, Escopeta y Láser.
 """
-import math, random, pygame, os
-
-def load_sound(filename):
-    current_dir = os.path.dirname(os.path.abspath(__file__))
-    project_root = os.path.dirname(os.path.dirname(current_dir))
-    path = os.path.join(project_root, "assets", "sounds", filename)
-    if not os.path.exists(path):
-        print(f"Error: El archivo de sonido no existe en: {path}")
-        return None
-    try:
-        sound = pygame.mixer.Sound(path)
-        sound.set_volume(0.2)
-        return sound
-    except Exception as e:
-        print(f"Advertencia: No se pudo cargar el sonido {filename}. Error: {e}")
-        return None
+import math, random, pygame
+from managers.audio_manager import play_sound
 
 class Weapon:
     def __init__(self, owner, cooldown=60, damage=10, kickback=0, shake=0, spread=0):
@@ -30,7 +16,7 @@ class Weapon:
         self.shake_amount = shake
         self.base_spread = spread
         self.current_spread = spread
-        self.shoot_sound = None
+        self.shoot_sound = None  # Archivo en assets/sounds (lo reproduce el gestor de voces)
 
     def set_projectile_pool(self, pool):
         """Asigna el pool de proyectiles"""
@@ -51,7 +37,7 @@ class Weapon:
                 self.current_cooldown = self.cooldown
                 self._apply_physics(camera)
                 if self.shoot_sound:
-                    self.shoot_sound.play()
+                    play_sound(self.shoot_sound)
                 return True
         return False
 
@@ -74,7 +60,7 @@ class Weapon:
 class PistolWeapon(Weapon):
     def __init__(self, owner):
         super().__init__(owner, cooldown=12, damage=12, kickback=0, shake=2.0, spread=0.02)
-        self.shoot_sound = load_sound("pistol_fire.wav")
+        self.shoot_sound = "pistol_fire.wav"
     def activate(self, camera=None):
         if not self.projectile_pool: return False
         
@@ -97,7 +83,7 @@ class ShotgunWeapon(Weapon):
     def __init__(self, owner):
         super().__init__(owner, cooldown=50, damage=18, kickback=12.0, shake=8.0, spread=0.4)
         self.pellets = 8
-        self.shoot_sound = load_sound("shotgun_fire.wav")
+        self.shoot_sound = "shotgun_fire.wav"
     def activate(self, camera=None):
         if not self.projectile_pool: return False
         
@@ -141,30 +127,45 @@ class LaserWeapon(Weapon):
             return (self.owner.x, self.owner.y), (end_x, end_y)
         return None
 
-    def render(self, screen, camera):
+    def get_render_state(self):
+        """(x_anterior, y_anterior, x, y, ángulo, alcance, progreso) del rayo activo o None"""
         if self.draw_timer > 0:
-            start = camera.apply_coords(self.owner.x, self.owner.y)
-            
-            end_x = self.owner.x + math.cos(self.owner.angle) * self.max_range
-            end_y = self.owner.y + math.sin(self.owner.angle) * self.max_range
-            
-            jitter = 2
-            end_x += random.uniform(-jitter, jitter)
-            end_y += random.uniform(-jitter, jitter)
-            
-            end = camera.apply_coords(end_x, end_y)
-            
-            progress = self.draw_timer / self.duration
-            width = max(2, int(10 * progress))
-            
-            pygame.draw.line(screen, (0, 200, 255), start, end, width + 4)
-            pygame.draw.line(screen, (255, 255, 255), start, end, width)
+            owner = self.owner
+            return (owner.prev_x, owner.prev_y, owner.x, owner.y, owner.angle, self.max_range,
+                    self.draw_timer / self.duration)
+        return None
+
+    def render(self, screen, camera):
+        state = self.get_render_state()
+        if state:
+            render_laser(screen, state, camera)
+
+def render_laser(screen, state, camera, alpha=1.0):
+    """Dibuja el rayo a partir de LaserWeapon.get_render_state()"""
+    prev_x, prev_y, x, y, angle, max_range, progress = state
+    x = prev_x + (x - prev_x) * alpha
+    y = prev_y + (y - prev_y) * alpha
+    start = camera.apply_coords(x, y)
+    
+    end_x = x + math.cos(angle) * max_range
+    end_y = y + math.sin(angle) * max_range
+    
+    jitter = 2
+    end_x += random.uniform(-jitter, jitter)
+    end_y += random.uniform(-jitter, jitter)
+    
+    end = camera.apply_coords(end_x, end_y)
+    
+    width = max(2, int(10 * progress * camera.render_scale))
+    
+    pygame.draw.line(screen, (0, 200, 255), start, end, width + max(2, int(4 * camera.render_scale)))
+    pygame.draw.line(screen, (255, 255, 255), start, end, width)
 
 class AssaultRifleWeapon(Weapon):
     def __init__(self, owner):
         super().__init__(owner, cooldown=8, damage=20, kickback=0.5, shake=2.0, spread=0.05)
         self.max_spread = 0.35
-        self.shoot_sound = load_sound("rifle_fire.wav")
+        self.shoot_sound = "rifle_fire.wav"
 
     def activate(self, camera=None):
         if not self.projectile_pool: return False
@@ -1,5 +1,13 @@
+import time
 import pygame
+from settings import RENDER_FPS, FRAME_PACING, ALLOC_TRACKING
 from scenes.menu import MenuScene
+from managers.prewarmer import Prewarmer
+from utils.startup_profiler import PROFILER
+from utils.alloc_tracker import ALLOC_TRACKER
+from utils.frame_profiler import FRAME_PROFILER
+from utils.frame_scheduler import FrameScheduler
+from utils.latency_monitor import LatencyMonitor
 
 class Game:
     def __init__(self, surface):
@@ -9,21 +17,88 @@ class Game:
         self.render_scale = 1.0
         self.render_offset_x = 0
         self.render_offset_y = 0
+        # El presentador puede escalar la capa reducida del mundo directo a la ventana
+        self.world_layer_support = False
         
-        self.current_scene = MenuScene(self)
+        # Única fuente de dt y de ritmo de frames
+        self.scheduler = FrameScheduler(RENDER_FPS, FRAME_PACING)
+        self.latency = LatencyMonitor()
+        self.prewarm = Prewarmer(self)
+        if ALLOC_TRACKING:
+            ALLOC_TRACKER.enable()
+        
+        # Registro de escenas: una instancia por clase que se reutiliza
+        # (on_enter/on_exit reinician su estado en el sitio)
+        self.scenes = {}
+        self.current_scene = self.get_scene(MenuScene)
     
     def handle_events(self, event):
+        start = time.perf_counter()
         self.current_scene.handle_events(event)
+        self._check_transition(start)
     
     def update(self):
+        start = time.perf_counter()
         self.current_scene.update()
+        self._check_transition(start)
         
         if self.current_scene.next_scene:
-            self.current_scene = self.current_scene.next_scene
+            PROFILER.transition_step("preparación")
+            previous = self.current_scene
+            previous.on_exit()
+            PROFILER.transition_step("salida")
+            self.current_scene = previous.next_scene
+            previous.next_scene = None
             self.current_scene.on_enter()
+            PROFILER.transition_step("entrada")
+    
+    def get_scene(self, scene_class):
+        """Instancia registrada de la escena (se crea la primera vez)"""
+        scene = self.scenes.get(scene_class)
+        if scene is None:
+            scene = scene_class(self)
+            self.scenes[scene_class] = scene
+        return scene
+    
+    def register_scene(self, scene):
+        """Registra una escena ya construida (p. ej. por el precalentador)"""
+        self.scenes.setdefault(type(scene), scene)
+    
+    def _check_transition(self, start):
+        """La transición se mide desde que la escena pidió el cambio"""
+        next_scene = self.current_scene.next_scene
+        if next_scene is not None and PROFILER.transition is None:
+            PROFILER.begin_transition(
+                f"{type(self.current_scene).__name__} -> {type(next_scene).__name__}", start)
     
     def render(self):
         self.current_scene.render()
+    
+    def late_latch(self):
+        """Última oportunidad de la escena para usar input fresco antes de presentar"""
+        self.current_scene.late_latch()
+    
+    def get_dirty_rects(self):
+        """Regiones que cambiaron en el último render (None = frame completo)"""
+        return self.current_scene.get_dirty_rects()
+    
+    def get_world_layer(self):
+        """Capa del mundo sin componer del último render (ver Presenter.present)"""
+        return self.current_scene.get_world_layer()
+    
+    @property
+    def dt(self):
+        """dt del frame actual, normalizado a ticks de simulación (1.0 = 1/60 s)"""
+        return self.scheduler.dt
+    
+    def end_frame(self):
+        """Cierra el frame tras presentar: espera según el ritmo y mide el dt"""
+        self.latency.frame_presented()
+        PROFILER.first_frame_presented()
+        PROFILER.end_transition()
+        ALLOC_TRACKER.end_frame()
+        FRAME_PROFILER.end_frame()
+        return self.scheduler.tick(self.current_scene.is_idle())
         
     def set_render_params(self, scale, offset_x, offset_y):
         self.render_scale = scale
@@ -31,6 +106,7 @@ class Game:
         self.render_offset_y = offset_y
         
     def get_mouse_pos(self):
+        self.latency.mark_input()
         real_x, real_y = pygame.mouse.get_pos()
         virtual_x = real_x - self.render_offset_x
         virtual_y = real_y - self.render_offset_y
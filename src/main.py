@@ -1,29 +1,39 @@
 import pygame, sys, os
 from settings import *
+from utils.startup_profiler import PROFILER
 from game import Game
+from utils.surface_factory import create_surface
+from utils.presenter import Presenter
 
 def main():
+    PROFILER.mark("imports")
     os.environ['SDL_VIDEO_WINDOW_POS'] = "0,0"
     os.environ['SDL_VIDEO_CENTERED'] = '0'
 
     pygame.mixer.pre_init(44100, -16, 2, 512)
     pygame.init()
-    pygame.mixer.set_num_channels(32)
+    pygame.mixer.set_num_channels(AUDIO_CHANNELS)
+    PROFILER.mark("pygame.init")
 
     monitor_info = pygame.display.Info()
     monitor_w = monitor_info.current_w
     monitor_h = monitor_info.current_h
-    screen = pygame.display.set_mode((monitor_w, monitor_h), pygame.NOFRAME)
+    presenter = Presenter(PRESENT_BACKEND, vsync=(FRAME_PACING == 'vsync'))
+    presenter.set_mode((monitor_w, monitor_h), pygame.NOFRAME)
     pygame.display.set_caption(TITLE)
+    PROFILER.mark("display")
     
-    virtual_surface = pygame.Surface((BASE_WIDTH, BASE_HEIGHT))
+    # Superficie virtual ya en el formato del display (blit/escalado sin conversión)
+    virtual_surface = create_surface((BASE_WIDTH, BASE_HEIGHT))
+    presenter.set_source(virtual_surface)
     
-    clock = pygame.time.Clock()
     game = Game(virtual_surface)
+    game.scheduler.set_vsync_active(presenter.vsync_active)
+    game.world_layer_support = presenter.supports_world_layer
+    PROFILER.mark("game")
     
     running = True
     fullscreen = True
-    needs_rescale = True
 
     while running:
         for event in pygame.event.get():
@@ -32,47 +42,27 @@ def main():
             
             elif event.type == pygame.VIDEORESIZE:
                 if not fullscreen:
-                    screen = pygame.display.set_mode((event.w, event.h), pygame.RESIZABLE)
-                    needs_rescale = True
+                    presenter.set_mode((event.w, event.h), pygame.RESIZABLE)
             
             elif event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_F11:
                     fullscreen = not fullscreen
                     if fullscreen:
                         os.environ['SDL_VIDEO_WINDOW_POS'] = "0,0"
-                        screen = pygame.display.set_mode((monitor_w, monitor_h), pygame.NOFRAME)
+                        presenter.set_mode((monitor_w, monitor_h), pygame.NOFRAME)
                     else:
                         os.environ['SDL_VIDEO_CENTERED'] = '1'
-                        screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT), pygame.RESIZABLE)
-                    needs_rescale = True
+                        presenter.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT), pygame.RESIZABLE)
 
             game.handle_events(event)
 
         game.update()
         game.render() 
         
-        if needs_rescale:
-            current_w, current_h = screen.get_size()
-            
-            scale_w = current_w / BASE_WIDTH
-            scale_h = current_h / BASE_HEIGHT
-            scale = min(scale_w, scale_h)
-            
-            new_w = int(BASE_WIDTH * scale)
-            new_h = int(BASE_HEIGHT * scale)
-            
-            x_offset = (current_w - new_w) // 2
-            y_offset = (current_h - new_h) // 2
-            
-            game.set_render_params(scale, x_offset, y_offset)
-            needs_rescale = False
-        
-        screen.fill(BLACK) 
-        scaled_surface = pygame.transform.scale(virtual_surface, (int(BASE_WIDTH * game.render_scale), int(BASE_HEIGHT * game.render_scale)))
-        screen.blit(scaled_surface, (game.render_offset_x, game.render_offset_y))
-        
-        pygame.display.flip()
-        clock.tick(FPS)
+        game.set_render_params(*presenter.get_render_params())
+        game.late_latch()
+        presenter.present(game.get_dirty_rects(), game.get_world_layer())
+        game.end_frame()
 
     pygame.quit()
     sys.exit()
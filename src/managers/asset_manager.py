@@ -0,0 +1,151 @@
+"""
+Gestor de assets compartido por todo el proceso
+- Las rutas se resuelven (y se comprueba que existen) una sola vez
+- Los sonidos e imágenes del manifiesto se decodifican en un hilo de fondo
+  mientras se muestra el menú; al empezar una partida ya están en memoria
+- Se entregan instancias compartidas: quien las use NO debe modificarlas
+  (el volumen de un Sound es del objeto, no de cada reproducción)
+Las imágenes se decodifican en segundo plano pero se convierten al formato
+del display en el hilo principal, la primera vez que se piden.
+"""
+import os
+import threading
+import time
+import pygame
+from utils.surface_factory import to_display
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+ASSETS_DIR = os.path.join(PROJECT_ROOT, "assets")
+
+# Manifiesto de precarga
+SOUND_FILES = ("pistol_fire.wav", "shotgun_fire.wav", "rifle_fire.wav")
+IMAGE_FILES = ()
+
+SOUND_VOLUME = 0.2
+
+class AssetManager:
+    def __init__(self, root=ASSETS_DIR):
+        self.root = root
+        # (tipo, archivo) -> ruta absoluta o None si no existe
+        self.paths = {}
+        self.sounds = {}
+        self.images = {}
+        self.converted_images = {}
+        # (tipo, archivo) -> ms de carga
+        self.load_times = {}
+        self.sync_loads = 0
+        self.preload_ms = 0.0
+
+        # Un único candado: el hilo de fondo y el principal nunca cargan lo mismo dos veces
+        self.lock = threading.Lock()
+        self.thread = None
+
+    # --- RUTAS ---
+    def resolve_path(self, kind, filename):
+        key = (kind, filename)
+        if key in self.paths:
+            return self.paths[key]
+        path = os.path.join(self.root, kind, filename)
+        if not os.path.exists(path):
+            print(f"Error: El archivo no existe en: {path}")
+            path = None
+        self.paths[key] = path
+        return path
+
+    # --- PRECARGA ---
+    def start_preload(self):
+        """Empieza a decodificar el manifiesto en segundo plano (idempotente)"""
+        if self.thread is not None:
+            return
+        self.thread = threading.Thread(target=self._preload, name="asset-preload", daemon=True)
+        self.thread.start()
+
+    def _preload(self):
+        start = time.perf_counter()
+        for filename in SOUND_FILES:
+            self.get_sound(filename, background=True)
+        for filename in IMAGE_FILES:
+            self._get_raw_image(filename, background=True)
+        self.preload_ms = (time.perf_counter() - start) * 1000.0
+
+    def wait(self):
+        """Bloquea hasta que termine la precarga (si se inició)"""
+        if self.thread is not None:
+            self.thread.join()
+
+    def is_ready(self):
+        return self.thread is not None and not self.thread.is_alive()
+
+    # --- SONIDOS ---
+    def get_sound(self, filename, background=False):
+        """Sound compartido (o None si no existe o no se pudo decodificar)"""
+        sounds = self.sounds
+        if filename in sounds:
+            return sounds[filename]
+        with self.lock:
+            if filename not in sounds:
+                sounds[filename] = self._load(('sounds', filename), self._decode_sound, background)
+            return sounds[filename]
+
+    def _decode_sound(self, path):
+        sound = pygame.mixer.Sound(path)
+        sound.set_volume(SOUND_VOLUME)
+        return sound
+
+    # --- IMÁGENES ---
+    def get_image(self, filename):
+        """Superficie compartida en formato del display (solo hilo principal)"""
+        surface = self.converted_images.get(filename)
+        if surface is None:
+            raw = self._get_raw_image(filename)
+            if raw is None:
+                return None
+            surface = to_display(raw)
+            self.converted_images[filename] = surface
+        return surface
+
+    def _get_raw_image(self, filename, background=False):
+        images = self.images
+        if filename in images:
+            return images[filename]
+        with self.lock:
+            if filename not in images:
+                images[filename] = self._load(('images', filename), pygame.image.load, background)
+            return images[filename]
+
+    def _load(self, key, decode, background):
+        """Carga con el candado tomado; registra el tiempo y las cargas fuera de la precarga"""
+        path = self.resolve_path(*key)
+        if path is None:
+            return None
+        start = time.perf_counter()
+        try:
+            asset = decode(path)
+        except Exception as e:
+            print(f"Advertencia: No se pudo cargar {key[1]}. Error: {e}")
+            asset = None
+        self.load_times[key] = (time.perf_counter() - start) * 1000.0
+        if not background:
+            # Carga síncrona en el hilo que la pidió: la precarga no llegó a tiempo
+            self.sync_loads += 1
+        return asset
+
+    def get_debug_info(self):
+        return {
+            'loaded': len(self.load_times),
+            'load_ms': sum(self.load_times.values()),
+            'preload_ms': self.preload_ms,
+            'sync_loads': self.sync_loads,
+            'ready': self.is_ready(),
+        }
+
+
+ASSETS = AssetManager()
+
+def get_sound(filename):
+    """Atajo al gestor global: Sound compartido o None"""
+    return ASSETS.get_sound(filename)
+
+def get_image(filename):
+    """Atajo al gestor global: superficie compartida o None"""
+    return ASSETS.get_image(filename)
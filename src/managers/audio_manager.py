@@ -0,0 +1,150 @@
+"""
+Gestor de voces de audio sobre pygame.mixer
+Cada sonido tiene un perfil (máximo de voces simultáneas, prioridad e
+intervalo mínimo entre disparos). Al pedir una reproducción:
+1. Si el mismo sonido sonó hace menos del intervalo mínimo, se descarta
+2. Si ya tiene todas sus voces ocupadas, se roba la más antigua de ese sonido
+3. Si no queda canal libre, se roba la voz más antigua de menor o igual
+   prioridad; si todas son más importantes, se descarta
+Los canales gestionados quedan reservados: un Sound.play() suelto no los pisa.
+Se puede llamar desde el hilo de simulación (las armas disparan ahí).
+"""
+import threading
+import pygame
+from settings import AUDIO_CHANNELS
+from managers.asset_manager import ASSETS
+
+PRIORITY_AMBIENT = 0
+PRIORITY_EFFECT = 1
+PRIORITY_PLAYER = 2
+
+class SoundProfile:
+    __slots__ = ('max_voices', 'priority', 'min_interval_ms')
+
+    def __init__(self, max_voices=4, priority=PRIORITY_AMBIENT, min_interval_ms=0):
+        self.max_voices = max_voices
+        self.priority = priority
+        self.min_interval_ms = min_interval_ms
+
+# Archivo -> perfil (los que no estén usan DEFAULT_PROFILE)
+SOUND_PROFILES = {
+    "pistol_fire.wav": SoundProfile(max_voices=3, priority=PRIORITY_PLAYER, min_interval_ms=30),
+    "shotgun_fire.wav": SoundProfile(max_voices=2, priority=PRIORITY_PLAYER, min_interval_ms=60),
+    "rifle_fire.wav": SoundProfile(max_voices=3, priority=PRIORITY_PLAYER, min_interval_ms=40),
+}
+DEFAULT_PROFILE = SoundProfile()
+
+class AudioManager:
+    def __init__(self, num_channels=AUDIO_CHANNELS):
+        self.num_channels = num_channels
+        # Los canales se crean al primer uso (el mixer se inicia después de importar)
+        self.channels = None
+        # Por canal: (archivo, prioridad, inicio_ms) o None
+        self.voices = []
+        self.last_play = {}
+        self.lock = threading.Lock()
+
+        # Métricas para el overlay de debug
+        self.played = 0
+        self.stolen = 0
+        self.rate_limited = 0
+        self.rejected = 0
+
+    def _init_channels(self):
+        if not pygame.mixer.get_init():
+            return False
+        pygame.mixer.set_num_channels(self.num_channels)
+        pygame.mixer.set_reserved(self.num_channels)
+        self.channels = [pygame.mixer.Channel(i) for i in range(self.num_channels)]
+        self.voices = [None] * self.num_channels
+        return True
+
+    def play(self, filename):
+        """Reproduce un sonido respetando su perfil. Retorna el canal usado o None"""
+        with self.lock:
+            if self.channels is None and not self._init_channels():
+                return None
+            sound = ASSETS.get_sound(filename)
+            if sound is None:
+                return None
+            profile = SOUND_PROFILES.get(filename, DEFAULT_PROFILE)
+
+            now = pygame.time.get_ticks()
+            last = self.last_play.get(filename)
+            if last is not None and now - last < profile.min_interval_ms:
+                self.rate_limited += 1
+                return None
+
+            index = self._pick_channel(filename, profile)
+            if index is None:
+                self.rejected += 1
+                return None
+
+            channel = self.channels[index]
+            if self.voices[index] is not None:
+                channel.stop()
+                self.stolen += 1
+            channel.play(sound)
+            self.voices[index] = (filename, profile.priority, now)
+            self.last_play[filename] = now
+            self.played += 1
+            return channel
+
+    def _pick_channel(self, filename, profile):
+        """Índice del canal a usar (libre o robado) o None"""
+        channels = self.channels
+        voices = self.voices
+        free = None
+        own = 0
+        own_oldest = None
+        victim = None
+        for i, voice in enumerate(voices):
+            if voice is None or not channels[i].get_busy():
+                voices[i] = None
+                if free is None:
+                    free = i
+                continue
+            name, priority, start = voice
+            if name == filename:
+                own += 1
+                if own_oldest is None or start < voices[own_oldest][2]:
+                    own_oldest = i
+            if priority <= profile.priority:
+                # Menor prioridad primero; a igual prioridad, la más antigua
+                if (victim is None or priority < voices[victim][1]
+                        or (priority == voices[victim][1] and start < voices[victim][2])):
+                    victim = i
+
+        if own >= profile.max_voices:
+            return own_oldest
+        if free is not None:
+            return free
+        return victim
+
+    def stop_all(self):
+        with self.lock:
+            if self.channels is None:
+                return
+            for i, channel in enumerate(self.channels):
+                channel.stop()
+                self.voices[i] = None
+
+    def get_debug_info(self):
+        active = 0
+        if self.channels is not None and pygame.mixer.get_init():
+            active = sum(1 for channel in self.channels if channel.get_busy())
+        return {
+            'voices': active,
+            'channels': self.num_channels,
+            'played': self.played,
+            'stolen': self.stolen,
+            'rate_limited': self.rate_limited,
+            'rejected': self.rejected,
+        }
+
+
+AUDIO = AudioManager()
+
+def play_sound(filename):
+    """Atajo al gestor global"""
+    return AUDIO.play(filename)
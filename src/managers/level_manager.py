@@ -2,15 +2,24 @@
 Level Manager - Encapsula toda la lógica de simulación del gameplay
 Separa la lógica del juego de la presentación (Scene)
 """
-import pygame, math
-from settings import WORLD_WIDTH, WORLD_HEIGHT
-from entities.player import Player
+import pygame, math, time
+from fractions import Fraction
+from settings import (WORLD_WIDTH, WORLD_HEIGHT, BASE_WIDTH, BASE_HEIGHT, BLACK,
+                      DYNAMIC_RESOLUTION, RENDER_FPS)
+from entities.player import Player, render_player
+from entities.enemy import render_enemies
+from entities.projectile import render_projectiles
 from entities.particle import ParticleSystem
-from entities.weapon import LaserWeapon
+from entities.weapon import LaserWeapon, render_laser
 from utils.wave_manager import WaveManager
-from utils.camera import Camera
+from utils.camera import Camera, CameraView
 from utils.object_pool import ProjectilePool, ParticlePool
 from utils.spatial_grid import SpatialGrid
+from utils.quality_governor import QualityGovernor
+from utils.effect_coalescer import EffectCoalescer
+from utils.surface_factory import create_surface, to_display, register_cache
+from utils.resolution_scaler import ResolutionScaler
+from utils.render_snapshot import SnapshotBuffer
 
 class LevelManager:
     """
@@ -18,27 +27,77 @@ class LevelManager:
     - Entidades (Player, Enemies)
     - Sistemas (Particles, Weapons, Collisions)
     - Estado del juego (Score, Wave)
+    headless: nadie dibuja el nivel (simulaciones en lote); update se llama
+    con publish=False y la sangre estática se hornea en el propio paso.
     """
     
-    def __init__(self):
+    def __init__(self, headless=False):
+        self.headless = headless
         self.projectile_pool = ProjectilePool(initial_size=500)
         self.particle_pool = ParticlePool(capacity=800)
         self.spatial_grid = SpatialGrid(WORLD_WIDTH, WORLD_HEIGHT, cell_size=100)
+        self.projectile_grid = SpatialGrid(WORLD_WIDTH, WORLD_HEIGHT, cell_size=100)
         self.particle_system = ParticleSystem()
+        self.quality_governor = QualityGovernor()
+        self.effects = EffectCoalescer(self.particle_system)
         self.wave_manager = WaveManager()
         self.camera = Camera(WORLD_WIDTH, WORLD_HEIGHT)
         self.player = None
         self.enemies = []
         self.score = 0
         self.game_over = False
-        self.blood_surface = pygame.Surface((WORLD_WIDTH, WORLD_HEIGHT), pygame.SRCALPHA)
+        self.blood_surface = create_surface((WORLD_WIDTH, WORLD_HEIGHT), alpha=True)
         self.blood_surface.fill((0, 0, 0, 0))
+        
+        # Resolución dinámica: el mundo se dibuja a una fracción de BASE y se escala
+        self.resolution_scaler = ResolutionScaler(RENDER_FPS, enabled=DYNAMIC_RESOLUTION and not headless)
+        self.world_scale = 1.0
+        self.world_surface = None
+        # Copia reducida de la sangre por cada escala: la sangre nueva se hornea
+        # en todas y cambiar de escala no vuelve a escalar la capa completa
+        self.scaled_blood_surfaces = {}
+        if self.resolution_scaler.enabled:
+            for scale in ResolutionScaler.SCALES:
+                if scale < 1.0:
+                    self.scaled_blood_surfaces[scale] = create_surface(
+                        (int(WORLD_WIDTH * scale), int(WORLD_HEIGHT * scale)), alpha=True)
+        # Capa del mundo reducida que se entrega al presentador (None = ya compuesta a BASE)
+        self.world_layer = None
+        register_cache(self.convert_surfaces)
         self.ai_update_interval = 4
         self.frame_counter = 0
         self.hit_particle_cooldown = 0
         self.particles_rendered = 0
         self.enemies_rendered = 0
+        self.visible_enemies = []
+        self.visible_projectiles = []
+        self.enemy_cull_margin = 100
+        self.projectile_cull_margin = 50
+        self.bake_budget = None
+        self.render_detail = 2
+        
+        # El render solo lee instantáneas publicadas al final de cada update
+        self.snapshots = SnapshotBuffer()
+        self.render_view = CameraView()
         
+    def convert_surfaces(self):
+        """Reconvierte las capas del mundo al formato actual del display"""
+        self.blood_surface = to_display(self.blood_surface)
+        for scale, surface in self.scaled_blood_surfaces.items():
+            self.scaled_blood_surfaces[scale] = to_display(surface)
+        if self.world_surface is not None:
+            self.world_surface = to_display(self.world_surface, alpha=False)
+        self.world_layer = None
+    
+    def _set_world_scale(self, scale):
+        """Prepara la superficie interna para 'scale' (la sangre reducida ya existe)"""
+        self.world_scale = scale
+        self.world_layer = None
+        if scale == 1.0:
+            self.world_surface = None
+            return
+        self.world_surface = create_surface((int(BASE_WIDTH * scale), int(BASE_HEIGHT * scale)))
+    
     def initialize(self):
         """Inicializa o reinicia el nivel"""
 
@@ -51,15 +110,34 @@ class LevelManager:
         self.enemies.clear()
         self.projectile_pool.clear()
         self.particle_pool.clear()
+        self.spatial_grid.clear()
+        self.projectile_grid.clear()
+        self.visible_enemies.clear()
+        self.visible_projectiles.clear()
+        self.effects.clear()
         self.blood_surface.fill((0, 0, 0, 0))
+        for surface in self.scaled_blood_surfaces.values():
+            surface.fill((0, 0, 0, 0))
+        self.camera.reset()
+        self.resolution_scaler.reset()
+        self._set_world_scale(self.resolution_scaler.scale)
         self.score = 0
         self.game_over = False
         self.wave_manager.reset()
         self.wave_manager.start_wave()
         self.hit_particle_cooldown = 0
         self.frame_counter = 0
+        self.quality_governor.reset()
+        self._apply_quality_settings()
+        self.snapshots.clear()
+        self._publish_snapshot()
         
-    def update(self, dt, keys, mouse_pos, mouse_pressed):
+    def handle_event(self, event):
+        """Eventos de input de la simulación (en el hilo que corre update)"""
+        if self.player:
+            self.player.handle_event(event)
+    
+    def update(self, dt, keys, mouse_pos, mouse_pressed, publish=True):
         """
         Actualiza toda la lógica del nivel
         
@@ -68,18 +146,17 @@ class LevelManager:
             keys: pygame.key.get_pressed()
             mouse_pos: Posición virtual del mouse
             mouse_pressed: pygame.mouse.get_pressed()
+            publish: Publicar la instantánea de render al terminar. Con varios
+                ticks por frame solo el último la publica (las demás no se dibujarían)
         """
         if self.game_over or not self.player or not self.player.is_alive:
             self.game_over = True
             return
         
-        enemy_count = len(self.enemies)
-        if enemy_count < 50:
-            self.particle_system.set_quality(2)
-        elif enemy_count < 150:
-            self.particle_system.set_quality(1)
-        else:
-            self.particle_system.set_quality(0)
+        update_start = time.perf_counter()
+        
+        if self.quality_governor.update():
+            self._apply_quality_settings()
         
         self.player.handle_input(keys, dt)
         self.player.update_rotation(mouse_pos, (self.camera.offset_x, self.camera.offset_y))
@@ -110,24 +187,72 @@ class LevelManager:
         if new_enemy:
             self.enemies.append(new_enemy)
         
+        # Los efectos pedidos durante el frame se fusionan y emiten juntos
+        self.effects.flush()
         self.particle_pool.update_all(dt)
-        self.particle_pool.bake_static_blood(self.blood_surface)
         
         self.frame_counter += 1
+        if publish:
+            self._publish_snapshot()
+        elif self.headless:
+            # Sin render no hay instantánea que lleve la sangre: se hornea aquí mismo
+            self.particle_pool.bake_static_blood(self.blood_surface, self.bake_budget)
+        self.quality_governor.record_update((time.perf_counter() - update_start) * 1000.0)
+    
+    def _publish_snapshot(self):
+        """
+        Copia al buffer trasero todo lo que necesita el render y lo publica.
+        Los charcos estáticos salen del pool aquí y viajan en la instantánea
+        para hornearse en el hilo que dibuja (dueño de la capa de sangre).
+        """
+        snapshot = self.snapshots.begin_write()
+        self.particle_pool.collect_static_blood(snapshot.blood_bakes, self.bake_budget)
+        
+        snapshot.frame = self.frame_counter
+        snapshot.camera_prev_x = self.camera.prev_offset_x
+        snapshot.camera_prev_y = self.camera.prev_offset_y
+        snapshot.camera_x = self.camera.offset_x
+        snapshot.camera_y = self.camera.offset_y
+        
+        visible_enemies, visible_projectiles = self._collect_visible()
+        snapshot.enemies.extend([enemy.get_render_state() for enemy in visible_enemies])
+        snapshot.projectiles.extend([p.get_render_state() for p in visible_projectiles])
+        snapshot.show_health_bars = self.render_detail >= 2
+        
+        if self.player:
+            snapshot.player = self.player.get_render_state()
+            for weapon in self.player.weapons:
+                if isinstance(weapon, LaserWeapon):
+                    beam = weapon.get_render_state()
+                    if beam:
+                        snapshot.beams.append(beam)
+        
+        snapshot.particles_active = self.particle_pool.collect_render_states(
+            self.camera, snapshot.floor_particles, snapshot.air_particles)
+        
+        snapshot.wave = self.wave_manager.current_wave
+        snapshot.score = self.score
+        snapshot.wave_completed = self.wave_manager.is_wave_completed()
+        snapshot.wave_progress = self.wave_manager.get_completion_progress() if snapshot.wave_completed else 0.0
+        snapshot.enemies_total = len(self.enemies)
+        snapshot.projectiles_total = len(self.projectile_pool.active)
+        
+        self.snapshots.publish(snapshot)
+    
+    def _apply_quality_settings(self):
+        """Aplica los ajustes decididos por el QualityGovernor"""
+        settings = self.quality_governor.settings
+        self.particle_system.set_quality(settings['particle_quality'])
+        self.particle_system.set_burst_scale(settings['burst_scale'])
+        self.ai_update_interval = settings['ai_interval']
+        self.bake_budget = settings['bake_budget']
+        self.render_detail = settings['render_detail']
     
     def _update_enemies(self, dt):
         """Actualiza todos los enemigos con batching de IA"""
         player_pos = self.player.get_position()
 
-        # Ajuste dinámico del batching
-        enemy_count = len(self.enemies)
-        if enemy_count > 800:
-            self.ai_update_interval = 8
-        elif enemy_count > 400:
-            self.ai_update_interval = 6
-        else:
-            self.ai_update_interval = 4
-
+        # El intervalo de batching lo decide el QualityGovernor
         current_batch = self.frame_counter % self.ai_update_interval
         
         active_enemies = []
@@ -172,10 +297,12 @@ class LevelManager:
                             if enemy.rect.clipline(start, end):
                                 if enemy.take_damage(damage_this_frame):
                                     self.score += enemy.points
-                                    self.particle_system.create_viscera_explosion(enemy.x, enemy.y)
+                                    self.effects.request_viscera(enemy.x, enemy.y)
     
     def _update_projectiles(self, dt):
-        """Actualiza proyectiles y detecta colisiones"""
+        """Actualiza proyectiles, detecta colisiones y los indexa para el culling"""
+        self.projectile_grid.clear()
+        
         for projectile in self.projectile_pool.active[:]:
             projectile.update(dt)
             hit_enemy = projectile.check_collision_grid(self.spatial_grid)
@@ -190,99 +317,201 @@ class LevelManager:
                         inv_speed = 1.0 / math.sqrt(p_speed_sq)
                         direction = (projectile.vel_x * inv_speed, projectile.vel_y * inv_speed)
                     
-                    self.particle_system.create_blood_splatter(
+                    self.effects.request_splatter(
                         hit_enemy.x, hit_enemy.y,
                         direction_vector=direction,
                         force=1.5,
                         count=6
                     )
-                    self.hit_particle_cooldown = 1 if self.particle_system.quality == 2 else 4
+                    self.hit_particle_cooldown = self.quality_governor.settings['hit_cooldown']
                 
                 if hit_enemy.take_damage(projectile.damage):
                     self.score += hit_enemy.points
-                    self.particle_system.create_viscera_explosion(hit_enemy.x, hit_enemy.y)
+                    self.effects.request_viscera(hit_enemy.x, hit_enemy.y)
             
             if not projectile.is_alive:
                 self.projectile_pool.return_to_pool(projectile)
+            else:
+                self.projectile_grid.insert(projectile)
     
-    def render_world(self, screen):
+    def render_world(self, screen, snapshot, alpha=1.0, aim_pos=None, layered=False):
         """
-        Renderiza el mundo del juego (sin UI)
+        Renderiza el mundo del juego (sin UI) a partir de una instantánea
         
         Args:
             screen: Superficie de pygame donde renderizar
+            snapshot: RenderSnapshot tomada con self.snapshots.acquire()
+            alpha: Fracción entre el tick anterior y el de la instantánea (interpolación)
+            aim_pos: Posición virtual del mouse leída al dibujar; si se indica,
+                el jugador se orienta hacia ella y no hacia la del último tick
+            layered: El presentador escala la capa reducida directo a la ventana.
+                No se escala a BASE: queda en self.world_layer y la escena
+                compone con compose_world solo las zonas que tapa la UI
         """
-        self._render_grid(screen)
+        render_start = time.perf_counter()
         
-        bg_x = max(0, int(-self.camera.offset_x))
-        bg_y = max(0, int(-self.camera.offset_y))
-        from settings import WINDOW_WIDTH, WINDOW_HEIGHT
-        area_rect = pygame.Rect(bg_x, bg_y, WINDOW_WIDTH, WINDOW_HEIGHT)
-        screen.blit(self.blood_surface, (0, 0), area=area_rect)
+        scale = self.resolution_scaler.scale
+        if scale != self.world_scale:
+            self._set_world_scale(scale)
         
-        rendered_floor = self.particle_pool.render_all(screen, self.camera, layer='floor')
+        # La sangre que se retiró del pool en este paso se hornea una sola vez
+        if not snapshot.bakes_applied:
+            self.particle_pool.draw_static_blood(snapshot.blood_bakes, self.blood_surface,
+                                                 self.scaled_blood_surfaces)
+            snapshot.bakes_applied = True
         
-        for projectile in self.projectile_pool.active:
-            if self.camera.is_on_screen(projectile.rect):
-                projectile.render(screen, self.camera)
+        output = screen
+        if self.world_surface is not None:
+            # A resolución reducida se dibuja en la superficie interna
+            screen = self.world_surface
+            screen.fill(BLACK)
         
-        self.enemies_rendered = 0
-        render_margin = 200
+        view = self.render_view
+        view.offset_x = snapshot.camera_prev_x + (snapshot.camera_x - snapshot.camera_prev_x) * alpha
+        view.offset_y = snapshot.camera_prev_y + (snapshot.camera_y - snapshot.camera_prev_y) * alpha
+        view.render_scale = scale
         
-        for enemy in self.enemies:
-            expanded_rect = enemy.rect.inflate(render_margin * 2, render_margin * 2)
-            if self.camera.is_on_screen(expanded_rect):
-                enemy.render(screen, self.camera)
-                self.enemies_rendered += 1
+        if self.render_detail > 0:
+            self._render_grid(screen, view)
         
-        if self.player:
-            for weapon in self.player.weapons:
-                if hasattr(weapon, 'render'):
-                    weapon.render(screen, self.camera)
+        bg_x = max(0, int(-view.offset_x))
+        bg_y = max(0, int(-view.offset_y))
+        if scale != 1.0:
+            area_rect = pygame.Rect(int(bg_x * scale), int(bg_y * scale), *screen.get_size())
+            screen.blit(self.scaled_blood_surfaces[scale], (0, 0), area=area_rect)
+        else:
+            area_rect = pygame.Rect(bg_x, bg_y, *screen.get_size())
+            screen.blit(self.blood_surface, (0, 0), area=area_rect)
         
-        if self.player:
-            self.player.render(screen, self.camera)
+        rendered_floor = self.particle_pool.render_states(screen, snapshot.floor_particles, view)
+        
+        render_projectiles(screen, snapshot.projectiles, view, alpha)
+        
+        render_enemies(screen, snapshot.enemies, view, snapshot.show_health_bars, alpha)
+        self.enemies_rendered = len(snapshot.enemies)
+        
+        for beam in snapshot.beams:
+            render_laser(screen, beam, view, alpha)
+        
+        player = snapshot.player
+        if player:
+            if aim_pos is not None:
+                # Solo visual: la simulación aplicará la puntería en su próximo tick
+                px = player.prev_x + (player.x - player.prev_x) * alpha + view.offset_x
+                py = player.prev_y + (player.y - player.prev_y) * alpha + view.offset_y
+                player = player._replace(angle=math.atan2(aim_pos[1] - py, aim_pos[0] - px))
+            render_player(screen, player, view, alpha)
 
-        rendered_air = self.particle_pool.render_all(screen, self.camera, layer='air')
+        rendered_air = self.particle_pool.render_states(screen, snapshot.air_particles, view, alpha)
         self.particles_rendered = rendered_floor + rendered_air
+        
+        self.world_layer = None
+        if screen is not output:
+            if layered:
+                self.world_layer = screen
+            else:
+                # Escalado a BASE directamente sobre la superficie de salida (sin reservar memoria)
+                pygame.transform.scale(screen, output.get_size(), output)
+        
+        render_ms = (time.perf_counter() - render_start) * 1000.0
+        self.quality_governor.record_render(render_ms)
+        self.resolution_scaler.record_render(render_ms)
+    
+    def compose_world(self, output, rect):
+        """
+        Escala a BASE solo la región 'rect' de la capa reducida sobre 'output'
+        (debajo de un elemento de UI). El rect se agranda hasta coincidir con
+        pixeles enteros de la capa. Retorna el rect compuesto (o None si no hay capa).
+        """
+        layer = self.world_layer
+        if layer is None:
+            return None
+        scale = Fraction(self.world_scale).limit_denominator(100)
+        step = scale.denominator
+        rect = rect.clip(output.get_rect())
+        left = rect.left // step * step
+        top = rect.top // step * step
+        right = min(output.get_width(), -(-rect.right // step) * step)
+        bottom = min(output.get_height(), -(-rect.bottom // step) * step)
+        rect = pygame.Rect(left, top, right - left, bottom - top)
+        if not rect.width or not rect.height:
+            return None
+        source = pygame.Rect(int(left * scale), int(top * scale),
+                             int(right * scale) - int(left * scale), int(bottom * scale) - int(top * scale))
+        source = source.clip(layer.get_rect())
+        pygame.transform.scale(layer.subsurface(source), rect.size, output.subsurface(rect))
+        return rect
+    
+    def _collect_visible(self):
+        """
+        Culling por celdas: la vista de la cámara se convierte en un rango de
+        celdas UNA vez por frame y solo se consideran las entidades de esas celdas.
+        Retorna (enemigos_visibles, proyectiles_visibles) listos para dibujar.
+        """
+        visible_enemies = self.visible_enemies
+        visible_projectiles = self.visible_projectiles
+        visible_enemies.clear()
+        visible_projectiles.clear()
+        
+        left, top, right, bottom = self.camera.get_view_bounds(self.enemy_cull_margin)
+        for enemy in self.spatial_grid.query_bounds(left, top, right, bottom):
+            if enemy.is_alive and left <= enemy.x <= right and top <= enemy.y <= bottom:
+                visible_enemies.append(enemy)
+        
+        left, top, right, bottom = self.camera.get_view_bounds(self.projectile_cull_margin)
+        for projectile in self.projectile_grid.query_bounds(left, top, right, bottom):
+            if projectile.is_alive and left <= projectile.x <= right and top <= projectile.y <= bottom:
+                visible_projectiles.append(projectile)
+        
+        return visible_enemies, visible_projectiles
     
-    def _render_grid(self, screen):
-        """Renderiza el grid de fondo"""
-        from settings import WINDOW_WIDTH, WINDOW_HEIGHT
+    def _render_grid(self, screen, camera):
+        """Renderiza el grid de fondo (a la escala de la capa del mundo)"""
+        width, height = screen.get_size()
+        scale = camera.render_scale
         
         grid_size = 100
-        start_x = self.camera.offset_x % grid_size
-        start_y = self.camera.offset_y % grid_size
+        start_x = (camera.offset_x % grid_size) * scale
+        start_y = (camera.offset_y % grid_size) * scale
+        step = grid_size * scale
         grid_color = (30, 30, 30)
         
-        for x in range(int(start_x), WINDOW_WIDTH, grid_size):
-            pygame.draw.line(screen, grid_color, (x, 0), (x, WINDOW_HEIGHT))
-        for y in range(int(start_y), WINDOW_HEIGHT, grid_size):
-            pygame.draw.line(screen, grid_color, (0, y), (WINDOW_WIDTH, y))
-        
-        line_x = self.camera.offset_x
-        if 0 <= line_x <= WINDOW_WIDTH:
-            pygame.draw.line(screen, (100, 0, 0), (line_x, 0), (line_x, WINDOW_HEIGHT), 2)
-        line_x = self.camera.offset_x + WORLD_WIDTH
-        if 0 <= line_x <= WINDOW_WIDTH:
-            pygame.draw.line(screen, (100, 0, 0), (line_x, 0), (line_x, WINDOW_HEIGHT), 2)
-        line_y = self.camera.offset_y
-        if 0 <= line_y <= WINDOW_HEIGHT:
-            pygame.draw.line(screen, (100, 0, 0), (0, line_y), (WINDOW_WIDTH, line_y), 2)
-        line_y = self.camera.offset_y + WORLD_HEIGHT
-        if 0 <= line_y <= WINDOW_HEIGHT:
-            pygame.draw.line(screen, (100, 0, 0), (0, line_y), (WINDOW_WIDTH, line_y), 2)
+        x = start_x
+        while x < width:
+            pygame.draw.line(screen, grid_color, (int(x), 0), (int(x), height))
+            x += step
+        y = start_y
+        while y < height:
+            pygame.draw.line(screen, grid_color, (0, int(y)), (width, int(y)))
+            y += step
+        
+        line_x = camera.offset_x * scale
+        if 0 <= line_x <= width:
+            pygame.draw.line(screen, (100, 0, 0), (line_x, 0), (line_x, height), 2)
+        line_x = (camera.offset_x + WORLD_WIDTH) * scale
+        if 0 <= line_x <= width:
+            pygame.draw.line(screen, (100, 0, 0), (line_x, 0), (line_x, height), 2)
+        line_y = camera.offset_y * scale
+        if 0 <= line_y <= height:
+            pygame.draw.line(screen, (100, 0, 0), (0, line_y), (width, line_y), 2)
+        line_y = (camera.offset_y + WORLD_HEIGHT) * scale
+        if 0 <= line_y <= height:
+            pygame.draw.line(screen, (100, 0, 0), (0, line_y), (width, line_y), 2)
     
     def get_debug_info(self):
         """Retorna información para el debug overlay"""
-        active_particles = sum(1 for p in self.particle_pool.pool if p.is_alive)
+        # Los contadores salen de la última instantánea (seguro con la simulación en otro hilo)
+        snapshot = self.snapshots.peek()
         return {
-            'enemies_total': len(self.enemies),
+            'enemies_total': snapshot.enemies_total if snapshot else 0,
             'enemies_rendered': self.enemies_rendered,
-            'projectiles': len(self.projectile_pool.active),
-            'particles_active': active_particles,
+            'projectiles': snapshot.projectiles_total if snapshot else 0,
+            'particles_active': snapshot.particles_active if snapshot else 0,
             'particles_rendered': self.particles_rendered,
             'particles_capacity': self.particle_pool.capacity,
+            'quality': self.quality_governor.get_debug_info(),
+            'effects': self.effects.get_debug_info(),
+            'resolution': self.resolution_scaler.get_debug_info(),
         }
     
     def cleanup(self):
@@ -290,4 +519,8 @@ class LevelManager:
         self.enemies.clear()
         self.projectile_pool.clear()
         self.particle_pool.clear()
-        self.spatial_grid.clear()
\ No newline at end of file
+        self.spatial_grid.clear()
+        self.projectile_grid.clear()
+        self.visible_enemies.clear()
+        self.visible_projectiles.clear()
+        self.snapshots.clear()
\ No newline at end of file
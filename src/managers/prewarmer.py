@@ -0,0 +1,87 @@
+"""
+Precalentamiento de la partida mientras se muestra el menú (o el Game Over)
+La escena de juego se construye por etapas en el hilo principal, dentro de
+un presupuesto de tiempo por frame (las superficies de pygame se crean y
+convierten aquí, no en otro hilo):
+importar el módulo -> LevelManager (pools, cachés de partículas, capa de
+sangre) -> sprites de enemigos -> esperar la precarga de sonidos -> escena.
+Al pulsar "Iniciar" la escena ya está lista; si todavía no, se completan las
+etapas pendientes de golpe (lo mismo que costaba antes).
+La escena queda registrada en Game y se reutiliza en cada partida, así que
+el precalentamiento ocurre una sola vez.
+"""
+import importlib
+import time
+from settings import PREWARM_BUDGET_MS
+from managers.asset_manager import ASSETS
+from utils.startup_profiler import PROFILER
+
+class Prewarmer:
+    def __init__(self, game, budget_ms=PREWARM_BUDGET_MS):
+        self.game = game
+        self.budget_ms = budget_ms
+        self.stages = (
+            ("importar gameplay", self._import_gameplay),
+            ("nivel", self._build_level),
+            ("sprites de enemigos", self._build_enemy_sprites),
+            ("sonidos", self._wait_assets),
+            ("escena de juego", self._build_scene),
+        )
+        self.next_stage = 0
+        self.gameplay_module = None
+        self.level = None
+
+    def is_done(self):
+        return self.next_stage >= len(self.stages)
+
+    def step(self):
+        """Avanza etapas hasta agotar el presupuesto del frame (al menos una)"""
+        if PROFILER.startup_ms is None:
+            # No retrasar el primer frame del juego
+            return
+        start = time.perf_counter()
+        while not self.is_done():
+            if not self._run_stage(wait=False):
+                return
+            if (time.perf_counter() - start) * 1000.0 >= self.budget_ms:
+                return
+
+    def _run_stage(self, wait):
+        name, stage = self.stages[self.next_stage]
+        stage_start = time.perf_counter()
+        if stage(wait) is False:
+            # La etapa depende de algo que aún no terminó: se reintenta el próximo frame
+            return False
+        PROFILER.record_stage(name, (time.perf_counter() - stage_start) * 1000.0)
+        self.next_stage += 1
+        return True
+
+    def take_gameplay_scene(self):
+        """Escena de juego registrada (completa antes las etapas pendientes)"""
+        while not self.is_done():
+            self._run_stage(wait=True)
+        return self.game.get_scene(self.gameplay_module.GameplayScene)
+
+    # --- ETAPAS ---
+    def _import_gameplay(self, wait):
+        self.gameplay_module = importlib.import_module("scenes.gameplay")
+
+    def _build_level(self, wait):
+        from managers.level_manager import LevelManager
+        self.level = LevelManager()
+
+    def _build_enemy_sprites(self, wait):
+        # Crear un enemigo de cada tipo llena SPRITE_CACHE (normal + frames de flash)
+        from entities.enemy import Enemy
+        for enemy_type in Enemy.TYPES:
+            Enemy(0, 0, enemy_type=enemy_type)
+
+    def _wait_assets(self, wait):
+        if wait:
+            ASSETS.wait()
+            return True
+        return ASSETS.is_ready()
+
+    def _build_scene(self, wait):
+        self.game.register_scene(self.gameplay_module.GameplayScene(self.game, level=self.level))
+        self.level = None
@@ -0,0 +1,101 @@
+"""
+Simulación en un hilo de trabajo (opcional, ver THREADED_SIMULATION)
+El hilo principal entrega la entrada del frame N y, mientras el worker
+simula ese paso y publica su instantánea, dibuja la del frame N-1.
+Los pasos van en lockstep: antes de entregar el siguiente se espera al
+anterior, así la escena puede leer el estado del nivel sin carreras.
+Los blits y escalados de pygame liberan el GIL, por lo que en máquinas con
+varios núcleos ambas fases se solapan.
+"""
+import threading
+import time
+
+class SimulationThread:
+    def __init__(self, level):
+        self.level = level
+        self.condition = threading.Condition()
+        self.thread = None
+        self.running = False
+        self.pending = None
+        self.busy = False
+        self.error = None
+        # Eventos de input acumulados en el hilo principal hasta el próximo submit
+        self.events = []
+
+        # Métricas para el overlay de debug
+        self.step_ms = 0.0
+        self.wait_ms = 0.0
+
+    def start(self):
+        if self.thread is not None:
+            return
+        self.running = True
+        self.thread = threading.Thread(target=self._run, name="simulation", daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        """Termina el paso en curso y detiene el hilo"""
+        if self.thread is None:
+            return
+        with self.condition:
+            self.running = False
+            self.condition.notify_all()
+        self.thread.join()
+        self.thread = None
+        self.pending = None
+        self.busy = False
+        self.events = []
+
+    def queue_event(self, event):
+        """Guarda un evento para aplicarlo en el hilo de simulación"""
+        self.events.append(event)
+
+    def submit(self, dt, keys, mouse_pos, mouse_pressed, steps=1):
+        """Entrega la entrada del frame; los 'steps' pasos corren en segundo plano"""
+        with self.condition:
+            self.pending = (dt, keys, mouse_pos, mouse_pressed, self.events, steps)
+            self.events = []
+            self.busy = True
+            self.condition.notify_all()
+
+    def wait(self):
+        """Bloquea hasta que termine el paso entregado (re-lanza sus errores)"""
+        start = time.perf_counter()
+        with self.condition:
+            while self.busy:
+                self.condition.wait()
+        self.wait_ms = (time.perf_counter() - start) * 1000.0
+        if self.error is not None:
+            error, self.error = self.error, None
+            raise error
+
+    def _run(self):
+        level = self.level
+        while True:
+            with self.condition:
+                while self.running and self.pending is None:
+                    self.condition.wait()
+                if not self.running:
+                    return
+                dt, keys, mouse_pos, mouse_pressed, events, steps = self.pending
+                self.pending = None
+
+            start = time.perf_counter()
+            try:
+                for event in events:
+                    level.handle_event(event)
+                for step in range(steps):
+                    level.update(dt, keys, mouse_pos, mouse_pressed, publish=(step == steps - 1))
+            except Exception as e:
+                self.error = e
+            self.step_ms = (time.perf_counter() - start) * 1000.0
+
+            with self.condition:
+                self.busy = False
+                self.condition.notify_all()
+
+    def get_debug_info(self):
+        return {
+            'step_ms': self.step_ms,
+            'wait_ms': self.wait_ms,
+        }
@@ -4,80 +4,105 @@ Escena de Game Over
 import pygame
 from scenes.scene import Scene
 from settings import BLACK, WHITE, WINDOW_WIDTH, WINDOW_HEIGHT
+from utils.text_cache import render_text
 
 class GameOverScene(Scene):
-    def __init__(self, game, final_score, final_wave):
+    def __init__(self, game, final_score=0, final_wave=0, performance=None):
         super().__init__(game)
         self.final_score = final_score
         self.final_wave = final_wave
-        
-        self.font_big = pygame.font.Font(None, 84)
-        self.font_medium = pygame.font.Font(None, 48)
-        self.font_small = pygame.font.Font(None, 36)
+        # Resumen de rendimiento de la partida (Telemetry.get_summary) o None
+        self.performance = performance
         
         self.fade_alpha = 0
         self.fade_speed = 5
+        # Con el fundido completo el frame ya no cambia: no se redibuja ni se presenta
+        self.overlay_max_alpha = 180
+        self.static_drawn = False
+        self.dirty_rects = None
+    
+    def set_result(self, final_score, final_wave, performance=None):
+        """Resultado de la partida que se muestra (la instancia se reutiliza)"""
+        self.final_score = final_score
+        self.final_wave = final_wave
+        self.performance = performance
     
     def on_enter(self):
         """Reset de animación al entrar"""
         self.fade_alpha = 0
+        self.static_drawn = False
+    
+    def get_dirty_rects(self):
+        return self.dirty_rects
     
     def handle_events(self, event):
         if event.type == pygame.KEYDOWN:
             if event.key == pygame.K_SPACE:
                 from scenes.menu import MenuScene
-                self.next_scene = MenuScene(self.game)
+                self.next_scene = self.game.get_scene(MenuScene)
             elif event.key == pygame.K_r:
-                from scenes.gameplay import GameplayScene
-                self.next_scene = GameplayScene(self.game)
+                self.next_scene = self.game.prewarm.take_gameplay_scene()
+    
+    def is_idle(self):
+        """Terminado el fundido la pantalla es estática"""
+        return self.fade_alpha >= 255
     
     def update(self):
         if self.fade_alpha < 255:
             self.fade_alpha = min(255, self.fade_alpha + self.fade_speed)
+        # Prepara la revancha ('R') mientras se muestra la pantalla
+        if self.next_scene is None:
+            self.game.prewarm.step()
     
     def render(self):
+        if self.static_drawn:
+            self.dirty_rects = []
+            return
+        self.dirty_rects = None
+        self.static_drawn = self.fade_alpha >= self.overlay_max_alpha
+        
         self.screen.fill(BLACK)
         overlay = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, min(180, self.fade_alpha)))
+        overlay.fill((0, 0, 0, min(self.overlay_max_alpha, self.fade_alpha)))
         self.screen.blit(overlay, (0, 0))
         
         if self.fade_alpha < 100:
             return
         
-        shadow = self.font_big.render("GAME OVER", True, (100, 0, 0))
+        shadow = render_text("GAME OVER", 84, (100, 0, 0))
         shadow_rect = shadow.get_rect(center=(WINDOW_WIDTH//2 + 3, 153))
         self.screen.blit(shadow, shadow_rect)
         
-        game_over_text = self.font_big.render("GAME OVER", True, (255, 0, 0))
+        game_over_text = render_text("GAME OVER", 84, (255, 0, 0))
         go_rect = game_over_text.get_rect(center=(WINDOW_WIDTH//2, 150))
         self.screen.blit(game_over_text, go_rect)
         
         stats_y = 250
         
         # Puntuación
-        score_label = self.font_small.render("Puntuación Final", True, (150, 150, 150))
+        score_label = render_text("Puntuación Final", 36, (150, 150, 150))
         score_label_rect = score_label.get_rect(center=(WINDOW_WIDTH//2, stats_y))
         self.screen.blit(score_label, score_label_rect)
         
-        score_text = self.font_medium.render(f"{self.final_score:,}", True, WHITE)
+        score_text = render_text(f"{self.final_score:,}", 48, WHITE)
         score_rect = score_text.get_rect(center=(WINDOW_WIDTH//2, stats_y + 40))
         
         # Sombra del score
-        score_shadow = self.font_medium.render(f"{self.final_score:,}", True, BLACK)
+        score_shadow = render_text(f"{self.final_score:,}", 48, BLACK)
         shadow_rect = score_shadow.get_rect(center=(score_rect.centerx + 2, score_rect.centery + 2))
         self.screen.blit(score_shadow, shadow_rect)
         self.screen.blit(score_text, score_rect)
         
         # Oleada alcanzada
-        wave_label = self.font_small.render("Oleada Alcanzada", True, (150, 150, 150))
+        wave_label = render_text("Oleada Alcanzada", 36, (150, 150, 150))
         wave_label_rect = wave_label.get_rect(center=(WINDOW_WIDTH//2, stats_y + 90))
         self.screen.blit(wave_label, wave_label_rect)
         
-        wave_text = self.font_medium.render(str(self.final_wave), True, (255, 200, 0))
+        wave_text = render_text(str(self.final_wave), 48, (255, 200, 0))
         wave_rect = wave_text.get_rect(center=(WINDOW_WIDTH//2, stats_y + 130))
         
         # Sombra de la oleada
-        wave_shadow = self.font_medium.render(str(self.final_wave), True, BLACK)
+        wave_shadow = render_text(str(self.final_wave), 48, BLACK)
         shadow_rect = wave_shadow.get_rect(center=(wave_rect.centerx + 2, wave_rect.centery + 2))
         self.screen.blit(wave_shadow, shadow_rect)
         self.screen.blit(wave_text, wave_rect)
@@ -85,10 +110,19 @@ class GameOverScene(Scene):
         # Opciones
         options_y = stats_y + 200
         
-        restart_text = self.font_small.render("R - Reintentar", True, (200, 200, 200))
+        restart_text = render_text("R - Reintentar", 36, (200, 200, 200))
         restart_rect = restart_text.get_rect(center=(WINDOW_WIDTH//2, options_y))
         self.screen.blit(restart_text, restart_rect)
         
-        menu_text = self.font_small.render("ESPACIO - Menú Principal", True, (200, 200, 200))
+        menu_text = render_text("ESPACIO - Menú Principal", 36, (200, 200, 200))
         menu_rect = menu_text.get_rect(center=(WINDOW_WIDTH//2, options_y + 40))
-        self.screen.blit(menu_text, menu_rect)
\ No newline at end of file
+        self.screen.blit(menu_text, menu_rect)
+        
+        # Rendimiento de la partida
+        if self.performance:
+            perf = self.performance
+            perf_text = render_text(
+                f"Rendimiento: {perf['avg_fps']:.1f} FPS promedio | 1% bajo {perf['low_1_fps']:.1f} FPS | "
+                f"peor frame {perf['worst_ms']:.1f}ms", 24, (120, 120, 120))
+            perf_rect = perf_text.get_rect(center=(WINDOW_WIDTH//2, options_y + 120))
+            self.screen.blit(perf_text, perf_rect)
\ No newline at end of file
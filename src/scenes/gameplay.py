@@ -5,42 +5,99 @@ GameplayScene solo maneja UI, input y transiciones
 """
 import pygame
 import sys
+import os
 from scenes.scene import Scene
-from settings import WINDOW_WIDTH, WINDOW_HEIGHT, BLACK, WHITE
+from settings import (WINDOW_WIDTH, WINDOW_HEIGHT, BLACK, WHITE, THREADED_SIMULATION,
+                      RENDER_INTERPOLATION, LOW_LATENCY_INPUT, BOT_ENABLED, BOT_STRATEGY)
 from managers.level_manager import LevelManager
+from managers.asset_manager import ASSETS
+from managers.audio_manager import AUDIO
+from managers.simulation_thread import SimulationThread
 from ui.hud import HUD
 from ui.button import Button
+from utils.text_cache import render_text, get_font
+from utils.startup_profiler import PROFILER
+from utils.gc_policy import GC_POLICY
+from utils.alloc_tracker import ALLOC_TRACKER
+from utils.frame_profiler import FRAME_PROFILER
+from utils.telemetry import TELEMETRY
+from utils.bot_player import BotPlayer
 
 class GameplayScene(Scene):
-    def __init__(self, game):
+    def __init__(self, game, level=None):
         super().__init__(game)
-        self.level = LevelManager()
+        # El nivel puede venir ya construido por el precalentador
+        self.level = level if level is not None else LevelManager()
+        self.simulation = SimulationThread(self.level) if THREADED_SIMULATION else None
         self.hud = HUD(self.screen)
-        self.clock = pygame.time.Clock()
         self.dt = 1.0
-        self.target_fps = 60
+        # Paso fijo + interpolación: reloj de simulación en ticks y ticks ya programados
+        self.interpolate = RENDER_INTERPOLATION
+        self.sim_clock = 0.0
+        self.sim_steps = 0
+        self.max_steps_per_frame = 3
+        self.last_steps = 0
+        self.render_alpha = 1.0
+        # Baja latencia: el crosshair se dibuja con el mouse leído justo antes de presentar
+        self.low_latency = LOW_LATENCY_INPUT
+        # Bot: reemplaza la entrada del jugador (pruebas de carga)
+        self.bot = BotPlayer(BOT_STRATEGY)
+        self.bot_active = BOT_ENABLED
         self.paused = False
-        self.font_pause = pygame.font.Font(None, 80)
-        self.font_btn = pygame.font.Font(None, 36)
         cx, cy = WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2
-        self.btn_continue = Button(cx, cy + 20, 200, 50, "Continuar", self.font_btn)
-        self.btn_exit = Button(cx, cy + 90, 200, 50, "Salir del Juego", self.font_btn)
+        self.btn_continue = Button(cx, cy + 20, 200, 50, "Continuar", 36)
+        self.btn_exit = Button(cx, cy + 90, 200, 50, "Salir del Juego", 36)
         self.show_debug = False
         self.crosshair_scale = 1.0
         self.last_pulse_time = 0
+        self.wave_text_wave = None
+        self.wave_text_surf = None
+        # Pausa: el mundo queda congelado; solo se repintan botones y debug
+        self.pause_background = None
+        self.pause_hover = None
+        self.debug_rect = None
+        self.dirty_rects = None
+        # Resolución dinámica por capas: zonas de UI donde el mundo se compuso a BASE
+        self.overlay_rects = []
+        # El primer frame tras entrar mide la transición, no el gameplay
+        self.telemetry_warmup = True
+        # Contadores del GC ya registrados en la telemetría
+        self.gc_collections_seen = 0
+        self.gc_pause_seen = 0.0
     
     def on_enter(self):
-        """Inicializa el nivel al entrar a la escena"""
+        """Inicializa el nivel al entrar a la escena (reutiliza pools y superficies)"""
         pygame.mouse.set_visible(False)
         self.level.initialize()
+        self.hud.reset()
+        self.bot.reset()
+        GC_POLICY.begin_gameplay()
+        TELEMETRY.begin_run()
+        self.telemetry_warmup = True
+        self.gc_collections_seen = GC_POLICY.collections
+        self.gc_pause_seen = GC_POLICY.total_pause_ms
+        self.sim_clock = 0.0
+        self.sim_steps = 0
+        self.last_steps = 0
+        self.render_alpha = 1.0
+        self.last_pulse_time = 0
+        if self.simulation:
+            self.simulation.start()
         self.paused = False
         self.show_debug = False
         self.crosshair_scale = 1.0
+        self.pause_background = None
+        self.dirty_rects = None
     
     def on_exit(self):
         """Se llama cuando salimos de la escena (al Menú o Game Over)"""
+        if self.simulation:
+            self.simulation.stop()
         if self.level:
             self.level.cleanup()
+        AUDIO.stop_all()
+        GC_POLICY.end_gameplay()
+        TELEMETRY.end_run()
         pygame.mouse.set_visible(True)
     
     def handle_events(self, event):
@@ -59,14 +116,17 @@ class GameplayScene(Scene):
                 sys.exit()
             return
         
-        if self.level.player and not self.paused:
-            self.level.player.handle_event(event)
+        if self.simulation:
+            # Se aplica en el hilo de simulación al inicio del próximo paso
+            self.simulation.queue_event(event)
+        else:
+            self.level.handle_event(event)
         
         if event.type == pygame.KEYDOWN:
             if event.key == pygame.K_ESCAPE:
                 pygame.mouse.set_visible(True)
                 from scenes.menu import MenuScene
-                self.next_scene = MenuScene(self.game)
+                self.next_scene = self.game.get_scene(MenuScene)
             
             elif event.key == pygame.K_RETURN:
                 self.paused = not self.paused
@@ -74,11 +134,22 @@ class GameplayScene(Scene):
             
             elif event.key == pygame.K_F3:
                 self.show_debug = not self.show_debug
+            
+            elif event.key == pygame.K_F4:
+                ALLOC_TRACKER.toggle()
+            
+            elif event.key == pygame.K_F5:
+                FRAME_PROFILER.start(self._get_profile_tags())
+            
+            elif event.key == pygame.K_F6:
+                self.bot_active = not self.bot_active
     
     def update(self):
         """Actualiza la escena"""
-        raw_dt = self.clock.tick(self.target_fps) / (1000.0 / self.target_fps)
-        self.dt = min(raw_dt, 3.0)
+        if self.simulation:
+            # El paso anterior debe terminar antes de leer el estado del nivel
+            self.simulation.wait()
+        self.dt = self.game.dt
         
         if self.paused:
             mouse_pos = self.game.get_mouse_pos()
@@ -89,19 +160,98 @@ class GameplayScene(Scene):
         if self.level.game_over:
             pygame.mouse.set_visible(True)
             from scenes.game_over import GameOverScene
-            self.next_scene = GameOverScene(
-                self.game,
-                self.level.score,
-                self.level.wave_manager.current_wave
-            )
+            self.next_scene = self.game.get_scene(GameOverScene)
+            self.next_scene.set_result(self.level.score, self.level.wave_manager.current_wave,
+                                       TELEMETRY.get_summary())
             return
         
+        self._record_telemetry()
+        
+        # Con la simulación detenida: recolección entre oleadas, GC apagado durante ellas
+        GC_POLICY.update(self.level.wave_manager.wave_active)
+        
+        if self.low_latency:
+            # Estado del mouse al día justo antes de aplicar la puntería al tick
+            pygame.event.pump()
         keys = pygame.key.get_pressed()
         mouse_pos = self.game.get_mouse_pos()
         mouse_pressed = pygame.mouse.get_pressed()
         
-        self.level.update(self.dt, keys, mouse_pos, mouse_pressed)
-        self._update_crosshair(mouse_pressed)
+        if self.interpolate:
+            steps, step_dt = self._advance_sim_clock(), 1.0
+        else:
+            steps, step_dt = 1, self.dt
+        self.last_steps = steps
+        
+        if self.bot_active and steps:
+            # La simulación está detenida: el bot puede leer el nivel sin carreras
+            send_event = self.simulation.queue_event if self.simulation else self.level.handle_event
+            keys, mouse_pos, mouse_pressed = self.bot.control(self.level, send_event)
+        
+        if self.simulation:
+            self._update_crosshair(mouse_pressed)
+            if steps:
+                self.simulation.submit(step_dt, keys, mouse_pos, mouse_pressed, steps)
+        else:
+            for step in range(steps):
+                self.level.update(step_dt, keys, mouse_pos, mouse_pressed, publish=(step == steps - 1))
+            self._update_crosshair(mouse_pressed)
+    
+    def _advance_sim_clock(self):
+        """
+        Paso fijo: acumula el dt real (en ticks de 60 Hz) y retorna cuántos
+        ticks simular este frame. Lo que sobra es la fracción de interpolación.
+        """
+        self.sim_clock += self.dt
+        steps = int(self.sim_clock) - self.sim_steps
+        if steps > self.max_steps_per_frame:
+            # Sin espiral de la muerte: el tiempo que no se alcanza a simular se descarta
+            self.sim_clock -= steps - self.max_steps_per_frame
+            steps = self.max_steps_per_frame
+        self.sim_steps += steps
+        return steps
+    
+    def _get_render_alpha(self, snapshot):
+        """
+        Fracción entre el tick anterior y el de la instantánea. Con la simulación
+        en otro hilo la instantánea puede ir un paso atrás: se limita a 1.
+        """
+        if not self.interpolate:
+            return 1.0
+        return min(1.0, max(0.0, self.sim_clock - snapshot.frame))
+    
+    def _record_telemetry(self):
+        """Registra el frame anterior (tiempos del planificador + estado publicado)"""
+        snapshot = self.level.snapshots.peek()
+        if snapshot is None:
+            return
+        scheduler = self.game.scheduler
+        if self.telemetry_warmup or scheduler.idle:
+            # Su dt incluye la transición o la espera de la pausa: no es un frame de juego
+            self.telemetry_warmup = False
+            return
+        quality = self.level.quality_governor
+        gc_pause = GC_POLICY.total_pause_ms
+        TELEMETRY.record(
+            scheduler.dt_ms, scheduler.work_ms, scheduler.wait_ms,
+            quality.update_ms, quality.render_ms,
+            snapshot.enemies_total, snapshot.projectiles_total, snapshot.particles_active,
+            snapshot.wave, quality.level,
+            GC_POLICY.collections - self.gc_collections_seen, gc_pause - self.gc_pause_seen,
+        )
+        self.gc_collections_seen = GC_POLICY.collections
+        self.gc_pause_seen = gc_pause
+    
+    def _get_profile_tags(self):
+        """Contexto de la captura para el nombre de los archivos"""
+        level = self.level
+        quality = level.quality_governor.get_debug_info()
+        return (f"oleada{level.wave_manager.current_wave}_enemigos{len(level.enemies)}"
+                f"_q{quality['particle_quality']}")
+    
+    def is_idle(self):
+        """En pausa el mundo está congelado: basta con redibujar a baja frecuencia"""
+        return self.paused
     
     def _update_crosshair(self, mouse_pressed):
         """Actualiza la animación del crosshair"""
@@ -121,31 +271,101 @@ class GameplayScene(Scene):
         
         self.crosshair_scale += (1.0 - self.crosshair_scale) * 0.08 * self.dt
     
+    def get_dirty_rects(self):
+        return self.dirty_rects
+    
+    def get_world_layer(self):
+        """Capa reducida del mundo y las zonas con UI (el presentador la escala una vez)"""
+        layer = self.level.world_layer
+        if layer is None:
+            return None
+        return layer, self.overlay_rects
+    
+    def _compose_under(self, rect):
+        """Antes de dibujar UI en 'rect' sobre la capa reducida, compone ahí el mundo a BASE"""
+        composed = self.level.compose_world(self.screen, rect)
+        if composed is not None:
+            self.overlay_rects.append(composed)
+    
     def render(self):
         """Renderiza la escena completa"""
-        self.screen.fill(BLACK)
-        
-        self.level.render_world(self.screen)
+        if self.paused and self.pause_background is not None:
+            self._render_paused_frame()
+            return
+        self.pause_background = None
+        self.dirty_rects = None
+        self.overlay_rects.clear()
         
-        if self.hud and self.level.player:
-            self.hud.render(
-                self.level.player,
-                self.level.wave_manager.current_wave,
-                self.level.score,
-                len(self.level.enemies)
-            )
+        self.screen.fill(BLACK)
         
-        if self.level.wave_manager.is_wave_completed():
-            self._render_wave_transition()
+        # Solo se dibuja la última instantánea publicada por la simulación
+        snapshot = self.level.snapshots.acquire()
+        if snapshot is None:
+            return
+        try:
+            self.render_alpha = self._get_render_alpha(snapshot)
+            aim_pos = None
+            if self.low_latency and not self.paused:
+                pygame.event.pump()
+                aim_pos = self.game.get_mouse_pos()
+            # En pausa el menú tapa todo el frame: el mundo se compone completo
+            layered = self.game.world_layer_support and not self.paused
+            self.level.render_world(self.screen, snapshot, self.render_alpha, aim_pos, layered)
+            
+            if self.hud and snapshot.player:
+                for rect in self.hud.get_rects():
+                    self._compose_under(rect)
+                self.hud.render(
+                    snapshot.player,
+                    snapshot.wave,
+                    snapshot.score,
+                    snapshot.enemies_total
+                )
+            
+            if snapshot.wave_completed:
+                self._render_wave_transition(snapshot)
+        finally:
+            self.level.snapshots.release()
         
-        if not self.paused:
+        if not self.paused and not self.low_latency:
             self._render_crosshair()
         
         if self.paused:
             self._render_pause_menu()
         
         if self.show_debug:
-            self._render_debug_info()
+            self.debug_rect = self._render_debug_info()
+    
+    def late_latch(self):
+        """Modo de baja latencia: crosshair con la posición del mouse más reciente"""
+        if self.low_latency and not self.paused:
+            pygame.event.pump()
+            self._render_crosshair()
+    
+    def _render_paused_frame(self):
+        """
+        Pausa sobre el frame congelado: restaura desde la copia sin botones
+        solo lo que cambia (botones con hover distinto y el panel de debug)
+        """
+        dirty = []
+        hover = (self.btn_continue.is_hovered, self.btn_exit.is_hovered)
+        for button, hovered, drawn in zip((self.btn_continue, self.btn_exit), hover, self.pause_hover):
+            if hovered != drawn:
+                bounds = button.bounds
+                self.screen.blit(self.pause_background, bounds, bounds)
+                button.draw(self.screen)
+                dirty.append(bounds)
+        self.pause_hover = hover
+        
+        if self.debug_rect:
+            self.screen.blit(self.pause_background, self.debug_rect, self.debug_rect)
+            dirty.append(self.debug_rect)
+            self.debug_rect = None
+        if self.show_debug:
+            self.debug_rect = self._render_debug_info()
+            dirty.append(self.debug_rect)
+        
+        self.dirty_rects = dirty
     
     def _render_crosshair(self):
         """Renderiza el crosshair dinámico"""
@@ -157,6 +377,9 @@ class GameplayScene(Scene):
         current_gap = CROSSHAIR_GAP * self.crosshair_scale
         current_size = CROSSHAIR_SIZE * self.crosshair_scale
         
+        extent = int(current_gap + current_size) + CROSSHAIR_THICKNESS + CROSSHAIR_DOT_SIZE
+        self._compose_under(pygame.Rect(mx - extent, my - extent, extent * 2 + 1, extent * 2 + 1))
+        
         dot_rect = pygame.Rect(0, 0, CROSSHAIR_DOT_SIZE, CROSSHAIR_DOT_SIZE)
         dot_rect.center = (mx, my)
         pygame.draw.rect(self.screen, CROSSHAIR_COLOR, dot_rect)
@@ -181,22 +404,22 @@ class GameplayScene(Scene):
                          (mx + current_gap + current_size, my),
                          CROSSHAIR_THICKNESS)
     
-    def _render_wave_transition(self):
+    def _render_wave_transition(self, snapshot):
         """Renderiza la transición entre oleadas"""
-        progress = self.level.wave_manager.get_completion_progress()
+        progress = snapshot.wave_progress
         alpha = int(255 * (1 - abs(progress - 0.5) * 2))
         
-        surf = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT), pygame.SRCALPHA)
-        font = pygame.font.Font(None, 64)
+        # Copia propia del texto cacheado (una por oleada) para poder variar su alpha
+        completed_wave = snapshot.wave - 1
+        if completed_wave != self.wave_text_wave:
+            text = render_text(f"Oleada {completed_wave} Completada!", 64, (0, 255, 0))
+            self.wave_text_surf = text.copy()
+            self.wave_text_wave = completed_wave
         
-        text = font.render(
-            f"Oleada {self.level.wave_manager.current_wave - 1} Completada!",
-            True,
-            (0, 255, 0, alpha)
-        )
-        text_rect = text.get_rect(center=(WINDOW_WIDTH//2, WINDOW_HEIGHT//2))
-        surf.blit(text, text_rect)
-        self.screen.blit(surf, (0, 0))
+        self.wave_text_surf.set_alpha(alpha)
+        text_rect = self.wave_text_surf.get_rect(center=(WINDOW_WIDTH//2, WINDOW_HEIGHT//2))
+        self._compose_under(text_rect)
+        self.screen.blit(self.wave_text_surf, text_rect)
     
     def _render_pause_menu(self):
         """Renderiza el menú de pausa"""
@@ -204,32 +427,101 @@ class GameplayScene(Scene):
         overlay.fill((0, 0, 0, 180))
         self.screen.blit(overlay, (0, 0))
         
-        text = self.font_pause.render("PAUSA", True, WHITE)
+        text = render_text("PAUSA", 80, WHITE)
         rect = text.get_rect(center=(WINDOW_WIDTH//2, WINDOW_HEIGHT//2 - 80))
         self.screen.blit(text, rect)
         
+        # Copia del frame de pausa sin botones: base para los repintados parciales
+        self.pause_background = self.screen.copy()
+        self.pause_hover = (self.btn_continue.is_hovered, self.btn_exit.is_hovered)
+        
         self.btn_continue.draw(self.screen)
         self.btn_exit.draw(self.screen)
     
     def _render_debug_info(self):
-        """Renderiza información de debug"""
-        font = pygame.font.Font(None, 24)
-        fps = self.clock.get_fps()
-        dt_ms = self.dt * (1000.0 / self.target_fps)
+        """Renderiza información de debug. Retorna el área ocupada"""
+        frame = self.game.scheduler.get_debug_info()
         debug_info = self.level.get_debug_info()
+        quality = debug_info['quality']
+        effects = debug_info['effects']
+        resolution = debug_info['resolution']
         
         debug_texts = [
-            f"FPS: {fps:.1f} | DeltaTime: {dt_ms:.1f}ms",
+            f"FPS: {frame['fps']:.1f} | DeltaTime: {frame['dt_ms']:.1f}ms "
+            f"(Trabajo {frame['work_ms']:.1f} + Espera {frame['wait_ms']:.1f}) | Ritmo: {frame['mode']}",
             f"Enemigos: {debug_info['enemies_total']} (Visibles: {debug_info['enemies_rendered']})",
             f"Proyectiles: {debug_info['projectiles']}",
             f"Partículas: {debug_info['particles_active']} (Visibles: {debug_info['particles_rendered']}) / {debug_info['particles_capacity']}",
+            f"Calidad: {quality['level']}/{quality['max_level']} | Trabajo: {quality['avg_frame_ms']:.1f}ms "
+            f"(Upd {quality['update_ms']:.1f} + Rnd {quality['render_ms']:.1f} / {quality['budget_ms']:.1f})",
+            f"Part. Q{quality['particle_quality']} x{quality['burst_scale']:.1f} | Impacto CD {quality['hit_cooldown']} | "
+            f"IA 1/{quality['ai_interval']} | Bake {quality['bake_budget']} | Detalle {quality['render_detail']}",
+            f"Efectos: {effects['requests']} pedidos -> {effects['effects']} emitidos "
+            f"({effects['emitted']}/{effects['budget']} partículas)",
+            f"Resolución mundo: {resolution['scale'] * 100:.0f}% "
+            f"(Rnd {resolution['avg_render_ms']:.1f} / {resolution['budget_ms']:.1f}ms)"
+            + ("" if resolution['enabled'] else " [OFF]"),
             f"Pausa: {'SÍ' if self.paused else 'NO'}",
-            "F3: Toggle Debug"
         ]
-        y = 110
-        for text in debug_texts:
-            shadow = font.render(text, True, (0, 0, 0))
+        if self.interpolate:
+            debug_texts.append(f"Interpolación: alpha {self.render_alpha:.2f} | "
+                               f"ticks este frame {self.last_steps}")
+        assets = ASSETS.get_debug_info()
+        debug_texts.append(f"Assets: {assets['loaded']} en caché ({assets['load_ms']:.1f}ms, "
+                           f"precarga {assets['preload_ms']:.1f}ms) | cargas síncronas {assets['sync_loads']}")
+        audio = AUDIO.get_debug_info()
+        debug_texts.append(f"Audio: voces {audio['voices']}/{audio['channels']} | {audio['played']} reproducidos | "
+                           f"robados {audio['stolen']} | limitados {audio['rate_limited']} | "
+                           f"descartados {audio['rejected']}")
+        startup = PROFILER.get_debug_info()
+        transition = startup['last_transition']
+        debug_texts.append(f"Arranque: {startup['startup_ms']:.0f}ms hasta el primer frame | "
+                           f"precalentado {startup['stages_ms']:.0f}ms"
+                           + (f" | transición {transition['total_ms']:.1f}ms" if transition else ""))
+        collector = GC_POLICY.get_debug_info()
+        debug_texts.append(f"GC {collector['mode']}{' (oleada)' if collector['in_wave'] else ''}: "
+                           f"{collector['collections']} pausas | última {collector['last_ms']:.2f}ms "
+                           f"(gen {collector['last_generation']}) | máx {collector['max_ms']:.2f}ms | "
+                           f"congelados {collector['frozen']}")
+        allocations = ALLOC_TRACKER.get_debug_info()
+        if allocations['enabled']:
+            debug_texts.append(f"Asignaciones/frame: Surface {allocations['surfaces']:.1f} | "
+                               f"Rect {allocations['rects']:.1f} | Python pico {allocations['python_kb']:.1f}KB")
+            for kind, site, per_frame in allocations['sites']:
+                debug_texts.append(f"    {kind} x{per_frame:.1f} {site}")
+            for site, kb, count in allocations['growth']:
+                debug_texts.append(f"    retenido +{kb:.1f}KB ({count:+d}) {site}")
+        else:
+            debug_texts.append("Asignaciones: F4 para rastrear")
+        profiler = FRAME_PROFILER.get_debug_info()
+        if profiler['active']:
+            debug_texts.append(f"Perfil ({profiler['mode']}): grabando {profiler['frame']}/{profiler['frames']} frames"
+                               + (f" ({profiler['samples']} muestras)" if profiler['mode'] == 'sampler' else ""))
+        elif profiler['last_output']:
+            debug_texts.append(f"Perfil: {os.path.basename(profiler['last_output'])}")
+        latency = self.game.latency.get_debug_info()
+        debug_texts.append(f"Latencia entrada->pantalla: {latency['last_ms']:.1f}ms "
+                           f"(media {latency['avg_ms']:.1f} | máx {latency['max_ms']:.1f})"
+                           + (" [baja latencia]" if self.low_latency else ""))
+        if self.simulation:
+            simulation = self.simulation.get_debug_info()
+            debug_texts.append(f"Simulación en hilo: paso {simulation['step_ms']:.1f}ms | "
+                               f"espera {simulation['wait_ms']:.1f}ms")
+        if self.bot_active:
+            bot = self.bot.get_debug_info()
+            debug_texts.append(f"Bot: {bot['strategy']} | {bot['avg_ms']:.3f}ms/tick")
+        debug_texts.append("F3: Toggle Debug | F4: Asignaciones | F5: Perfil | F6: Bot")
+        # Texto que cambia cada frame: se renderiza directo, sin pasar por la
+        # caché LRU compartida (la vaciaría y echaría al HUD, botones y menú)
+        font = get_font(24)
+        lines = [(font.render(text, True, (0, 0, 0)), font.render(text, True, (0, 255, 0)))
+                 for text in debug_texts]
+        width = max(surf.get_width() for surf, _ in lines)
+        area = pygame.Rect(10, 110, width + 1, 25 * (len(lines) - 1) + lines[-1][0].get_height() + 1)
+        self._compose_under(area)
+        y = area.y
+        for shadow, surf in lines:
             self.screen.blit(shadow, (11, y + 1))
-            surf = font.render(text, True, (0, 255, 0))
             self.screen.blit(surf, (10, y))
-            y += 25
\ No newline at end of file
+            y += 25
+        return area
\ No newline at end of file
@@ -6,24 +6,67 @@ import math
 import sys
 from scenes.scene import Scene
 from ui.button import Button
+from utils.text_cache import render_text
+from managers.asset_manager import ASSETS
+from utils.surface_factory import create_surface, register_cache
 from settings import BLACK, WHITE, WINDOW_WIDTH, WINDOW_HEIGHT, CYAN, DARK_GRAY
 
 class MenuScene(Scene):
     def __init__(self, game):
         super().__init__(game)
-        self.font_title = pygame.font.Font(None, 90)
-        self.font_normal = pygame.font.Font(None, 36)
-        self.font_small = pygame.font.Font(None, 28)
-        self.clock = pygame.time.Clock()
         self.timer = 0
-        self.title_scale = 1.0
+        self.title_pulse = 0.0
+        self.title_steps = 4
         self.bg_scroll_x = 0
         self.bg_scroll_y = 0
-        self.bg_speed = 0.5
+        self.bg_speed = 0.03  # píxeles por ms (0.5 por frame a 60 FPS)
+        self.grid_size = 50
+
+        # Los assets de la partida se decodifican en segundo plano mientras tanto
+        ASSETS.start_preload()
 
         # BOTONES
-        self.btn_play = Button(WINDOW_WIDTH // 2, 340, 220, 50, "Iniciar Juego", self.font_normal)
-        self.btn_exit = Button(WINDOW_WIDTH // 2, 410, 220, 50, "Salir del Juego", self.font_normal)
+        self.btn_play = Button(WINDOW_WIDTH // 2, 340, 220, 50, "Iniciar Juego", 36)
+        self.btn_exit = Button(WINDOW_WIDTH // 2, 410, 220, 50, "Salir del Juego", 36)
+        self.buttons = (self.btn_play, self.btn_exit)
+
+        # Grid horneado una vez (una celda más grande que la pantalla): el
+        # desplazamiento es solo el origen del blit
+        self.grid_layer = None
+        register_cache(self.invalidate_layers)
+
+        # Panel de controles (fondo, borde y textos) preparado una sola vez
+        self.controls_rect = pygame.Rect(0, 500, 400, 150)
+        self.controls_rect.centerx = WINDOW_WIDTH // 2
+        self.controls_panel = None
+        self.controls_blits = None
+
+        # Elementos del frame: título (cambia con el pulso) y subtítulo
+        self.title_blits = []
+        self.title_rect = None
+        subtitle = render_text("Sobrevive a la horda", 28, (150, 150, 150))
+        self.subtitle = (subtitle, subtitle.get_rect(center=(WINDOW_WIDTH//2, 210)))
+
+        # Rectángulos sucios: el título (cuando cambia de paso), los botones
+        # que cambian de hover y las líneas del grid cuando se desplazan un píxel
+        self.dirty_rects = None
+        self.full_redraw = True
+        self.last_title_pulse = None
+        self.last_title_rect = None
+        self.last_grid_offset = None
+        self.last_hover = None
+    
+    def on_enter(self):
+        self.full_redraw = True
+    
+    def invalidate_layers(self):
+        """Cambió el formato del display: rehacer las capas horneadas"""
+        self.grid_layer = None
+        self.controls_panel = None
+        self.full_redraw = True
+    
+    def get_dirty_rects(self):
+        return self.dirty_rects
     
     def handle_events(self, event):
         mouse_pos = self.game.get_mouse_pos()
@@ -34,8 +77,7 @@ class MenuScene(Scene):
 
         # Clics en botones
         if self.btn_play.is_clicked(event):
-            from scenes.gameplay import GameplayScene
-            self.next_scene = GameplayScene(self.game)
+            self.next_scene = self.game.prewarm.take_gameplay_scene()
         
         if self.btn_exit.is_clicked(event):
             pygame.quit()
@@ -43,22 +85,23 @@ class MenuScene(Scene):
 
         if event.type == pygame.KEYDOWN:
             if event.key == pygame.K_SPACE:
-                from scenes.gameplay import GameplayScene
-                self.next_scene = GameplayScene(self.game)
+                self.next_scene = self.game.prewarm.take_gameplay_scene()
     
     def update(self):
-        # Limitamos a 60 FPS para consistencia en el menú
-        dt_ms = self.clock.tick(60)
-        dt = dt_ms / 16.0  # Normalizamos dt a ~1.0
-        
-        self.timer += 0.05 * dt
+        # Tiempo real (no dt): título y grid avanzan igual a cualquier ritmo de frames
+        ticks = pygame.time.get_ticks()
+        self.timer = ticks * 0.003
         
-        # Animación de escala usando SENO para suavidad (oscila entre 0.95 y 1.05)
-        self.title_scale = 1.0 + math.sin(self.timer) * 0.05
+        # Animación del título usando SENO para suavidad, en pasos de 1/title_steps
+        self.title_pulse = round(math.sin(self.timer) * self.title_steps) / self.title_steps
         
         # Desplazamiento del fondo
-        self.bg_scroll_x = (self.bg_scroll_x + self.bg_speed * dt) % 100
-        self.bg_scroll_y = (self.bg_scroll_y + self.bg_speed * dt) % 100
+        self.bg_scroll_x = (ticks * self.bg_speed) % 100
+        self.bg_scroll_y = (ticks * self.bg_speed) % 100
+        
+        # La escena de juego se va construyendo por etapas mientras se ve el menú
+        if self.next_scene is None:
+            self.game.prewarm.step()
 
         # Actualizar estado visual de los botones (hover)
         mouse_pos = self.game.get_mouse_pos()
@@ -66,80 +109,144 @@ class MenuScene(Scene):
         self.btn_exit.update(mouse_pos)
     
     def render(self):
-        self.screen.fill(BLACK)
+        if self.grid_layer is None:
+            self.grid_layer = self._build_grid_layer()
+        if self.controls_panel is None:
+            self._build_controls()
+        
+        # El grid se repite cada celda: solo importa el desplazamiento dentro de ella
+        grid_offset = (int(self.bg_scroll_x) % self.grid_size, int(self.bg_scroll_y) % self.grid_size)
+        hover = tuple(button.is_hovered for button in self.buttons)
+        title_changed = self.title_pulse != self.last_title_pulse
+        if title_changed or self.title_rect is None:
+            self._layout_title()
+        
+        if self.full_redraw:
+            self._paint(self.screen.get_rect(), grid_offset)
+            self.dirty_rects = None
+            self.full_redraw = False
+        else:
+            dirty = []
+            if title_changed:
+                dirty.append(self.title_rect.union(self.last_title_rect))
+            for button, hovered, was_hovered in zip(self.buttons, hover, self.last_hover):
+                if hovered != was_hovered:
+                    dirty.append(button.bounds)
+            if grid_offset != self.last_grid_offset:
+                dirty.extend(self._grid_line_rects(self.last_grid_offset))
+                dirty.extend(self._grid_line_rects(grid_offset))
+            # Cada región se repinta completa (todas las capas, recortadas a ella)
+            for rect in dirty:
+                self._paint(rect, grid_offset)
+            self.dirty_rects = dirty
+        
+        self.last_title_pulse = self.title_pulse
+        self.last_title_rect = self.title_rect
+        self.last_grid_offset = grid_offset
+        self.last_hover = hover
+
+    def _paint(self, rect, grid_offset):
+        """Dibuja dentro de 'rect' el grid, el título, el subtítulo, los botones y los controles"""
+        screen = self.screen
+        screen.set_clip(rect)
         
         # RENDERIZAR FONDO (Grid en movimiento)
-        self._render_background_grid()
+        screen.blit(self.grid_layer, rect, rect.move(grid_offset))
         
         # RENDERIZAR TÍTULO
+        if rect.colliderect(self.title_rect):
+            for surf, surf_rect in self.title_blits:
+                screen.blit(surf, surf_rect)
+        
+        # Subtítulo
+        subtitle, subtitle_rect = self.subtitle
+        if rect.colliderect(subtitle_rect):
+            screen.blit(subtitle, subtitle_rect)
+        
+        # RENDERIZAR BOTONES
+        for button in self.buttons:
+            if rect.colliderect(button.bounds):
+                button.draw(screen)
+        
+        # CONTROLES (Panel visual)
+        if rect.colliderect(self.controls_rect):
+            self._render_controls()
+        
+        screen.set_clip(None)
+
+    def _layout_title(self):
+        """Superficies y posiciones del título para el paso actual del pulso"""
         title_text = "ProyectSurvivor"
         
+        # El pulso se cuantiza en pocos pasos: tamaño y color se repiten y
+        # las superficies salen de la caché compartida en vez de rasterizarse
+        pulse = self.title_pulse
+        
         # Color cambiante sutil (Blanco a Cyan suave)
         r = 255
-        g = int(255 - (math.sin(self.timer) + 1) * 20) # 215-255
-        b = int(255 - (math.sin(self.timer) + 1) * 20)
+        g = int(255 - (pulse + 1) * 20) # 215-255
+        b = int(255 - (pulse + 1) * 20)
         title_color = (r, g, b)
 
-        # Escalado dinámico
-        current_font_size = int(90 * self.title_scale)
-        font_animated = pygame.font.Font(None, current_font_size)
+        # Escalado dinámico (oscila entre 0.95 y 1.05)
+        current_font_size = int(90 * (1.0 + pulse * 0.05))
         
         # Sombra del título (offset dinámico)
-        shadow_offset = 4 + int(math.sin(self.timer) * 2)
-        shadow = font_animated.render(title_text, True, (0, 100, 100)) # Sombra Cyan oscuro
+        shadow_offset = 4 + int(pulse * 2)
+        shadow = render_text(title_text, current_font_size, (0, 100, 100)) # Sombra Cyan oscuro
         shadow_rect = shadow.get_rect(center=(WINDOW_WIDTH//2 + shadow_offset, 150 + shadow_offset))
-        self.screen.blit(shadow, shadow_rect)
         
         # Texto principal
-        title = font_animated.render(title_text, True, title_color)
+        title = render_text(title_text, current_font_size, title_color)
         title_rect = title.get_rect(center=(WINDOW_WIDTH//2, 150))
-        self.screen.blit(title, title_rect)
-        
-        # Subtítulo
-        subtitle = self.font_small.render("Sobrevive a la horda", True, (150, 150, 150))
-        subtitle_rect = subtitle.get_rect(center=(WINDOW_WIDTH//2, 210))
-        self.screen.blit(subtitle, subtitle_rect)
-        
-        # RENDERIZAR BOTONES
-        self.btn_play.draw(self.screen)
-        self.btn_exit.draw(self.screen)
         
-        # CONTROLES (Panel visual)
-        self._render_controls()
+        self.title_blits = [(shadow, shadow_rect), (title, title_rect)]
+        self.title_rect = title_rect.union(shadow_rect)
 
-    def _render_background_grid(self):
-        """Dibuja una cuadrícula que se mueve lentamente"""
-        grid_size = 50
+    def _build_grid_layer(self):
+        """Cuadrícula de fondo con una celda de margen, en el formato del display"""
         color = (20, 20, 30)
+        grid_size = self.grid_size
+        width = WINDOW_WIDTH + grid_size
+        height = WINDOW_HEIGHT + grid_size
+        surface = create_surface((width, height))
+        surface.fill(BLACK)
         
-        for x in range(int(-grid_size), WINDOW_WIDTH + grid_size, grid_size):
-            draw_x = x - int(self.bg_scroll_x)
-            if 0 <= draw_x <= WINDOW_WIDTH:
-                pygame.draw.line(self.screen, color, (draw_x, 0), (draw_x, WINDOW_HEIGHT))
+        for draw_x in range(0, width + 1, grid_size):
+            pygame.draw.line(surface, color, (draw_x, 0), (draw_x, height))
                 
-        for y in range(int(-grid_size), WINDOW_HEIGHT + grid_size, grid_size):
-            draw_y = y - int(self.bg_scroll_y)
-            if 0 <= draw_y <= WINDOW_HEIGHT:
-                pygame.draw.line(self.screen, color, (0, draw_y), (WINDOW_WIDTH, draw_y))
+        for draw_y in range(0, height + 1, grid_size):
+            pygame.draw.line(surface, color, (0, draw_y), (width, draw_y))
+        return surface
 
-    def _render_controls(self):
-        """Renderiza la lista de controles en un recuadro limpio"""
-        panel_y = 500
-        panel_height = 150
-        panel_width = 400
-        panel_x = (WINDOW_WIDTH - panel_width) // 2
-        
-        s = pygame.Surface((panel_width, panel_height), pygame.SRCALPHA)
-        s.fill((30, 30, 35, 150))
-        self.screen.blit(s, (panel_x, panel_y))
+    def _grid_lines(self, grid_offset):
+        """Posiciones (x verticales, y horizontales) de las líneas del grid"""
+        grid_size = self.grid_size
+        offset_x, offset_y = grid_offset
+        xs = [x - offset_x for x in range(-grid_size, WINDOW_WIDTH + grid_size, grid_size)
+              if 0 <= x - offset_x <= WINDOW_WIDTH]
+        ys = [y - offset_y for y in range(-grid_size, WINDOW_HEIGHT + grid_size, grid_size)
+              if 0 <= y - offset_y <= WINDOW_HEIGHT]
+        return xs, ys
+
+    def _grid_line_rects(self, grid_offset):
+        xs, ys = self._grid_lines(grid_offset)
+        rects = [pygame.Rect(x, 0, 1, WINDOW_HEIGHT) for x in xs]
+        rects.extend(pygame.Rect(0, y, WINDOW_WIDTH, 1) for y in ys)
+        return rects
+
+    def _build_controls(self):
+        """Fondo semitransparente y textos del panel de controles"""
+        panel = self.controls_rect
+        self.controls_panel = create_surface(panel.size, alpha=True)
+        self.controls_panel.fill((30, 30, 35, 150))
         
-        # Borde decorativo
-        pygame.draw.rect(self.screen, (60, 60, 80), (panel_x, panel_y, panel_width, panel_height), 1)
+        # Borde decorativo (opaco, dentro del panel)
+        pygame.draw.rect(self.controls_panel, (60, 60, 80), self.controls_panel.get_rect(), 1)
         
         # Título Controles
-        controls_title = self.font_small.render("- CONTROLES -", True, CYAN)
-        rect = controls_title.get_rect(center=(WINDOW_WIDTH//2, panel_y + 20))
-        self.screen.blit(controls_title, rect)
+        controls_title = render_text("- CONTROLES -", 28, CYAN)
+        blits = [(controls_title, controls_title.get_rect(center=(WINDOW_WIDTH//2, panel.y + 20)))]
         
         controls = [
             ("WASD / Flechas", "Moverse"),
@@ -149,15 +256,23 @@ class MenuScene(Scene):
             ("H", "Curarse")
         ]
         
-        start_list_y = panel_y + 50
+        start_list_y = panel.y + 50
         for i, (key_text, action_text) in enumerate(controls):
             # Tecla (Izquierda, Color destacado)
-            k_surf = self.font_small.render(key_text, True, (200, 200, 200))
+            k_surf = render_text(key_text, 28, (200, 200, 200))
             k_rect = k_surf.get_rect(right=WINDOW_WIDTH//2 - 10, top=start_list_y + i * 20)
             
             # Acción (Derecha, Gris)
-            a_surf = self.font_small.render(action_text, True, (120, 120, 120))
+            a_surf = render_text(action_text, 28, (120, 120, 120))
             a_rect = a_surf.get_rect(left=WINDOW_WIDTH//2 + 10, top=start_list_y + i * 20)
             
-            self.screen.blit(k_surf, k_rect)
-            self.screen.blit(a_surf, a_rect)
\ No newline at end of file
+            blits.append((k_surf, k_rect))
+            blits.append((a_surf, a_rect))
+        self.controls_blits = blits
+
+    def _render_controls(self):
+        """Renderiza la lista de controles en un recuadro limpio"""
+        screen = self.screen
+        panel = self.controls_rect
+        screen.blit(self.controls_panel, panel.topleft)
+        screen.blits(self.controls_blits, doreturn=False)
@@ -21,6 +21,28 @@ class Scene:
         """Renderiza la escena"""
         pass
     
+    def late_latch(self):
+        """Se llama justo antes de presentar (modo de baja latencia)"""
+        pass
+    
+    def get_dirty_rects(self):
+        """
+        Regiones (coordenadas virtuales) que cambiaron en el último render.
+        None = frame completo; [] = nada cambió.
+        """
+        return None
+    
+    def get_world_layer(self):
+        """
+        (capa del mundo reducida, rects virtuales con UI) para que el presentador
+        la escale directo a la ventana; None = la superficie virtual está completa.
+        """
+        return None
+    
+    def is_idle(self):
+        """True si la escena puede redibujarse a baja frecuencia (pausa, pantallas estáticas)"""
+        return False
+    
     def on_enter(self):
         """Se llama cuando se entra a la escena"""
         pass
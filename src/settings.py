@@ -19,6 +19,61 @@ WORLD_HEIGHT = 1800
 FPS = 60
 TITLE = "ProyectSurvivor"
 
+# Presentación (ver utils/presenter.py): 'scale', 'integer', 'direct', 'sdl2', 'sdl2_software'
+PRESENT_BACKEND = 'scale'
+
+# Interpolación de render: la simulación avanza en ticks fijos de FPS (60 Hz)
+# y el render corre a RENDER_FPS (p. ej. 120/144/240) mezclando los dos últimos ticks
+RENDER_INTERPOLATION = True
+RENDER_FPS = FPS
+
+# Ritmo de frames (ver utils/frame_scheduler.py): 'sleep', 'hybrid', 'vsync'
+# 'hybrid' es más preciso pero termina cada frame con espera activa: solo si se necesita
+FRAME_PACING = 'sleep'
+# Tasa de redibujado cuando la escena está inactiva (pausa, pantallas estáticas)
+IDLE_FPS = 10
+
+# Modo de baja latencia: el mouse se vuelve a leer justo antes de presentar
+# para dibujar el crosshair y la orientación del jugador (ver scenes/gameplay.py)
+LOW_LATENCY_INPUT = False
+
+# Precalentamiento de la partida durante el menú (ms por frame, ver managers/prewarmer.py)
+PREWARM_BUDGET_MS = 8
+# Imprime en consola los hitos de arranque y las transiciones (ver utils/startup_profiler.py)
+PROFILE_STARTUP = False
+
+# Recolector de ciclos en la partida (ver utils/gc_policy.py): 'auto', 'thresholds', 'manual'
+GC_MODE = 'manual'
+
+# Rastreo de asignaciones por frame desde el arranque (también F4 en la partida, ver utils/alloc_tracker.py)
+ALLOC_TRACKING = False
+
+# Captura de perfil con F5 en la partida (ver utils/frame_profiler.py)
+# Un perfilador por captura: 'cprofile' (.pstats) o 'sampler' (pilas .collapsed cada PROFILE_SAMPLE_MS)
+PROFILE_FRAMES = 300
+PROFILE_DIR = "profiles"
+PROFILE_MODE = 'cprofile'
+PROFILE_SAMPLE_MS = 5.0
+
+# Bot para pruebas de carga (también F6 en la partida, ver utils/bot_player.py): 'idle', 'kite', 'laser_sweep'
+BOT_ENABLED = False
+BOT_STRATEGY = 'kite'
+
+# Telemetría por frame de cada partida (ver utils/telemetry.py y tools/perf_report.py)
+# TELEMETRY_DIR es relativo a la raíz del proyecto; solo se guardan las últimas TELEMETRY_KEEP partidas
+TELEMETRY_ENABLED = True
+TELEMETRY_DIR = "telemetry"
+TELEMETRY_KEEP = 20
+
+# Canales de audio gestionados por managers/audio_manager.py
+AUDIO_CHANNELS = 32
+
+# Simulación en un hilo aparte con instantáneas de render (ver managers/simulation_thread.py)
+THREADED_SIMULATION = False
+
+# Resolución dinámica del mundo (ver utils/resolution_scaler.py)
+DYNAMIC_RESOLUTION = True
+
 # Colores (RGB)
 BLACK = (0, 0, 0)
 WHITE = (255, 255, 255)
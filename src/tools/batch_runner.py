@@ -0,0 +1,237 @@
+"""
+Simulaciones headless en lote, repartidas en un pool de procesos
+Cada corrida es un LevelManager sin ventana ni audio, con un jugador
+controlado por utils/bot_player.py, su propia semilla y ajustes opcionales:
+    ENEMIES_PER_WAVE, estadísticas de Enemy.TYPES y de las armas.
+El QualityGovernor queda fijo en --quality (por defecto el máximo): con el
+nivel adaptativo, la carga de los otros procesos cambiaría la IA y las
+partículas y una misma semilla no daría siempre el mismo resultado.
+Los resultados (oleada alcanzada, costo del update por oleada, picos de
+entidades) se imprimen a medida que terminan las corridas y, con --out,
+se guardan como JSON por línea.
+Uso:
+    python src/tools/batch_runner.py --runs 200 [--workers 8] [--seed 1] [--strategy kite] [--quality 4]
+        [--config ajustes.json] [--max-waves 20] [--out resultados.jsonl]
+ajustes.json es un objeto (o una lista de objetos, uno por configuración):
+    {"name": "tanques duros", "ENEMIES_PER_WAVE": 8,
+     "enemy_types": {"tank": {"health": 400}},
+     "weapons": {"PistolWeapon": {"damage": 15, "cooldown": 20}}}
+"""
+import argparse
+import copy
+import json
+import math
+import os
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+# Sin ventana ni audio reales
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+os.environ['PYGAME_HIDE_SUPPORT_PROMPT'] = '1'
+
+# Ejecutado como script: los módulos del juego se importan desde src/
+SRC_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if SRC_DIR not in sys.path:
+    sys.path.insert(0, SRC_DIR)
+
+import utils.wave_manager as wave_manager
+from entities.enemy import Enemy
+from managers.level_manager import LevelManager
+from utils.bot_player import BotPlayer, STRATEGIES
+from utils.quality_governor import QualityGovernor
+
+# Estado de cada proceso del pool (se crea una vez y se reutiliza entre corridas)
+_worker = None
+
+class Worker:
+    """LevelManager y bot reutilizables, y valores originales para deshacer los ajustes de cada corrida"""
+    def __init__(self, strategy, quality):
+        self.default_enemies_per_wave = wave_manager.ENEMIES_PER_WAVE
+        self.default_enemy_types = copy.deepcopy(Enemy.TYPES)
+        self.level = LevelManager(headless=True)
+        # Nivel de calidad fijo (initialize() lo aplica en cada corrida)
+        self.level.quality_governor.fixed_level = quality
+        self.bot = BotPlayer(strategy)
+
+    def apply_config(self, config):
+        wave_manager.ENEMIES_PER_WAVE = config.get('ENEMIES_PER_WAVE', self.default_enemies_per_wave)
+        types = {name: dict(stats) for name, stats in self.default_enemy_types.items()}
+        for name, stats in config.get('enemy_types', {}).items():
+            if name not in types:
+                raise ValueError(f"Tipo de enemigo desconocido: {name}")
+            types[name].update(stats)
+        Enemy.TYPES = types
+
+    def apply_weapon_config(self, config):
+        """Las armas se crean con el jugador: se ajustan después de initialize()"""
+        overrides = config.get('weapons', {})
+        for weapon in self.level.player.weapons:
+            for attribute, value in overrides.get(type(weapon).__name__, {}).items():
+                if not hasattr(weapon, attribute):
+                    raise ValueError(f"{type(weapon).__name__} no tiene el atributo {attribute}")
+                setattr(weapon, attribute, value)
+
+
+def _init_worker(strategy, quality):
+    global _worker
+    _worker = Worker(strategy, quality)
+
+
+def percentile(sorted_values, p):
+    """Percentil por rango más cercano (sorted_values no vacío)"""
+    index = max(0, min(len(sorted_values) - 1, int(math.ceil(p / 100.0 * len(sorted_values))) - 1))
+    return sorted_values[index]
+
+
+def run_simulation(run_id, seed, config, max_waves, max_frames):
+    """Una corrida completa en el proceso actual. Retorna un dict serializable a JSON"""
+    worker = _worker
+    level = worker.level
+    random.seed(seed)
+    worker.apply_config(config)
+    level.initialize()
+    worker.apply_weapon_config(config)
+    bot = worker.bot
+    bot.reset()
+
+    waves = {}
+    frames = 0
+    start = time.perf_counter()
+    while not level.game_over and frames < max_frames:
+        wave = level.wave_manager.current_wave
+        if wave > max_waves:
+            break
+        keys, mouse_pos, mouse_pressed = bot.control(level, level.handle_event)
+
+        update_start = time.perf_counter()
+        # Nadie dibuja: sin instantáneas de render
+        level.update(1.0, keys, mouse_pos, mouse_pressed, publish=False)
+        update_ms = (time.perf_counter() - update_start) * 1000.0
+        frames += 1
+
+        stats = waves.get(wave)
+        if stats is None:
+            stats = waves[wave] = {'update_ms': [], 'enemies': 0, 'projectiles': 0, 'particles': 0}
+        stats['update_ms'].append(update_ms)
+        stats['enemies'] = max(stats['enemies'], len(level.enemies))
+        stats['projectiles'] = max(stats['projectiles'], len(level.projectile_pool.active))
+        stats['particles'] = max(stats['particles'], level.particle_pool.count_active())
+
+    per_wave = {}
+    for wave, stats in waves.items():
+        costs = sorted(stats['update_ms'])
+        per_wave[wave] = {
+            'frames': len(costs),
+            'update_avg_ms': sum(costs) / len(costs),
+            'update_p99_ms': percentile(costs, 99),
+            'update_max_ms': costs[-1],
+            'peak_enemies': stats['enemies'],
+            'peak_projectiles': stats['projectiles'],
+            'peak_particles': stats['particles'],
+        }
+
+    result = {
+        'run': run_id,
+        'seed': seed,
+        'config': config.get('name', ''),
+        'strategy': bot.strategy.name,
+        'quality': level.quality_governor.level,
+        'wave_reached': level.wave_manager.current_wave,
+        'died': level.game_over,
+        'score': level.score,
+        'frames': frames,
+        'wall_s': time.perf_counter() - start,
+        'bot_avg_ms': bot.get_debug_info()['avg_ms'],
+        'waves': per_wave,
+    }
+    level.cleanup()
+    return result
+
+
+def load_configs(path):
+    if path is None:
+        return [{}]
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    return data if isinstance(data, list) else [data]
+
+
+def print_summary(results):
+    """Agregado por configuración: oleada alcanzada y costo del update por oleada"""
+    by_config = {}
+    for result in results:
+        by_config.setdefault(result['config'], []).append(result)
+
+    for name, runs in sorted(by_config.items()):
+        reached = sorted(r['wave_reached'] for r in runs)
+        print(f"\nConfiguración '{name or 'base'}': {len(runs)} corridas | oleada media "
+              f"{sum(reached) / len(reached):.1f} | mediana {percentile(reached, 50)} | máx {reached[-1]} | "
+              f"bot {sum(r['bot_avg_ms'] for r in runs) / len(runs):.3f}ms/tick")
+        print(f"{'Oleada':>7} {'Corridas':>9} {'upd prom':>9} {'upd p99':>9} {'upd máx':>9} "
+              f"{'Enemigos':>9} {'Proyect.':>9} {'Partíc.':>9}")
+        waves = {}
+        for r in runs:
+            for wave, stats in r['waves'].items():
+                waves.setdefault(int(wave), []).append(stats)
+        for wave, stats in sorted(waves.items()):
+            frames = sum(s['frames'] for s in stats)
+            avg = sum(s['update_avg_ms'] * s['frames'] for s in stats) / frames
+            print(f"{wave:>7} {len(stats):>9} {avg:>9.2f} "
+                  f"{max(s['update_p99_ms'] for s in stats):>9.2f} "
+                  f"{max(s['update_max_ms'] for s in stats):>9.2f} "
+                  f"{max(s['peak_enemies'] for s in stats):>9} "
+                  f"{max(s['peak_projectiles'] for s in stats):>9} "
+                  f"{max(s['peak_particles'] for s in stats):>9}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Simulaciones headless en paralelo")
+    parser.add_argument("--runs", type=int, default=20, help="Corridas por configuración")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="Procesos del pool")
+    parser.add_argument("--seed", type=int, default=1, help="Semilla de la primera corrida")
+    parser.add_argument("--strategy", default='kite', choices=sorted(STRATEGIES), help="Estrategia del bot")
+    parser.add_argument("--quality", type=int, default=len(QualityGovernor.LEVELS) - 1,
+                        choices=range(len(QualityGovernor.LEVELS)), help="Nivel fijo del QualityGovernor")
+    parser.add_argument("--config", help="JSON con ajustes (objeto o lista de objetos)")
+    parser.add_argument("--max-waves", type=int, default=30, help="Detener al superar esta oleada")
+    parser.add_argument("--max-frames", type=int, default=60 * 60 * 20, help="Límite de ticks por corrida")
+    parser.add_argument("--out", help="Guardar cada resultado como una línea JSON")
+    args = parser.parse_args(argv)
+
+    configs = load_configs(args.config)
+    jobs = []
+    for config in configs:
+        for i in range(args.runs):
+            jobs.append((len(jobs), args.seed + i, config))
+
+    results = []
+    out = open(args.out, 'w', encoding='utf-8') if args.out else None
+    start = time.perf_counter()
+    try:
+        with ProcessPoolExecutor(max_workers=args.workers, initializer=_init_worker,
+                                 initargs=(args.strategy, args.quality)) as pool:
+            futures = [pool.submit(run_simulation, run_id, seed, config, args.max_waves, args.max_frames)
+                       for run_id, seed, config in jobs]
+            for future in as_completed(futures):
+                result = future.result()
+                results.append(result)
+                if out:
+                    out.write(json.dumps(result) + "\n")
+                    out.flush()
+                print(f"[{len(results)}/{len(jobs)}] corrida {result['run']} "
+                      f"({result['config'] or 'base'}, semilla {result['seed']}): "
+                      f"oleada {result['wave_reached']}, {result['frames']} ticks, "
+                      f"{result['wall_s']:.1f}s")
+    finally:
+        if out:
+            out.close()
+
+    print_summary(results)
+    print(f"\n{len(results)} corridas en {time.perf_counter() - start:.1f}s con {args.workers} procesos (bot '{args.strategy}', calidad {args.quality})")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
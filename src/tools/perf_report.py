@@ -0,0 +1,119 @@
+"""
+Informe offline de la telemetría de una partida (ver utils/telemetry.py)
+Uso:
+    python src/tools/perf_report.py telemetry/partida_XXXX.telemetry [--plots DIR]
+Imprime una tabla de percentiles por oleada y, si matplotlib está
+instalado, guarda un gráfico de tiempos de frame por oleada.
+"""
+import argparse
+import json
+import os
+import sys
+from array import array
+
+def load(path):
+    """Retorna (campos, lista de registros como dicts)"""
+    with open(path, 'rb') as f:
+        header = json.loads(f.readline().decode('utf-8'))
+        data = array('d')
+        data.frombytes(f.read())
+    if header['byteorder'] != sys.byteorder:
+        data.byteswap()
+    fields = header['fields']
+    width = len(fields)
+    count = len(data) // width
+    records = [dict(zip(fields, data[i * width:(i + 1) * width])) for i in range(count)]
+    return fields, records
+
+def percentile(sorted_values, p):
+    """Percentil por rango más cercano (sorted_values no vacío)"""
+    index = max(0, min(len(sorted_values) - 1, int(round(p / 100.0 * len(sorted_values) + 0.5)) - 1))
+    return sorted_values[index]
+
+def summarize(records):
+    dt = sorted(r['dt_ms'] for r in records)
+    work = sorted(r['work_ms'] for r in records)
+    total_ms = sum(dt)
+    return {
+        'frames': len(records),
+        'fps': 1000.0 * len(records) / total_ms if total_ms else 0.0,
+        'dt_p50': percentile(dt, 50),
+        'dt_p90': percentile(dt, 90),
+        'dt_p99': percentile(dt, 99),
+        'dt_max': dt[-1],
+        'work_p50': percentile(work, 50),
+        'work_p99': percentile(work, 99),
+        'enemies': sum(r['enemies'] for r in records) / len(records),
+        'particles_max': max(r['particles'] for r in records),
+        'gc_ms': sum(r['gc_pause_ms'] for r in records),
+    }
+
+def group_by_wave(records):
+    waves = {}
+    for record in records:
+        waves.setdefault(int(record['wave']), []).append(record)
+    return waves
+
+def print_table(waves, records):
+    columns = ("Oleada", "Frames", "FPS", "dt p50", "dt p90", "dt p99", "dt máx",
+               "trab p50", "trab p99", "Enemigos", "Part. máx", "GC ms")
+    print(" ".join(f"{c:>9}" for c in columns))
+    rows = [(str(wave), summarize(rs)) for wave, rs in sorted(waves.items())]
+    rows.append(("Total", summarize(records)))
+    for name, s in rows:
+        print(f"{name:>9} {s['frames']:>9} {s['fps']:>9.1f} {s['dt_p50']:>9.2f} {s['dt_p90']:>9.2f} "
+              f"{s['dt_p99']:>9.2f} {s['dt_max']:>9.2f} {s['work_p50']:>9.2f} {s['work_p99']:>9.2f} "
+              f"{s['enemies']:>9.1f} {s['particles_max']:>9.0f} {s['gc_ms']:>9.2f}")
+
+def save_plots(waves, output_dir, base_name):
+    try:
+        import matplotlib
+        matplotlib.use("Agg")
+        import matplotlib.pyplot as plt
+    except ImportError:
+        print("matplotlib no está instalado: se omiten los gráficos")
+        return []
+
+    os.makedirs(output_dir, exist_ok=True)
+    paths = []
+    for wave, records in sorted(waves.items()):
+        fig, ax = plt.subplots(figsize=(10, 3))
+        times = [r['time_s'] for r in records]
+        ax.plot(times, [r['dt_ms'] for r in records], linewidth=0.8, label="dt")
+        ax.plot(times, [r['work_ms'] for r in records], linewidth=0.8, label="trabajo")
+        gc_times = [r['time_s'] for r in records if r['gc_collections'] > 0]
+        if gc_times:
+            ax.vlines(gc_times, 0, max(r['dt_ms'] for r in records), colors="red",
+                      linewidth=0.5, alpha=0.5, label="GC")
+        ax.set_title(f"Oleada {wave}")
+        ax.set_xlabel("tiempo (s)")
+        ax.set_ylabel("ms")
+        ax.legend(loc="upper right")
+        fig.tight_layout()
+        path = os.path.join(output_dir, f"{base_name}_oleada{wave}.png")
+        fig.savefig(path, dpi=100)
+        plt.close(fig)
+        paths.append(path)
+    return paths
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Informe de rendimiento de una partida")
+    parser.add_argument("path", help="Archivo .telemetry")
+    parser.add_argument("--plots", metavar="DIR", help="Carpeta donde guardar los gráficos por oleada")
+    args = parser.parse_args(argv)
+
+    _, records = load(args.path)
+    if not records:
+        print("La telemetría no tiene frames")
+        return 1
+    waves = group_by_wave(records)
+    print_table(waves, records)
+
+    if args.plots:
+        base_name = os.path.splitext(os.path.basename(args.path))[0]
+        for path in save_plots(waves, args.plots, base_name):
+            print(f"Gráfico: {path}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
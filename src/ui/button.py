@@ -1,8 +1,10 @@
 import pygame
 from settings import WHITE, BLACK, GRAY
+from utils.text_cache import render_text
+from utils.surface_factory import create_surface, register_cache
 
 class Button:
-    def __init__(self, x, y, width, height, text, font, 
+    def __init__(self, x, y, width, height, text, font_size=36, 
                  text_color=WHITE, 
                  button_color=(40, 40, 50), 
                  hover_color=(70, 70, 90), 
@@ -13,37 +15,62 @@ class Button:
         self.rect.center = (x, y)
         
         self.text = text
-        self.font = font
+        self.font_size = font_size
         self.text_color = text_color
         self.button_color = button_color
         self.hover_color = hover_color
         self.border_color = border_color
         self.is_hovered = False
 
+        # Botón ya dibujado por estado de hover (se crea la primera vez que se usa)
+        self.surfaces = {}
+        register_cache(self.convert_surfaces)
+
+    def convert_surfaces(self):
+        """Cambió el formato del display: se vuelven a dibujar al usarse"""
+        self.surfaces.clear()
+
+    @property
+    def bounds(self):
+        """Área que ocupa el botón dibujado (incluye la sombra)"""
+        return self.rect.union(self.rect.move(4, 4))
+
     def update(self, mouse_pos):
         """Actualiza el estado de hover basado en la posición del mouse (virtual)"""
         self.is_hovered = self.rect.collidepoint(mouse_pos)
 
-    def draw(self, screen):
-        """Renderiza el botón en la pantalla"""
-        color = self.hover_color if self.is_hovered else self.button_color
+    def draw(self, screen, hovered=None):
+        """Renderiza el botón en la pantalla (hovered fuerza el estado; None = el actual)"""
+        if hovered is None:
+            hovered = self.is_hovered
+        surf = self.surfaces.get(hovered)
+        if surf is None:
+            surf = self._build_surface(hovered)
+            self.surfaces[hovered] = surf
+        screen.blit(surf, self.rect.topleft)
+
+    def _build_surface(self, hovered):
+        """Sombra, fondo, borde y texto en una superficie del tamaño de bounds"""
+        color = self.hover_color if hovered else self.button_color
+        surf = create_surface(self.bounds.size, alpha=True)
+        surf.fill((0, 0, 0, 0))
+        rect = pygame.Rect(0, 0, self.rect.width, self.rect.height)
         
         # Sombra (offset)
-        shadow_rect = self.rect.copy()
-        shadow_rect.x += 4
-        shadow_rect.y += 4
-        pygame.draw.rect(screen, (20, 20, 20), shadow_rect, border_radius=12)
+        shadow_rect = rect.move(4, 4)
+        pygame.draw.rect(surf, (20, 20, 20), shadow_rect, border_radius=12)
         
         # Fondo
-        pygame.draw.rect(screen, color, self.rect, border_radius=12)
+        pygame.draw.rect(surf, color, rect, border_radius=12)
         
         # Borde
-        pygame.draw.rect(screen, self.border_color, self.rect, 2, border_radius=12)
+        pygame.draw.rect(surf, self.border_color, rect, 2, border_radius=12)
         
         # Texto
-        text_surf = self.font.render(self.text, True, self.text_color)
-        text_rect = text_surf.get_rect(center=self.rect.center)
-        screen.blit(text_surf, text_rect)
+        text_surf = render_text(self.text, self.font_size, self.text_color)
+        text_rect = text_surf.get_rect(center=rect.center)
+        surf.blit(text_surf, text_rect)
+        return surf
 
     def is_clicked(self, event):
         """Detecta si se hizo clic en el botón"""
@@ -1,62 +1,164 @@
 """
 HUD - Heads Up Display mejorado y profesional
+Modo retenido: el marco de los paneles se hornea una vez y cada elemento
+de texto solo se vuelve a renderizar cuando cambia su valor.
 """
 import pygame
 from settings import WHITE, RED, GREEN, GRAY, BLACK, YELLOW, CYAN
+from utils.text_cache import get_font
+from utils.surface_factory import create_surface, register_cache
 
 class HUD:
     def __init__(self, screen):
         self.screen = screen
-        self.font = pygame.font.Font(None, 32)
-        self.font_medium = pygame.font.Font(None, 28)
-        self.font_small = pygame.font.Font(None, 24)
-        self.font_tiny = pygame.font.Font(None, 20)
-        
+        self.font = get_font(32)
+        self.font_medium = get_font(28)
+        self.font_small = get_font(24)
+        self.font_tiny = get_font(20)
+
         # Animaciones
         self.score_display = 0
         self.score_lerp_speed = 0.15
-        
+
+        # Geometría de los paneles
+        self.player_panel_rect = pygame.Rect(15, 15, 250, 80)
+        self.stats_panel_rect = pygame.Rect(0, 15, 220, 110)
+        self.stats_panel_rect.right = self.screen.get_width() - 15
+
+        # Barra de vida (coordenadas de pantalla)
+        self.bar_rect = pygame.Rect(self.player_panel_rect.x + 10, self.player_panel_rect.y + 32,
+                                    self.player_panel_rect.width - 20, 24)
+
+        # Marcos estáticos horneados una sola vez
+        self.player_panel = self._build_player_panel()
+        self.stats_panel = self._build_stats_panel()
+
+        # Glifos de dígitos para el contador de puntos animado
+        self.digit_glyphs = {ch: self.font_medium.render(ch, True, WHITE) for ch in "0123456789,"}
+        self.digit_widths = {ch: glyph.get_width() for ch, glyph in self.digit_glyphs.items()}
+
+        self.reset_cache()
+        register_cache(self.convert_surfaces)
+
+    def convert_surfaces(self):
+        """Rehace los marcos (ya en formato del display) y descarta los dinámicos"""
+        self.player_panel = self._build_player_panel()
+        self.stats_panel = self._build_stats_panel()
+        self.reset_cache()
+
+    def reset(self):
+        """Nueva partida: sin animación de puntos pendiente"""
+        self.score_display = 0
+        self.reset_cache()
+
+    def reset_cache(self):
+        """Invalida los elementos dinámicos (se regeneran en el próximo render)"""
+        self._health_key = None
+        self._health_surf = None
+        self._dash_key = None
+        self._dash_surf = None
+        self._wave_key = None
+        self._wave_surf = None
+        self._score_key = None
+        self._score_blits = []
+        self._enemies_key = None
+        self._enemies_surf = None
+
+    def _build_panel(self, width, height):
+        panel_surf = create_surface((width, height), alpha=True)
+        panel_surf.fill((0, 0, 0, 0))
+        pygame.draw.rect(panel_surf, (20, 20, 30, 200), (0, 0, width, height), border_radius=10)
+        pygame.draw.rect(panel_surf, (60, 60, 80, 255), (0, 0, width, height), 2, border_radius=10)
+        return panel_surf
+
+    def _build_player_panel(self):
+        """Fondo + etiquetas fijas del panel del jugador"""
+        panel = self.player_panel_rect
+        panel_surf = self._build_panel(panel.width, panel.height)
+
+        title = self.font_tiny.render("SALUD", True, (150, 150, 150))
+        panel_surf.blit(title, (10, 8))
+
+        dash_label = self.font_tiny.render("DASH", True, (100, 200, 255))
+        panel_surf.blit(dash_label, (10, 62))
+        return panel_surf
+
+    def _build_stats_panel(self):
+        """Fondo + etiquetas fijas del panel de estadísticas"""
+        panel = self.stats_panel_rect
+        panel_surf = self._build_panel(panel.width, panel.height)
+
+        wave_label = self.font_tiny.render("OLEADA", True, (150, 150, 150))
+        panel_surf.blit(wave_label, (15, 10))
+
+        pygame.draw.line(panel_surf, (60, 60, 80), (15, 42), (panel.width - 15, 42), 2)
+
+        score_label = self.font_tiny.render("PUNTOS", True, (150, 150, 150))
+        panel_surf.blit(score_label, (15, 50))
+
+        enemies_label = self.font_tiny.render("ENEMIGOS", True, (150, 150, 150))
+        panel_surf.blit(enemies_label, (15, 80))
+        return panel_surf
+
+    def get_rects(self):
+        """Zonas de pantalla que ocupa el HUD"""
+        return self.player_panel_rect, self.stats_panel_rect
+
     def render(self, player, wave=1, score=0, enemies_alive=0):
         """Renderiza el HUD completo"""
-        
+
         diff = score - self.score_display
         if abs(diff) < 0.5:
             self.score_display = score
         else:
             self.score_display += diff * self.score_lerp_speed
-        
+
+        blit_sequence = []
+
         # Panel superior izquierdo
-        self._render_player_panel(player)
-        
+        self._render_player_panel(player, blit_sequence)
+
         # Panel superior derecho
-        self._render_stats_panel(wave, int(self.score_display), enemies_alive)
-        
-    def _render_player_panel(self, player):
+        self._render_stats_panel(wave, int(self.score_display), enemies_alive, blit_sequence)
+
+        self.screen.blits(blit_sequence, doreturn=False)
+
+    def _render_player_panel(self, player, blit_sequence):
         """Panel de información del jugador"""
-        panel_x = 15
-        panel_y = 15
-        panel_width = 250
-        panel_height = 80
-        
-        # Fondo del panel con transparencia
-        panel_surf = pygame.Surface((panel_width, panel_height), pygame.SRCALPHA)
-        pygame.draw.rect(panel_surf, (20, 20, 30, 200), (0, 0, panel_width, panel_height), border_radius=10)
-        pygame.draw.rect(panel_surf, (60, 60, 80, 255), (0, 0, panel_width, panel_height), 2, border_radius=10)
-        self.screen.blit(panel_surf, (panel_x, panel_y))
-        
-        # Título "SALUD"
-        title = self.font_tiny.render("SALUD", True, (150, 150, 150))
-        self.screen.blit(title, (panel_x + 10, panel_y + 8))
-        
-        # Barra de vida
-        bar_x = panel_x + 10
-        bar_y = panel_y + 32
-        bar_width = panel_width - 20
-        bar_height = 24
-        
+        panel = self.player_panel_rect
+        blit_sequence.append((self.player_panel, panel.topleft))
+
+        # Barra de vida: solo se regenera si cambia la vida mostrada
+        health_key = (int(player.health), player.max_health)
+        if health_key != self._health_key:
+            self._health_surf = self._build_health_bar(player)
+            self._health_key = health_key
+        blit_sequence.append((self._health_surf, (self.bar_rect.x - 2, self.bar_rect.y - 2)))
+
+        # Barra de Dash / Energía
+        dash_progress = 1.0
+        if player.dash_cooldown > 0:
+            dash_progress = 1.0 - (player.dash_cooldown_timer / player.dash_cooldown)
+
+        dash_bar_width = int((panel.width - 60) * dash_progress)
+        dash_key = (dash_bar_width, dash_progress >= 1.0, player.invulnerable_frames > 0)
+        if dash_key != self._dash_key:
+            self._dash_surf = self._build_dash_bar(*dash_key)
+            self._dash_key = dash_key
+        blit_sequence.append((self._dash_surf, (panel.x + 55, panel.y + 65)))
+
+    def _build_health_bar(self, player):
+        """Fondo, brillo, relleno, borde y texto de la barra de vida en una superficie"""
+        bar_width = self.bar_rect.width
+        bar_height = self.bar_rect.height
+        # El brillo empieza 2px antes de la barra y mide (relleno + 8) x (alto + 8)
+        surf = pygame.Surface((bar_width + 8, bar_height + 8), pygame.SRCALPHA)
+        bar_x = 2
+        bar_y = 2
+
         # Calcular porcentaje de vida
         health_percent = player.health / player.max_health
-        
+
         # Color de la barra según la vida
         if health_percent > 0.6:
             bar_color = (0, 200, 100)
@@ -67,89 +169,82 @@ class HUD:
         else:
             bar_color = (255, 50, 50)
             glow_color = (255, 100, 100, 100)
-        
+
         # Fondo de la barra (oscuro)
-        pygame.draw.rect(self.screen, (40, 40, 50), (bar_x, bar_y, bar_width, bar_height), border_radius=4)
-        
+        pygame.draw.rect(surf, (40, 40, 50), (bar_x, bar_y, bar_width, bar_height), border_radius=4)
+
         # Renderizado de la barra de vida
         health_width = int((bar_width - 4) * health_percent)
         if health_width > 0:
             glow_surf = pygame.Surface((health_width + 8, bar_height + 8), pygame.SRCALPHA)
             pygame.draw.rect(glow_surf, glow_color, (0, 0, health_width + 8, bar_height + 8), border_radius=6)
-            self.screen.blit(glow_surf, (bar_x - 2, bar_y - 2))
-            
-            pygame.draw.rect(self.screen, bar_color, (bar_x + 2, bar_y + 2, health_width, bar_height - 4), border_radius=3)
-            
+            surf.blit(glow_surf, (bar_x - 2, bar_y - 2))
+
+            pygame.draw.rect(surf, bar_color, (bar_x + 2, bar_y + 2, health_width, bar_height - 4), border_radius=3)
+
             highlight_height = (bar_height - 4) // 3
             highlight_color = tuple(min(255, c + 40) for c in bar_color)
-            pygame.draw.rect(self.screen, highlight_color, 
+            pygame.draw.rect(surf, highlight_color,
                            (bar_x + 2, bar_y + 2, health_width, highlight_height), border_radius=3)
-        
-        pygame.draw.rect(self.screen, (100, 100, 120), (bar_x, bar_y, bar_width, bar_height), 2, border_radius=4)
-        
+
+        pygame.draw.rect(surf, (100, 100, 120), (bar_x, bar_y, bar_width, bar_height), 2, border_radius=4)
+
         # Texto de vida
-        health_text = self.font_medium.render(f"{int(player.health)} / {player.max_health}", True, WHITE)
+        text = f"{int(player.health)} / {player.max_health}"
+        health_text = self.font_medium.render(text, True, WHITE)
         text_rect = health_text.get_rect(center=(bar_x + bar_width // 2, bar_y + bar_height // 2))
-        shadow = self.font_medium.render(f"{int(player.health)} / {player.max_health}", True, BLACK)
+        shadow = self.font_medium.render(text, True, BLACK)
         shadow_rect = shadow.get_rect(center=(text_rect.centerx + 1, text_rect.centery + 1))
-        self.screen.blit(shadow, shadow_rect)
-        self.screen.blit(health_text, text_rect)
-        
-        # Barra de Dash / Energía
-        dash_progress = 1.0
-        if player.dash_cooldown > 0:
-            dash_progress = 1.0 - (player.dash_cooldown_timer / player.dash_cooldown)
-        
-        dash_label = self.font_tiny.render("DASH", True, (100, 200, 255))
-        self.screen.blit(dash_label, (panel_x + 10, panel_y + 62))
-        
-        dash_bar_width = int((panel_width - 60) * dash_progress)
-        dash_color = (0, 255, 255) if dash_progress >= 1.0 else (100, 100, 150)
-        
+        surf.blit(shadow, shadow_rect)
+        surf.blit(health_text, text_rect)
+        return surf
+
+    def _build_dash_bar(self, dash_bar_width, ready, invulnerable):
+        width = self.player_panel_rect.width - 70
+        surf = pygame.Surface((width, 6), pygame.SRCALPHA)
+        dash_color = (0, 255, 255) if ready else (100, 100, 150)
+
         # Fondo barra dash
-        pygame.draw.rect(self.screen, (30, 30, 40), (panel_x + 55, panel_y + 65, panel_width - 70, 6), border_radius=3)
+        pygame.draw.rect(surf, (30, 30, 40), (0, 0, width, 6), border_radius=3)
         # Barra dash
-        pygame.draw.rect(self.screen, dash_color, (panel_x + 55, panel_y + 65, dash_bar_width, 6), border_radius=3)
-        
-        if player.invulnerable_frames > 0:
+        pygame.draw.rect(surf, dash_color, (0, 0, dash_bar_width, 6), border_radius=3)
+
+        if invulnerable:
             # Indicador visual simple de inmunidad
-            pygame.draw.rect(self.screen, (255, 255, 255), (panel_x + 55, panel_y + 65, panel_width - 70, 6), 1, border_radius=3)
+            pygame.draw.rect(surf, (255, 255, 255), (0, 0, width, 6), 1, border_radius=3)
+        return surf
 
-    def _render_stats_panel(self, wave, score, enemies_alive):
+    def _render_stats_panel(self, wave, score, enemies_alive, blit_sequence):
         """Panel de estadísticas del juego"""
-        panel_width = 220
-        panel_height = 110
-        panel_x = self.screen.get_width() - panel_width - 15
-        panel_y = 15
-        
-        panel_surf = pygame.Surface((panel_width, panel_height), pygame.SRCALPHA)
-        pygame.draw.rect(panel_surf, (20, 20, 30, 200), (0, 0, panel_width, panel_height), border_radius=10)
-        pygame.draw.rect(panel_surf, (60, 60, 80, 255), (0, 0, panel_width, panel_height), 2, border_radius=10)
-        self.screen.blit(panel_surf, (panel_x, panel_y))
-        
+        panel = self.stats_panel_rect
+        right = panel.right - 15
+        blit_sequence.append((self.stats_panel, panel.topleft))
+
         # Oleada
-        wave_label = self.font_tiny.render("OLEADA", True, (150, 150, 150))
-        self.screen.blit(wave_label, (panel_x + 15, panel_y + 10))
-        
-        wave_text = self.font.render(str(wave), True, YELLOW)
-        wave_rect = wave_text.get_rect(topright=(panel_x + panel_width - 15, panel_y + 8))
-        self.screen.blit(wave_text, wave_rect)
-        
-        pygame.draw.line(self.screen, (60, 60, 80), (panel_x + 15, panel_y + 42), (panel_x + panel_width - 15, panel_y + 42), 2)
-        
-        # Puntuación
-        score_label = self.font_tiny.render("PUNTOS", True, (150, 150, 150))
-        self.screen.blit(score_label, (panel_x + 15, panel_y + 50))
-        
-        score_text = self.font_medium.render(f"{score:,}", True, WHITE)
-        score_rect = score_text.get_rect(topright=(panel_x + panel_width - 15, panel_y + 48))
-        self.screen.blit(score_text, score_rect)
-        
+        if wave != self._wave_key:
+            self._wave_surf = self.font.render(str(wave), True, YELLOW)
+            self._wave_key = wave
+        blit_sequence.append((self._wave_surf, self._wave_surf.get_rect(topright=(right, panel.y + 8))))
+
+        # Puntuación (glifos cacheados mientras anima, sin superficies nuevas)
+        if score != self._score_key:
+            self._layout_digits(f"{score:,}", right, panel.y + 48)
+            self._score_key = score
+        blit_sequence.extend(self._score_blits)
+
         # Enemigos
-        enemies_label = self.font_tiny.render("ENEMIGOS", True, (150, 150, 150))
-        self.screen.blit(enemies_label, (panel_x + 15, panel_y + 80))
-        
         enemy_color = RED if enemies_alive > 10 else (255, 150, 0) if enemies_alive > 5 else (100, 255, 100)
-        enemies_text = self.font_medium.render(str(enemies_alive), True, enemy_color)
-        enemies_rect = enemies_text.get_rect(topright=(panel_x + panel_width - 15, panel_y + 78))
-        self.screen.blit(enemies_text, enemies_rect)
\ No newline at end of file
+        enemies_key = (enemies_alive, enemy_color)
+        if enemies_key != self._enemies_key:
+            self._enemies_surf = self.font_medium.render(str(enemies_alive), True, enemy_color)
+            self._enemies_key = enemies_key
+        blit_sequence.append((self._enemies_surf, self._enemies_surf.get_rect(topright=(right, panel.y + 78))))
+
+    def _layout_digits(self, text, right, y):
+        """Posiciona los glifos pre-renderizados de un número alineado a la derecha"""
+        blits = self._score_blits
+        blits.clear()
+        x = right
+        for ch in reversed(text):
+            x -= self.digit_widths[ch]
+            blits.append((self.digit_glyphs[ch], (x, y)))
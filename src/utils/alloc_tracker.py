@@ -0,0 +1,166 @@
+"""
+Rastreador de asignaciones por frame (modo debug, F4 en la partida)
+- Surface y Rect: mientras está activo, pygame.Surface / pygame.Rect se
+  reemplazan por subclases que cuentan cada construcción por sitio de
+  llamada (archivo:línea). También cuentan las funciones de
+  pygame.transform que devuelven una superficie nueva.
+  No ven lo que se crea desde C (font.render, copy, move, inflate...).
+- Python: tracemalloc mide el pico de memoria transitoria de cada frame y,
+  una vez por ventana, compara instantáneas para ver qué líneas retienen
+  memoria nueva.
+Los valores se publican como promedios por frame de la última ventana.
+El hilo de simulación también cuenta; sin candado puede perderse alguna
+cuenta suelta (es solo diagnóstico).
+"""
+import os
+import sys
+import tracemalloc
+import pygame
+
+_SURFACE = pygame.Surface
+_RECT = pygame.Rect
+_TRANSFORMS = {name: getattr(pygame.transform, name)
+               for name in ('scale', 'smoothscale', 'rotate', 'rotozoom', 'flip', 'scale2x')}
+# Funciones que aceptan superficie destino: con ella no se crea nada nuevo
+_DEST_ARG = {'scale': 2, 'smoothscale': 2, 'scale2x': 1}
+# Fábricas: la asignación se atribuye a quien las llamó
+_SKIP_FILES = ('surface_factory.py', 'alloc_tracker.py')
+
+class AllocTracker:
+    def __init__(self, window=60, top=3):
+        self.enabled = False
+        self.window = window
+        self.top = top
+        # (tipo, sitio) -> construcciones en la ventana actual
+        self.counts = {}
+        self.frames = 0
+        self.peak_bytes = 0
+        self.frame_base = 0
+        self.snapshot = None
+        self.report = self._empty_report()
+
+    @staticmethod
+    def _empty_report():
+        return {'surfaces': 0.0, 'rects': 0.0, 'python_kb': 0.0, 'sites': [], 'growth': []}
+
+    def toggle(self):
+        if self.enabled:
+            self.disable()
+        else:
+            self.enable()
+
+    def enable(self):
+        if self.enabled:
+            return
+        self.enabled = True
+        pygame.Surface = TrackedSurface
+        pygame.Rect = TrackedRect
+        for name, function in _TRANSFORMS.items():
+            setattr(pygame.transform, name, _wrap_transform(name, function))
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(1)
+        self._start_window()
+
+    def disable(self):
+        if not self.enabled:
+            return
+        self.enabled = False
+        pygame.Surface = _SURFACE
+        pygame.Rect = _RECT
+        for name, function in _TRANSFORMS.items():
+            setattr(pygame.transform, name, function)
+        tracemalloc.stop()
+        self.snapshot = None
+        self.report = self._empty_report()
+
+    def record(self, kind):
+        frame = sys._getframe(2)
+        while frame is not None and os.path.basename(frame.f_code.co_filename) in _SKIP_FILES:
+            frame = frame.f_back
+        if frame is None:
+            return
+        key = (kind, f"{os.path.basename(frame.f_code.co_filename)}:{frame.f_lineno}")
+        counts = self.counts
+        counts[key] = counts.get(key, 0) + 1
+
+    def _start_window(self):
+        self.counts = {}
+        self.frames = 0
+        self.peak_bytes = 0
+        self.snapshot = self._take_snapshot()
+        tracemalloc.reset_peak()
+        self.frame_base = tracemalloc.get_traced_memory()[0]
+
+    def _take_snapshot(self):
+        return tracemalloc.take_snapshot().filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+        ))
+
+    def end_frame(self):
+        """Cierra el frame (Game.end_frame); publica promedios al completar la ventana"""
+        if not self.enabled:
+            return
+        current, peak = tracemalloc.get_traced_memory()
+        self.peak_bytes += max(0, peak - self.frame_base)
+        self.frames += 1
+        if self.frames >= self.window:
+            self._publish()
+            self._start_window()
+        else:
+            tracemalloc.reset_peak()
+            self.frame_base = current
+
+    def _publish(self):
+        frames = self.frames
+        surfaces = sum(n for (kind, _), n in self.counts.items() if kind != 'Rect')
+        rects = sum(n for (kind, _), n in self.counts.items() if kind == 'Rect')
+        sites = sorted(self.counts.items(), key=lambda item: item[1], reverse=True)[:self.top]
+
+        growth = []
+        if self.snapshot is not None:
+            stats = self._take_snapshot().compare_to(self.snapshot, 'lineno')
+            for stat in stats[:self.top]:
+                if stat.size_diff <= 0:
+                    break
+                frame = stat.traceback[0]
+                growth.append((f"{os.path.basename(frame.filename)}:{frame.lineno}",
+                               stat.size_diff / 1024.0, stat.count_diff))
+
+        self.report = {
+            'surfaces': surfaces / frames,
+            'rects': rects / frames,
+            'python_kb': self.peak_bytes / frames / 1024.0,
+            'sites': [(kind, site, n / frames) for (kind, site), n in sites],
+            'growth': growth,
+        }
+
+    def get_debug_info(self):
+        info = dict(self.report)
+        info['enabled'] = self.enabled
+        return info
+
+
+class TrackedSurface(_SURFACE):
+    def __init__(self, *args, **kwargs):
+        ALLOC_TRACKER.record('Surface')
+        super().__init__(*args, **kwargs)
+
+
+class TrackedRect(_RECT):
+    def __init__(self, *args, **kwargs):
+        ALLOC_TRACKER.record('Rect')
+        super().__init__(*args, **kwargs)
+
+
+def _wrap_transform(name, function):
+    dest_index = _DEST_ARG.get(name)
+
+    def tracked(*args, **kwargs):
+        if dest_index is None or (len(args) <= dest_index and 'dest_surface' not in kwargs):
+            ALLOC_TRACKER.record(f"transform.{name}")
+        return function(*args, **kwargs)
+    return tracked
+
+
+ALLOC_TRACKER = AllocTracker()
@@ -0,0 +1,258 @@
+"""
+Jugador automático para pruebas de carga y benchmarks
+Produce lo mismo que el jugador humano: teclas pulsadas, posición virtual
+del mouse y botones, más eventos de teclado para cambiar de arma y hacer
+dash. Así pasa por el mismo camino que una partida real
+(handle_event -> handle_input -> update_rotation -> attack).
+- Los enemigos se consultan en el SpatialGrid del nivel (el del último tick)
+- La búsqueda del grupo más denso y de la amenaza más cercana se hace cada
+  'think_interval' ticks; entre medio solo se reaplica la última decisión
+- Estrategias: 'idle' (quieto), 'kite' (se aleja, esquiva con dash y alterna
+  las cuatro armas), 'laser_sweep' (barre el grupo con el láser)
+Uso: keys, mouse_pos, mouse_pressed = bot.control(level, send_event)
+"""
+import math
+import time
+import pygame
+from settings import WORLD_WIDTH, WORLD_HEIGHT
+
+PISTOL, SHOTGUN, RIFLE, LASER = range(4)
+WEAPON_KEYS = (pygame.K_1, pygame.K_2, pygame.K_3, pygame.K_4)
+
+class BotKeys:
+    """Sustituto de pygame.key.get_pressed(): solo las teclas del conjunto están pulsadas"""
+    def __init__(self):
+        self.pressed = set()
+
+    def __getitem__(self, key):
+        return key in self.pressed
+
+
+class BotStrategy:
+    """Decide movimiento, arma y puntería a partir de lo que vio el bot"""
+    name = None
+
+    def reset(self):
+        pass
+
+    def decide(self, bot, player, tick):
+        """
+        Retorna (dirección (dx, dy), arma, (x, y) de mundo a apuntar o None, disparar).
+        bot.threat / bot.threat_dist_sq: enemigo vivo más cercano (o None)
+        bot.cluster: (x, y, cantidad) del grupo más denso visible (o None)
+        """
+        raise NotImplementedError
+
+    @staticmethod
+    def choose_weapon(bot):
+        """Escopeta encima, láser contra grupos, pistola de lejos, rifle el resto"""
+        if bot.threat is not None and bot.threat_dist_sq < 200 * 200:
+            return SHOTGUN
+        if bot.cluster is not None and bot.cluster[2] >= 3:
+            return LASER
+        if bot.threat is None or bot.threat_dist_sq > 450 * 450:
+            return PISTOL
+        return RIFLE
+
+    @staticmethod
+    def aim_point(bot):
+        if bot.cluster is not None:
+            return bot.cluster[0], bot.cluster[1]
+        if bot.threat is not None:
+            return bot.threat.x, bot.threat.y
+        return None
+
+
+class IdleStrategy(BotStrategy):
+    """No se mueve: mide el costo de disparar sin el del movimiento"""
+    name = 'idle'
+
+    def decide(self, bot, player, tick):
+        aim = self.aim_point(bot)
+        return (0, 0), self.choose_weapon(bot), aim, aim is not None
+
+
+class KiteStrategy(BotStrategy):
+    """Se aleja de la amenaza más cercana, rodea al grupo y hace dash si lo alcanzan"""
+    name = 'kite'
+
+    def __init__(self, kite_radius=180, dash_radius=100):
+        self.kite_radius = kite_radius
+        self.dash_radius = dash_radius
+        self.orbit = 1
+
+    def reset(self):
+        self.orbit = 1
+
+    def decide(self, bot, player, tick):
+        dx = dy = 0.0
+        threat = bot.threat
+        if threat is not None:
+            away_x = player.x - threat.x
+            away_y = player.y - threat.y
+            if bot.threat_dist_sq < self.kite_radius * self.kite_radius:
+                dx, dy = away_x, away_y
+            else:
+                # Fuera de peligro: rodear (perpendicular a la amenaza)
+                dx, dy = -away_y * self.orbit, away_x * self.orbit
+        dx, dy = _avoid_walls(player, dx, dy)
+        if threat is not None and bot.threat_dist_sq < self.dash_radius * self.dash_radius:
+            bot.request_dash()
+        if tick % 600 == 0:
+            self.orbit = -self.orbit
+
+        aim = self.aim_point(bot)
+        return (dx, dy), self.choose_weapon(bot), aim, aim is not None
+
+
+class LaserSweepStrategy(BotStrategy):
+    """Láser oscilando sobre el grupo más denso; solo se mueve si lo alcanzan"""
+    name = 'laser_sweep'
+
+    def __init__(self, sweep=0.5, period=90, escape_radius=120):
+        self.sweep = sweep
+        self.period = period
+        self.escape_radius = escape_radius
+
+    def decide(self, bot, player, tick):
+        dx = dy = 0.0
+        if bot.threat is not None and bot.threat_dist_sq < self.escape_radius * self.escape_radius:
+            dx = player.x - bot.threat.x
+            dy = player.y - bot.threat.y
+        dx, dy = _avoid_walls(player, dx, dy)
+
+        target = self.aim_point(bot)
+        if target is None:
+            return (dx, dy), LASER, None, False
+        angle = math.atan2(target[1] - player.y, target[0] - player.x)
+        angle += math.sin(tick * 2.0 * math.pi / self.period) * self.sweep
+        aim = (player.x + math.cos(angle) * 300, player.y + math.sin(angle) * 300)
+        return (dx, dy), LASER, aim, True
+
+
+STRATEGIES = {strategy.name: strategy for strategy in (IdleStrategy, KiteStrategy, LaserSweepStrategy)}
+
+
+def _avoid_walls(player, dx, dy, margin=150):
+    """Empuja la dirección hacia el centro cerca de los bordes del mundo"""
+    if player.x < margin:
+        dx = abs(dx) + 1
+    elif player.x > WORLD_WIDTH - margin:
+        dx = -abs(dx) - 1
+    if player.y < margin:
+        dy = abs(dy) + 1
+    elif player.y > WORLD_HEIGHT - margin:
+        dy = -abs(dy) - 1
+    return dx, dy
+
+
+class BotPlayer:
+    def __init__(self, strategy='kite', think_interval=6, view_radius=700):
+        if strategy not in STRATEGIES:
+            raise ValueError(f"Estrategia de bot desconocida: {strategy}")
+        self.strategy = STRATEGIES[strategy]()
+        self.think_interval = think_interval
+        self.view_radius = view_radius
+        self.keys = BotKeys()
+        self.key_events = {key: pygame.event.Event(pygame.KEYDOWN, key=key)
+                           for key in WEAPON_KEYS + (pygame.K_w, pygame.K_s, pygame.K_a, pygame.K_d)}
+        self.released = (False, False, False)
+        self.firing = (True, False, False)
+        self.reset()
+
+    def reset(self):
+        """Se llama al iniciar cada partida"""
+        self.strategy.reset()
+        self.tick = 0
+        self.threat = None
+        self.threat_dist_sq = 0.0
+        self.cluster = None
+        self.decision = ((0, 0), RIFLE, None, False)
+        self.dash_requested = False
+        self.keys.pressed.clear()
+        # Costo propio del bot (para descontarlo de las mediciones)
+        self.calls = 0
+        self.total_ms = 0.0
+        self.last_ms = 0.0
+
+    def request_dash(self):
+        self.dash_requested = True
+
+    def control(self, level, send_event):
+        """
+        Entrada del próximo tick. send_event(evento) lo entrega al nivel
+        (level.handle_event o la cola del hilo de simulación).
+        Retorna (keys, mouse_pos, mouse_pressed) como la lectura de pygame.
+        """
+        start = time.perf_counter()
+        player = level.player
+        if self.tick % self.think_interval == 0:
+            self._observe(level.spatial_grid, player)
+            self.decision = self.strategy.decide(self, player, self.tick)
+        self.tick += 1
+        (dx, dy), weapon, aim, fire = self.decision
+
+        if weapon != player.current_weapon_index:
+            send_event(self.key_events[WEAPON_KEYS[weapon]])
+
+        pressed = self.keys.pressed
+        pressed.clear()
+        if dx > 0.3 * abs(dy):
+            pressed.add(pygame.K_d)
+        elif dx < -0.3 * abs(dy):
+            pressed.add(pygame.K_a)
+        if dy > 0.3 * abs(dx):
+            pressed.add(pygame.K_s)
+        elif dy < -0.3 * abs(dx):
+            pressed.add(pygame.K_w)
+
+        if self.dash_requested:
+            self.dash_requested = False
+            if pressed and player.dash_cooldown_timer <= 0 and not player.dash_active:
+                # Doble toque de la misma tecla de dirección (igual que el humano)
+                event = self.key_events[next(iter(pressed))]
+                send_event(event)
+                send_event(event)
+
+        camera = level.camera
+        if aim is None:
+            aim = (player.x + math.cos(player.angle) * 100, player.y + math.sin(player.angle) * 100)
+        mouse_pos = (aim[0] + camera.offset_x, aim[1] + camera.offset_y)
+
+        self.last_ms = (time.perf_counter() - start) * 1000.0
+        self.total_ms += self.last_ms
+        self.calls += 1
+        return self.keys, mouse_pos, self.firing if fire else self.released
+
+    def _observe(self, grid, player):
+        """Amenaza más cercana y grupo más denso a la vista (consultas al grid)"""
+        self.threat = None
+        best = float('inf')
+        for enemy in grid.get_nearby(player.x, player.y, radius=3):
+            if enemy.is_alive:
+                dist_sq = (enemy.x - player.x) ** 2 + (enemy.y - player.y) ** 2
+                if dist_sq < best:
+                    best = dist_sq
+                    self.threat = enemy
+        self.threat_dist_sq = best
+
+        self.cluster = None
+        r = self.view_radius
+        cell = grid.densest_cell(player.x - r, player.y - r, player.x + r, player.y + r)
+        if cell:
+            sum_x = sum_y = 0.0
+            count = 0
+            for enemy in cell:
+                if enemy.is_alive:
+                    sum_x += enemy.x
+                    sum_y += enemy.y
+                    count += 1
+            if count:
+                self.cluster = (sum_x / count, sum_y / count, count)
+
+    def get_debug_info(self):
+        return {
+            'strategy': self.strategy.name,
+            'avg_ms': self.total_ms / self.calls if self.calls else 0.0,
+            'last_ms': self.last_ms,
+        }
@@ -1,6 +1,21 @@
 import pygame, random
 from settings import WINDOW_WIDTH, WINDOW_HEIGHT, WORLD_WIDTH, WORLD_HEIGHT
 
+class CameraView:
+    """
+    Cámara de solo lectura para el render desde una instantánea:
+    offset del frame publicado + escala de la capa del mundo.
+    """
+    __slots__ = ('offset_x', 'offset_y', 'render_scale')
+    def __init__(self, offset_x=0, offset_y=0, render_scale=1.0):
+        self.offset_x = offset_x
+        self.offset_y = offset_y
+        self.render_scale = render_scale
+
+    def apply_coords(self, x, y):
+        scale = self.render_scale
+        return ((x + self.offset_x) * scale, (y + self.offset_y) * scale)
+
 class Camera:
     def __init__(self, width, height):
         self.camera = pygame.Rect(0, 0, width, height)
@@ -8,6 +23,9 @@ class Camera:
         self.height = height
         self.offset_x = 0
         self.offset_y = 0
+        # Offset del tick anterior (interpolación de render)
+        self.prev_offset_x = 0
+        self.prev_offset_y = 0
         self.lerp_speed = 0.08
         self.true_scroll_x = 0
         self.true_scroll_y = 0
@@ -15,6 +33,19 @@ class Camera:
         self.viewport_rect = pygame.Rect(0, 0, WINDOW_WIDTH, WINDOW_HEIGHT)
         self.shake_intensity = 0
         self.shake_decay = 0.9
+        # Escala de la capa del mundo (resolución dinámica); 1.0 = BASE_WIDTH x BASE_HEIGHT
+        self.render_scale = 1.0
+
+    def reset(self):
+        """Vuelve al estado inicial (nueva partida con el mismo nivel)"""
+        self.camera = pygame.Rect(0, 0, self.width, self.height)
+        self.offset_x = 0
+        self.offset_y = 0
+        self.prev_offset_x = 0
+        self.prev_offset_y = 0
+        self.true_scroll_x = 0
+        self.true_scroll_y = 0
+        self.shake_intensity = 0
 
     def add_shake(self, amount):
         self.shake_intensity = min(self.shake_intensity + amount, 20)
@@ -26,19 +57,37 @@ class Camera:
         return rect.move(self.camera.topleft)
     
     def apply_coords(self, x, y):
-        return (x + self.offset_x, y + self.offset_y)
+        """Mundo -> coordenadas de la superficie donde se dibuja el mundo"""
+        scale = self.render_scale
+        return ((x + self.offset_x) * scale, (y + self.offset_y) * scale)
         
     def is_on_screen(self, rect):
         """
         Determina si un rectángulo (en coordenadas de mundo) 
         debe renderizarse, aplicando un margen de seguridad.
+        Comparación numérica: no crea Rects intermedios.
         """
-        screen_rect = self.apply_rect(rect)
-        display_area = self.viewport_rect.inflate(self.culling_margin, self.culling_margin)
+        margin = self.culling_margin // 2
+        x = rect.x + self.offset_x
+        y = rect.y + self.offset_y
         
-        return screen_rect.colliderect(display_area)
+        return (x + rect.width > -margin and x < self.viewport_rect.width + margin and
+                y + rect.height > -margin and y < self.viewport_rect.height + margin)
+    
+    def get_view_bounds(self, margin=0):
+        """
+        Rectángulo visible en coordenadas de MUNDO como (left, top, right, bottom),
+        ampliado 'margin' píxeles por lado.
+        """
+        left = -self.offset_x - margin
+        top = -self.offset_y - margin
+        right = left + self.viewport_rect.width + margin * 2
+        bottom = top + self.viewport_rect.height + margin * 2
+        return left, top, right, bottom
 
     def update(self, target, mouse_pos=None):
+        self.prev_offset_x = self.offset_x
+        self.prev_offset_y = self.offset_y
         target_x = -target.rect.centerx + int(WINDOW_WIDTH / 2)
         target_y = -target.rect.centery + int(WINDOW_HEIGHT / 2)
         
@@ -0,0 +1,130 @@
+"""
+Coalescedor de efectos
+Junta las peticiones de efectos de un frame y fusiona las cercanas del mismo
+tipo en un único efecto escalado, con un tope de partículas por frame.
+"""
+import math
+
+class EffectGroup:
+    """Grupo de peticiones del mismo tipo que se emitirán como un solo efecto"""
+    __slots__ = (
+        'effect_type', 'anchor_x', 'anchor_y', 'sum_x', 'sum_y', 'weight',
+        'radius', 'dir_x', 'dir_y', 'force', 'count'
+    )
+    def __init__(self, effect_type, x, y, direction=None, force=1.0, count=0):
+        self.effect_type = effect_type
+        self.anchor_x = x
+        self.anchor_y = y
+        self.sum_x = x
+        self.sum_y = y
+        self.weight = 1
+        self.radius = 0.0
+        self.dir_x, self.dir_y = direction if direction else (0.0, 0.0)
+        self.force = force
+        self.count = count
+
+    def add(self, x, y, direction=None):
+        self.sum_x += x
+        self.sum_y += y
+        self.weight += 1
+        if direction:
+            self.dir_x += direction[0]
+            self.dir_y += direction[1]
+        dist = math.sqrt((x - self.anchor_x) ** 2 + (y - self.anchor_y) ** 2)
+        if dist > self.radius:
+            self.radius = dist
+
+    def center(self):
+        return self.sum_x / self.weight, self.sum_y / self.weight
+
+    def direction(self):
+        length_sq = self.dir_x * self.dir_x + self.dir_y * self.dir_y
+        if length_sq < 0.0001:
+            return None
+        inv = 1.0 / math.sqrt(length_sq)
+        return (self.dir_x * inv, self.dir_y * inv)
+
+
+class EffectCoalescer:
+    """
+    Uso: request_*() durante el update y flush() una vez al final del frame.
+    - merge_radius: distancia máxima al ancla del grupo para fusionar
+    - max_scale: escala máxima de un efecto fusionado (crece con sqrt(peticiones))
+    - particle_budget: tope de partículas emitidas por flush() (cada efecto recibe
+      lo que queda como máximo, así que el total nunca lo supera)
+    """
+    def __init__(self, particle_system, merge_radius=60, max_scale=2.5, particle_budget=400):
+        self.particle_system = particle_system
+        self.merge_radius_sq = merge_radius * merge_radius
+        self.max_scale = max_scale
+        self.particle_budget = particle_budget
+        self.groups = []
+
+        # Estadísticas del último flush (para el overlay F3)
+        self.last_requests = 0
+        self.last_effects = 0
+        self.last_emitted = 0
+
+    def request_viscera(self, x, y):
+        self._request('viscera', x, y)
+
+    def request_splatter(self, x, y, direction_vector=None, force=1.2, count=4):
+        self._request('splatter', x, y, direction_vector, force, count)
+
+    def _request(self, effect_type, x, y, direction=None, force=1.0, count=0):
+        merge_radius_sq = self.merge_radius_sq
+        for group in self.groups:
+            if group.effect_type != effect_type:
+                continue
+            dx = x - group.anchor_x
+            dy = y - group.anchor_y
+            if dx * dx + dy * dy <= merge_radius_sq:
+                group.add(x, y, direction)
+                return
+        self.groups.append(EffectGroup(effect_type, x, y, direction, force, count))
+
+    def flush(self):
+        """Emite los grupos del frame (los más grandes primero) respetando el presupuesto"""
+        groups = self.groups
+        self.last_requests = sum(g.weight for g in groups)
+        self.last_effects = 0
+        self.last_emitted = 0
+        if not groups:
+            return 0
+
+        groups.sort(key=lambda g: g.weight, reverse=True)
+        particle_system = self.particle_system
+        emitted = 0
+
+        for group in groups:
+            remaining = self.particle_budget - emitted
+            if remaining <= 0:
+                break
+            scale = min(self.max_scale, math.sqrt(group.weight))
+            x, y = group.center()
+
+            if group.effect_type == 'viscera':
+                emitted += particle_system.create_viscera_explosion(
+                    x, y, scale=scale, spread_radius=group.radius, max_count=remaining
+                )
+            else:
+                emitted += particle_system.create_blood_splatter(
+                    x, y, direction_vector=group.direction(),
+                    force=group.force, count=group.count, scale=scale, max_count=remaining
+                )
+            self.last_effects += 1
+
+        self.last_emitted = emitted
+        groups.clear()
+        return emitted
+
+    def clear(self):
+        self.groups.clear()
+
+    def get_debug_info(self):
+        return {
+            'requests': self.last_requests,
+            'effects': self.last_effects,
+            'emitted': self.last_emitted,
+            'budget': self.particle_budget,
+        }
@@ -0,0 +1,141 @@
+"""
+Perfilador de N frames bajo demanda (F5 en la partida)
+Un solo perfilador por captura (PROFILE_MODE): juntos se distorsionan
+entre sí, el muestreador toma el GIL y cProfile encarece cada llamada.
+- 'cprofile': cProfile sobre el hilo principal -> archivo .pstats
+  (python -m pstats, snakeviz...)
+- 'sampler': muestreador de pilas en un hilo aparte que lee
+  sys._current_frames() cada PROFILE_SAMPLE_MS, incluido el hilo de
+  simulación -> archivo .collapsed (formato "marco;marco;hoja cuenta",
+  listo para flamegraph.pl o speedscope). Solo puede muestrear cuando el
+  hilo principal suelta el GIL, así que las muestras se sesgan hacia esos
+  puntos (blits, esperas); durante la captura solo guarda los code objects,
+  el texto se arma al escribir el archivo
+Los archivos llevan en el nombre la oleada, los enemigos y la calidad de
+partículas del momento en que empezó la captura.
+"""
+import cProfile
+import os
+import sys
+import threading
+import time
+from settings import PROFILE_FRAMES, PROFILE_DIR, PROFILE_MODE, PROFILE_SAMPLE_MS
+
+class FrameProfiler:
+    MODES = ('cprofile', 'sampler')
+
+    def __init__(self, frames=PROFILE_FRAMES, output_dir=PROFILE_DIR, mode=PROFILE_MODE,
+                 sample_interval_ms=PROFILE_SAMPLE_MS):
+        if mode not in self.MODES:
+            raise ValueError(f"Modo de perfil desconocido: {mode}")
+        self.frames = frames
+        self.output_dir = output_dir
+        self.mode = mode
+        self.sample_interval = sample_interval_ms / 1000.0
+        self.capturing = False
+        self.profile = None
+        self.remaining = 0
+        self.tags = None
+        self.sampler = None
+        self.sampling = False
+        # (nombre del hilo, code objects de la raíz a la hoja) -> muestras
+        self.stacks = {}
+        self.samples = 0
+        self.last_output = None
+
+    @property
+    def active(self):
+        return self.capturing
+
+    def start(self, tags):
+        """Empieza a perfilar los próximos self.frames frames (tags: texto para el nombre)"""
+        if self.active:
+            return
+        self.tags = tags
+        self.remaining = self.frames
+        self.stacks = {}
+        self.samples = 0
+        self.capturing = True
+        if self.mode == 'sampler':
+            self.sampling = True
+            self.sampler = threading.Thread(target=self._sample, name="profiler-sampler", daemon=True)
+            self.sampler.start()
+        else:
+            self.profile = cProfile.Profile()
+            self.profile.enable()
+
+    def end_frame(self):
+        """Se llama al cerrar cada frame (Game.end_frame)"""
+        if not self.active:
+            return
+        self.remaining -= 1
+        if self.remaining <= 0:
+            self.stop()
+
+    def stop(self):
+        if not self.active:
+            return
+        if self.profile is not None:
+            self.profile.disable()
+        if self.sampler is not None:
+            self.sampling = False
+            self.sampler.join()
+            self.sampler = None
+        self.last_output = self._write()
+        self.profile = None
+        self.capturing = False
+        print(f"Perfil guardado: {self.last_output}")
+
+    def _sample(self):
+        own = threading.get_ident()
+        names = {}
+        stacks = self.stacks
+        while self.sampling:
+            for ident, frame in sys._current_frames().items():
+                if ident == own:
+                    continue
+                name = names.get(ident)
+                if name is None:
+                    name = next((t.name for t in threading.enumerate() if t.ident == ident), str(ident))
+                    names[ident] = name
+                codes = []
+                while frame is not None:
+                    codes.append(frame.f_code)
+                    frame = frame.f_back
+                key = (name, tuple(codes))
+                stacks[key] = stacks.get(key, 0) + 1
+            self.samples += 1
+            time.sleep(self.sample_interval)
+
+    def _write(self):
+        os.makedirs(self.output_dir, exist_ok=True)
+        base = os.path.join(self.output_dir, f"perfil_{time.strftime('%Y%m%d-%H%M%S')}_{self.tags}")
+        if self.profile is not None:
+            path = base + ".pstats"
+            self.profile.dump_stats(path)
+            return path
+        collapsed = {}
+        for (name, codes), count in self.stacks.items():
+            parts = [name]
+            for code in reversed(codes):
+                parts.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})")
+            stack = ";".join(parts)
+            collapsed[stack] = collapsed.get(stack, 0) + count
+        path = base + ".collapsed"
+        with open(path, "w", encoding="utf-8") as f:
+            for stack, count in sorted(collapsed.items()):
+                f.write(f"{stack} {count}\n")
+        return path
+
+    def get_debug_info(self):
+        return {
+            'active': self.active,
+            'mode': self.mode,
+            'frame': self.frames - self.remaining,
+            'frames': self.frames,
+            'samples': self.samples,
+            'last_output': self.last_output,
+        }
+
+
+FRAME_PROFILER = FrameProfiler()
@@ -0,0 +1,139 @@
+"""
+Planificador de frames central (lo posee Game)
+Única fuente de dt y del ritmo del bucle principal:
+- 'sleep' (por defecto): espera con SDL_Delay (pygame.time.Clock.tick),
+  barato pero impreciso
+- 'hybrid' (opcional): duerme hasta poco antes del límite y termina con una
+  espera activa que cede el GIL en cada vuelta; más preciso pero ocupa un
+  núcleo durante ese margen
+- 'vsync': el flip del presentador bloquea; si el vsync no está disponible
+  (o el driver lo ignora y los frames salen demasiado rápido) pasa a 'sleep'
+El ritmo de render (target_fps) puede superar al de la simulación (tick_fps):
+dt siempre se expresa en ticks de simulación.
+Cuando la escena está inactiva (pausa, pantallas estáticas) baja a IDLE_FPS
+y despierta antes si llega un evento; el frame siguiente usa el dt nominal.
+"""
+import time
+import pygame
+from settings import FPS, IDLE_FPS
+
+class FrameScheduler:
+    MODES = ('sleep', 'hybrid', 'vsync')
+
+    def __init__(self, target_fps=FPS, mode='sleep', idle_fps=IDLE_FPS, tick_fps=FPS):
+        if mode not in self.MODES:
+            raise ValueError(f"Modo de ritmo desconocido: {mode}")
+        self.mode = mode
+        self.target_fps = target_fps
+        self.idle_fps = idle_fps
+        self.frame_ms = 1000.0 / target_fps
+        self.tick_ms = 1000.0 / tick_fps
+        self.vsync_active = False
+
+        # Margen que se cubre con espera activa (el sleep del SO no es exacto)
+        self.spin_ms = 2.0
+        # dt normalizado a ticks de simulación (1.0 = un tick a 60 Hz)
+        self.max_dt = 3.0
+        # Frames seguidos por debajo de medio frame que delatan un vsync ignorado
+        self.vsync_check_frames = 30
+
+        self.clock = pygame.time.Clock()
+        self.reset()
+
+    def reset(self):
+        """Reinicia la medición (p. ej. tras una carga larga)"""
+        self.last_time = time.perf_counter()
+        self.dt_ms = self.frame_ms
+        self.dt = self.frame_ms / self.tick_ms
+        self.wait_ms = 0.0
+        self.work_ms = 0.0
+        self.idle = False
+        self.fps = float(self.target_fps)
+        self.fast_frames = 0
+
+    def set_vsync_active(self, active):
+        """El presentador informa si el flip está sincronizado con la pantalla"""
+        self.vsync_active = active
+        self.fast_frames = 0
+
+    @property
+    def effective_mode(self):
+        if self.mode == 'vsync' and not self.vsync_active:
+            return 'sleep'
+        return self.mode
+
+    def tick(self, idle=False):
+        """
+        Cierra el frame: espera lo necesario según el modo y calcula el dt
+        que usará el próximo update. Retorna ese dt.
+        """
+        start_wait = time.perf_counter()
+        self.work_ms = (start_wait - self.last_time) * 1000.0
+        self.idle = idle
+
+        if idle:
+            self._wait_idle(self.last_time + 1.0 / self.idle_fps)
+        else:
+            mode = self.effective_mode
+            if mode == 'sleep':
+                self.clock.tick(self.target_fps)
+            elif mode == 'hybrid':
+                self._wait_hybrid(self.last_time + self.frame_ms / 1000.0)
+            # 'vsync': el flip ya marcó el ritmo
+
+        now = time.perf_counter()
+        self.wait_ms = (now - start_wait) * 1000.0
+        self.dt_ms = (now - self.last_time) * 1000.0
+        self.last_time = now
+
+        if idle:
+            # La espera a IDLE_FPS no es tiempo de juego: el primer update al
+            # salir de la pausa recibe el dt nominal y no simula ticks de recuperación
+            self.dt = self.frame_ms / self.tick_ms
+        else:
+            self.dt = min(self.dt_ms / self.tick_ms, self.max_dt)
+        if self.vsync_active and not idle:
+            self._check_vsync()
+        if self.dt_ms > 0:
+            self.fps += (1000.0 / self.dt_ms - self.fps) * 0.1
+        return self.dt
+
+    def _check_vsync(self):
+        """Si el flip no bloquea, el vsync no está funcionando: limitar por software"""
+        if self.dt_ms < self.frame_ms * 0.5:
+            self.fast_frames += 1
+            if self.fast_frames >= self.vsync_check_frames:
+                print("Advertencia: vsync sin efecto. Usando ritmo 'sleep'.")
+                self.vsync_active = False
+        else:
+            self.fast_frames = 0
+
+    def _wait_hybrid(self, deadline):
+        remaining = deadline - time.perf_counter()
+        sleep_time = remaining - self.spin_ms / 1000.0
+        if sleep_time > 0:
+            time.sleep(sleep_time)
+        while time.perf_counter() < deadline:
+            # Cede el GIL (hilo de simulación, escritor de telemetría...)
+            time.sleep(0)
+
+    def _wait_idle(self, deadline):
+        """Espera larga en tramos cortos; cualquier evento pendiente la corta"""
+        while True:
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0 or pygame.event.peek():
+                return
+            time.sleep(min(remaining, 0.005))
+
+    def get_fps(self):
+        return self.fps
+
+    def get_debug_info(self):
+        return {
+            'mode': self.effective_mode,
+            'fps': self.fps,
+            'dt_ms': self.dt_ms,
+            'work_ms': self.work_ms,
+            'wait_ms': self.wait_ms,
+            'idle': self.idle,
+        }
@@ -0,0 +1,110 @@
+"""
+Política del recolector de ciclos de Python durante la partida
+- Al terminar la carga se recolecta una vez y se congela todo lo vivo
+  (gc.freeze): pools, cachés de superficies, sprites... dejan de recorrerse
+- Durante una oleada activa:
+  'manual': recolección automática desactivada (con válvula de seguridad
+            si la generación joven crece demasiado)
+  'thresholds': umbrales altos, colecciones mucho más espaciadas
+  'auto': comportamiento estándar de Python
+- En la ventana entre oleadas (WaveManager.wave_completed) se hace una
+  recolección completa, una vez por ventana
+- Todas las pausas del GC (automáticas o no) se miden vía gc.callbacks
+"""
+import gc
+import time
+from settings import GC_MODE
+
+class GCPolicy:
+    MODES = ('auto', 'thresholds', 'manual')
+
+    def __init__(self, mode=GC_MODE):
+        if mode not in self.MODES:
+            raise ValueError(f"Modo de GC desconocido: {mode}")
+        self.mode = mode
+        self.default_thresholds = gc.get_threshold()
+        self.wave_thresholds = (20000, 50, 1000)
+        # 'manual': objetos jóvenes pendientes a partir de los cuales se recolecta igual
+        self.safety_count = 200000
+
+        self.active = False
+        self.in_wave = False
+
+        # Métricas de pausas
+        self.pause_start = None
+        self.collections = 0
+        self.last_pause_ms = 0.0
+        self.last_generation = 0
+        self.max_pause_ms = 0.0
+        self.total_pause_ms = 0.0
+        gc.callbacks.append(self._on_gc)
+
+    def _on_gc(self, phase, info):
+        if phase == 'start':
+            self.pause_start = time.perf_counter()
+        elif self.pause_start is not None:
+            ms = (time.perf_counter() - self.pause_start) * 1000.0
+            self.pause_start = None
+            self.collections += 1
+            self.last_pause_ms = ms
+            self.last_generation = info['generation']
+            self.total_pause_ms += ms
+            if ms > self.max_pause_ms:
+                self.max_pause_ms = ms
+
+    def begin_gameplay(self):
+        """Tras cargar el nivel: recolectar, congelar lo vivo y entrar en modo oleada"""
+        if self.mode == 'auto':
+            return
+        gc.collect()
+        gc.freeze()
+        self.active = True
+        self.max_pause_ms = 0.0
+        self._enter_wave()
+
+    def end_gameplay(self):
+        """Restaura el GC estándar al salir de la partida"""
+        if not self.active:
+            return
+        self.active = False
+        self.in_wave = False
+        gc.unfreeze()
+        gc.set_threshold(*self.default_thresholds)
+        gc.enable()
+
+    def update(self, wave_active):
+        """Se llama una vez por frame con el estado de la oleada"""
+        if not self.active:
+            return
+        if wave_active and not self.in_wave:
+            self._enter_wave()
+        elif not wave_active and self.in_wave:
+            # Ventana entre oleadas: la pausa queda oculta tras el texto de transición
+            self.in_wave = False
+            gc.set_threshold(*self.default_thresholds)
+            gc.enable()
+            gc.collect()
+        elif self.in_wave and self.mode == 'manual' and gc.get_count()[0] > self.safety_count:
+            gc.collect(1)
+
+    def _enter_wave(self):
+        self.in_wave = True
+        if self.mode == 'manual':
+            gc.disable()
+        else:
+            gc.set_threshold(*self.wave_thresholds)
+
+    def get_debug_info(self):
+        return {
+            'mode': self.mode,
+            'in_wave': self.in_wave,
+            'collections': self.collections,
+            'last_ms': self.last_pause_ms,
+            'last_generation': self.last_generation,
+            'max_ms': self.max_pause_ms,
+            'total_ms': self.total_pause_ms,
+            'frozen': gc.get_freeze_count(),
+        }
+
+
+GC_POLICY = GCPolicy()
@@ -0,0 +1,40 @@
+"""
+Medición de latencia entrada -> pantalla por frame
+Se marca la última lectura del mouse antes de presentar (es la que refleja
+el frame) y se cierra la medición cuando vuelve la presentación. Con vsync
+el flip bloquea hasta el refresco, así que el valor incluye esa espera; sin
+él es una cota inferior (no cuenta el escaneo del monitor).
+"""
+import time
+from collections import deque
+
+class LatencyMonitor:
+    def __init__(self, window=120):
+        self.input_time = None
+        self.last_ms = 0.0
+        self.avg_ms = 0.0
+        self.samples = deque(maxlen=window)
+
+    def mark_input(self):
+        """Se llama al leer el input que usará el frame en curso"""
+        self.input_time = time.perf_counter()
+
+    def frame_presented(self):
+        """Cierra la medición del frame (justo después de presentar)"""
+        if self.input_time is None:
+            # El frame no leyó input: no hay latencia que medir
+            return
+        self.last_ms = (time.perf_counter() - self.input_time) * 1000.0
+        self.input_time = None
+        if not self.samples:
+            self.avg_ms = self.last_ms
+        else:
+            self.avg_ms += (self.last_ms - self.avg_ms) * 0.1
+        self.samples.append(self.last_ms)
+
+    def get_debug_info(self):
+        return {
+            'last_ms': self.last_ms,
+            'avg_ms': self.avg_ms,
+            'max_ms': max(self.samples) if self.samples else 0.0,
+        }
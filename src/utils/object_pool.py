@@ -1,8 +1,10 @@
 import pygame
 import math
+from random import choices, random
 from entities.projectile import Projectile
-from entities.particle import Particle
+from entities.particle import Particle, DIRECTION_TABLE, DIRECTION_STEPS, DIRECTION_STEPS_PER_RAD
 from settings import WINDOW_HEIGHT, WINDOW_WIDTH
+from utils.surface_factory import to_display, register_cache
 
 BLOOD_RED = (160, 0, 0)
 DARK_BLOOD = (80, 0, 0)
@@ -26,6 +28,8 @@ class ProjectilePool:
         
         p.x = x
         p.y = y
+        p.prev_x = x
+        p.prev_y = y
         p.angle = angle
         p.speed = speed
         p.damage = damage
@@ -74,6 +78,7 @@ class ParticlePool:
         self.next_index = 0
         self.cached_surfaces = {}
         self._generate_surface_cache()
+        register_cache(self.convert_surfaces)
     
     def _generate_surface_cache(self):
         """Generamos caché para los 4 colores gore"""
@@ -93,6 +98,13 @@ class ParticlePool:
                     surf_chunk = pygame.Surface((size*2, size*2), pygame.SRCALPHA)
                     pygame.draw.rect(surf_chunk, (*color, alpha), (0, 0, size*2, size*2))
                     self.cached_surfaces[key_chunk] = surf_chunk
+        
+        self.convert_surfaces()
+    
+    def convert_surfaces(self):
+        """Pasa la caché al formato del display (se repite si cambia el modo de video)"""
+        for key, surf in self.cached_surfaces.items():
+            self.cached_surfaces[key] = to_display(surf)
     
     def get_cached_surface(self, shape, color, size, alpha):
         """Busca la superficie pre-renderizada más cercana"""
@@ -128,97 +140,232 @@ class ParticlePool:
         
         return p
 
+    def emit_burst(self, x, y, count, colors, size_range, lifetime_range,
+                   speed_range=(0, 0), friction=0.9, gravity=0, is_chunk=False,
+                   is_liquid=True, direction=None, spread=0.0, scatter=0):
+        """
+        Escribe N partículas en el anillo en una sola llamada.
+        Los aleatorios se sacan en lote (random.choices) y las direcciones
+        salen de DIRECTION_TABLE, así el bucle solo copia valores.
+        """
+        count = min(count, self.capacity)
+        if count <= 0:
+            return 0
+
+        speed_lo, speed_hi = speed_range
+        speed_span = speed_hi - speed_lo
+        moving = speed_hi > 0
+
+        if moving:
+            if direction is None:
+                dirs = choices(DIRECTION_TABLE, k=count)
+            else:
+                base = int(round(direction * DIRECTION_STEPS_PER_RAD))
+                half = int(spread * DIRECTION_STEPS_PER_RAD)
+                dirs = [DIRECTION_TABLE[(base + o) % DIRECTION_STEPS]
+                        for o in choices(range(-half, half + 1), k=count)]
+        if scatter:
+            scatter_dirs = choices(DIRECTION_TABLE, k=count)
+
+        colors = choices(colors, k=count)
+        sizes = choices(range(size_range[0], size_range[1] + 1), k=count)
+        lifetimes = choices(range(lifetime_range[0], lifetime_range[1] + 1), k=count)
+
+        pool = self.pool
+        capacity = self.capacity
+        index = self.next_index
+
+        for i in range(count):
+            p = pool[index]
+            index += 1
+            if index == capacity:
+                index = 0
+
+            if scatter:
+                offset = scatter * random()
+                sdx, sdy = scatter_dirs[i]
+                p.x = x + sdx * offset
+                p.y = y + sdy * offset
+            else:
+                p.x = x
+                p.y = y
+
+            if moving:
+                speed = speed_lo + speed_span * random()
+                dx, dy = dirs[i]
+                p.vel_x = dx * speed
+                p.vel_y = dy * speed
+            else:
+                p.vel_x = 0
+                p.vel_y = 0
+
+            size = sizes[i]
+            lifetime = lifetimes[i]
+            p.color = colors[i]
+            p.size = size
+            p.original_size = size
+            p.lifetime = lifetime
+            p.max_lifetime = lifetime
+            p.is_alive = True
+            p.gravity = gravity
+            p.friction = friction
+            p.is_chunk = is_chunk
+            p.is_liquid = is_liquid
+            p.angle = 0
+
+        self.next_index = index
+        return count
+
     def update_all(self, dt):
         for p in self.pool:
             if p.is_alive:
                 p.update(dt)
     
-    def render_all(self, screen, camera, layer='all'):
+    def count_active(self):
+        """Partículas vivas (sin copiar estados de render)"""
+        return sum(1 for p in self.pool if p.is_alive)
+    
+    def collect_render_states(self, camera, floor_states, air_states):
         """
-        layer: 'all' (todo), 'floor' (solo charcos estáticos), 'air' (sangre volando)
+        Copia las partículas visibles a listas de tuplas
+        (x, y, vel_x, vel_y, forma, color, tamaño, alpha) en coordenadas de mundo
+        (la velocidad aproxima el desplazamiento del último tick), separadas por capa:
+        floor_states (charcos estáticos) y air_states (sangre volando).
+        Retorna cuántas partículas están vivas.
         """
-        rendered_count = 0
-        blit_sequence = []
+        active_count = 0
         cam_x = camera.offset_x
         cam_y = camera.offset_y
         
         margin = 50
-        min_x = -margin
-        max_x = WINDOW_WIDTH + margin
-        min_y = -margin
-        max_y = WINDOW_HEIGHT + margin
+        min_x = -margin - cam_x
+        max_x = WINDOW_WIDTH + margin - cam_x
+        min_y = -margin - cam_y
+        max_y = WINDOW_HEIGHT + margin - cam_y
+        
+        floor_append = floor_states.append
+        air_append = air_states.append
         
         for p in self.pool:
             if not p.is_alive:
                 continue
-
-            is_static_liquid = (p.is_liquid and not p.is_chunk and abs(p.vel_x) < 0.5 and abs(p.vel_y) < 0.5)
-            
-            if layer == 'floor':
-                if not is_static_liquid:
-                    continue
-            elif layer == 'air':
-                if is_static_liquid:
-                    continue
-
-            screen_x = p.x + cam_x
-            screen_y = p.y + cam_y
+            active_count += 1
             
-            if not (min_x < screen_x < max_x and min_y < screen_y < max_y):
+            x = p.x
+            y = p.y
+            if not (min_x < x < max_x and min_y < y < max_y):
                 continue
 
-            rendered_count += 1
-
             life_ratio = p.lifetime / p.max_lifetime
             if life_ratio <= 0: continue
             
             alpha = int(255 * life_ratio)
             if alpha < 10: continue
 
-            if is_static_liquid:
-                current_size = p.size
+            if p.is_liquid and not p.is_chunk and abs(p.vel_x) < 0.5 and abs(p.vel_y) < 0.5:
+                floor_append((x, y, 0.0, 0.0, 'circle', p.color, p.size, alpha))
             else:
-                current_size = max(1, int(p.original_size * life_ratio))
+                shape = 'chunk' if p.is_chunk else 'circle'
+                air_append((x, y, p.vel_x, p.vel_y, shape, p.color,
+                            max(1, int(p.original_size * life_ratio)), alpha))
+        
+        return active_count
+    
+    def render_states(self, screen, states, camera, interpolation=1.0):
+        """
+        Dibuja tuplas de collect_render_states con un único screen.blits
+        interpolation: fracción del último tick (retrocede vel * (1 - fracción)).
+        """
+        blit_sequence = []
+        cam_x = camera.offset_x
+        cam_y = camera.offset_y
+        scale = camera.render_scale
+        back = 1.0 - interpolation
+        
+        for x, y, vel_x, vel_y, shape, color, size, alpha in states:
+            screen_x = x - vel_x * back + cam_x
+            screen_y = y - vel_y * back + cam_y
+            if scale != 1.0:
+                screen_x *= scale
+                screen_y *= scale
+                size = max(1, int(size * scale))
             
-            shape = 'chunk' if p.is_chunk else 'circle'
-            surf = self.get_cached_surface(shape, p.color, current_size, alpha)
+            surf = self.get_cached_surface(shape, color, size, alpha)
             
             if surf:
                 dest_x = int(screen_x - surf.get_width() // 2)
                 dest_y = int(screen_y - surf.get_height() // 2)
                 blit_sequence.append((surf, (dest_x, dest_y)))
             else:
-                pygame.draw.circle(screen, p.color, (int(screen_x), int(screen_y)), current_size)
+                pygame.draw.circle(screen, color, (int(screen_x), int(screen_y)), size)
 
         if blit_sequence:
-            screen.blits(blit_sequence)
+            screen.blits(blit_sequence, doreturn=False)
             
+        return len(states)
+
+    def render_all(self, screen, camera, layer='all'):
+        """
+        layer: 'all' (todo), 'floor' (solo charcos estáticos), 'air' (sangre volando)
+        """
+        floor_states = []
+        air_states = []
+        self.collect_render_states(camera, floor_states, air_states)
+        rendered_count = 0
+        if layer in ('all', 'floor'):
+            rendered_count += self.render_states(screen, floor_states, camera)
+        if layer in ('all', 'air'):
+            rendered_count += self.render_states(screen, air_states, camera)
         return rendered_count
 
-    def bake_static_blood(self, target_surface):
+    def collect_static_blood(self, records, max_bakes=None):
         """
-        Transfiere partículas estáticas (líquidos parados) a una superficie permanente
-        y las elimina del pool para liberar rendimiento.
+        Retira del pool las partículas estáticas (líquidos parados) y anota
+        (x, y, color, tamaño) en 'records' para hornearlas en la capa de sangre.
+        max_bakes limita cuántas se retiran por frame (el resto espera al siguiente).
         """
         baked_count = 0
         
         for p in self.pool:
             if not p.is_alive:
                 continue
+            if max_bakes is not None and baked_count >= max_bakes:
+                break
 
             if p.is_liquid and not p.is_chunk:
                 if abs(p.vel_x) < 0.1 and abs(p.vel_y) < 0.1:
-                    shape = 'circle'
-                    surf = self.get_cached_surface(shape, p.color, p.size, 200) 
-                    if surf:
-                        draw_x = int(p.x - surf.get_width() // 2)
-                        draw_y = int(p.y - surf.get_height() // 2)
-                        target_surface.blit(surf, (draw_x, draw_y))
-                        p.is_alive = False
-                        baked_count += 1
+                    records.append((p.x, p.y, p.color, p.size))
+                    p.is_alive = False
+                    baked_count += 1
                         
         return baked_count
     
+    def draw_static_blood(self, records, target_surface, scaled_targets=None):
+        """
+        Hornea los registros de collect_static_blood en la superficie permanente.
+        scaled_targets: {escala: superficie} con las copias reducidas de la capa
+        (resolución dinámica); cada registro se hornea también en todas ellas.
+        """
+        for x, y, color, size in records:
+            surf = self.get_cached_surface('circle', color, size, 200)
+            if surf:
+                target_surface.blit(surf, (int(x - surf.get_width() // 2), int(y - surf.get_height() // 2)))
+                if scaled_targets:
+                    for scale, scaled_target in scaled_targets.items():
+                        small = self.get_cached_surface('circle', color, max(1, int(size * scale)), 200)
+                        scaled_target.blit(small, (int(x * scale - small.get_width() // 2),
+                                                   int(y * scale - small.get_height() // 2)))
+
+    def bake_static_blood(self, target_surface, max_bakes=None, scaled_targets=None):
+        """
+        Transfiere partículas estáticas (líquidos parados) a una superficie permanente
+        y las elimina del pool para liberar rendimiento.
+        """
+        records = []
+        baked_count = self.collect_static_blood(records, max_bakes)
+        self.draw_static_blood(records, target_surface, scaled_targets)
+        return baked_count
+    
     def clear(self):
         for p in self.pool:
             p.is_alive = False
\ No newline at end of file
@@ -0,0 +1,306 @@
+"""
+Capa de presentación: lleva la superficie virtual (BASE_WIDTH x BASE_HEIGHT)
+a la ventana real con distintos backends seleccionables.
+- 'scale': escala dentro de un destino preasignado (sin superficies nuevas por frame)
+- 'integer': escalado entero (pixel perfecto); si no cabe x1 cae a 'scale'
+- 'direct': 1:1 sin escalar, centrado (también se usa solo si la escala es 1.0)
+- 'sdl2' / 'sdl2_software': Renderer/Texture de pygame._sdl2.video
+Las barras del letterbox solo se limpian cuando cambia el tamaño.
+El vsync solo se puede garantizar con los backends SDL2 (vsync_active).
+present() acepta rectángulos sucios (coordenadas virtuales) para escalar y
+actualizar solo esas regiones; se alinean a la retícula racional de la escala
+para que el resultado sea idéntico al escalado del frame completo.
+Con resolución dinámica la escena puede entregar la capa del mundo reducida
+(world_layer): se escala una sola vez directo a la ventana y encima solo las
+zonas de la superficie virtual que tienen UI (backends por software).
+"""
+import pygame
+from fractions import Fraction
+from settings import BASE_WIDTH, BASE_HEIGHT, BLACK, TITLE
+from utils.surface_factory import create_surface, convert_all
+
+class Presenter:
+    BACKENDS = ('scale', 'integer', 'direct', 'sdl2', 'sdl2_software')
+
+    def __init__(self, backend='scale', vsync=False):
+        if backend not in self.BACKENDS:
+            raise ValueError(f"Backend de presentación desconocido: {backend}")
+        self.virtual_surface = None
+        self.backend = backend
+        self.vsync = vsync
+        self.vsync_active = False
+        self.screen = None
+        self.scale = 1.0
+        self.offset_x = 0
+        self.offset_y = 0
+        self.scaled_size = (BASE_WIDTH, BASE_HEIGHT)
+        self.layout_dirty = True
+
+        # Destino del escalado por software
+        self.scale_target = None
+        self.scale_into_screen = True
+        # Escala exacta por eje (p/q): retícula de alineación de los rects sucios
+        self.scale_x = Fraction(1)
+        self.scale_y = Fraction(1)
+        # Si los rects sucios cubren más que esta fracción, se presenta el frame completo
+        self.dirty_area_limit = 0.5
+        self.virtual_rect = pygame.Rect(0, 0, BASE_WIDTH, BASE_HEIGHT)
+
+        # Backend SDL2
+        self.window = None
+        self.renderer = None
+        self.texture = None
+        self.dest_rect = None
+
+    def set_source(self, virtual_surface):
+        """Superficie virtual que se presenta cada frame"""
+        self.virtual_surface = virtual_surface
+
+    # --- MODO DE VIDEO ---
+    def set_mode(self, size, flags=0):
+        """Crea/cambia la ventana y prepara el backend para el nuevo modo"""
+        if not (self.backend.startswith('sdl2') and self._set_mode_sdl2(size, flags)):
+            self.screen = pygame.display.set_mode(size, flags)
+            # El modo nuevo puede tener otro formato de pixel
+            convert_all()
+        self.layout_dirty = True
+        return self.screen
+
+    def _set_mode_sdl2(self, size, flags):
+        """
+        Ventana propia de pygame._sdl2 (sin superficie del módulo display,
+        que no puede convivir con un Renderer). Retorna False si no está disponible.
+        """
+        borderless = bool(flags & pygame.NOFRAME)
+        resizable = bool(flags & pygame.RESIZABLE)
+        try:
+            from pygame._sdl2.video import Window, Renderer, Texture, WINDOWPOS_CENTERED
+            if self.window is None:
+                self.window = Window(TITLE, size, borderless=borderless, resizable=resizable)
+                accelerated = 0 if self.backend == 'sdl2_software' else -1
+                self.renderer = Renderer(self.window, accelerated=accelerated, vsync=self.vsync)
+                self.vsync_active = self.vsync
+                self.texture = Texture(self.renderer, (BASE_WIDTH, BASE_HEIGHT), streaming=True)
+            else:
+                self.window.size = size
+                self.window.borderless = borderless
+                self.window.resizable = resizable
+            if not borderless:
+                self.window.position = WINDOWPOS_CENTERED
+            else:
+                self.window.position = (0, 0)
+            return True
+        except Exception as e:
+            print(f"Advertencia: backend {self.backend} no disponible ({e}). Usando 'scale'.")
+            self.backend = 'scale'
+            if self.window is not None:
+                self.window.destroy()
+            self.window = None
+            self.renderer = None
+            self.texture = None
+            self.vsync_active = False
+            return False
+
+    # --- LAYOUT ---
+    def _update_layout(self):
+        if self.renderer is not None:
+            current_w, current_h = self.window.size
+        else:
+            current_w, current_h = self.screen.get_size()
+
+        scale = min(current_w / BASE_WIDTH, current_h / BASE_HEIGHT)
+        if self.backend == 'direct':
+            scale = 1.0
+        elif self.backend == 'integer' and scale >= 1.0:
+            scale = float(int(scale))
+
+        new_w = int(BASE_WIDTH * scale)
+        new_h = int(BASE_HEIGHT * scale)
+
+        self.scale = scale
+        self.scaled_size = (new_w, new_h)
+        self.offset_x = (current_w - new_w) // 2
+        self.offset_y = (current_h - new_h) // 2
+        self.dest_rect = pygame.Rect(self.offset_x, self.offset_y, new_w, new_h)
+        self.scale_x = Fraction(new_w, BASE_WIDTH)
+        self.scale_y = Fraction(new_h, BASE_HEIGHT)
+
+        self.scale_target = None
+        if self.renderer is None:
+            # Letterbox: se limpia UNA vez por cambio de tamaño
+            self.screen.fill(BLACK)
+            if scale != 1.0:
+                self._prepare_scale_target()
+        self.layout_dirty = False
+
+    def _prepare_scale_target(self):
+        """Destino del escalado: subsuperficie de la pantalla o buffer preasignado"""
+        screen_rect = self.screen.get_rect()
+        if self.scale_into_screen and screen_rect.contains(self.dest_rect):
+            self.scale_target = self.screen.subsurface(self.dest_rect)
+        else:
+            self.scale_target = create_surface(self.scaled_size)
+
+    def get_render_params(self):
+        """(escala, offset_x, offset_y) para mapear el mouse a coordenadas virtuales"""
+        if self.layout_dirty:
+            self._update_layout()
+        return self.scale, self.offset_x, self.offset_y
+
+    @property
+    def supports_world_layer(self):
+        """True si present() puede componer la capa reducida del mundo (solo software)"""
+        return self.renderer is None
+
+    # --- PRESENTACIÓN ---
+    def present(self, dirty_rects=None, world_layer=None):
+        """
+        Lleva la superficie virtual a la ventana.
+        dirty_rects: None = frame completo; lista (posiblemente vacía) de
+        pygame.Rect virtuales que cambiaron desde la última presentación.
+        world_layer: (superficie reducida del mundo, rects virtuales con UI);
+        reemplaza al frame completo de la superficie virtual.
+        """
+        if self.layout_dirty:
+            self._update_layout()
+            # Tras un cambio de modo la ventana está vacía: siempre completo
+            dirty_rects = None
+
+        if world_layer is not None and self.renderer is None:
+            self._present_layered(*world_layer)
+            return
+
+        if dirty_rects is not None:
+            dirty_rects = self._align_dirty_rects(dirty_rects)
+            if dirty_rects is not None and not dirty_rects:
+                return
+
+        if self.renderer is not None:
+            self._present_sdl2(dirty_rects)
+            return
+
+        if dirty_rects is not None:
+            self._present_dirty(dirty_rects)
+            return
+
+        if self.scale == 1.0:
+            # Camino rápido 1:1 sin escalado
+            self.screen.blit(self.virtual_surface, (self.offset_x, self.offset_y))
+        else:
+            self._scale_into_target()
+        pygame.display.flip()
+
+    def _align_dirty_rects(self, dirty_rects):
+        """
+        Recorta y alinea los rects a múltiplos del denominador de la escala.
+        Retorna None si conviene presentar el frame completo.
+        """
+        qx = self.scale_x.denominator
+        qy = self.scale_y.denominator
+        aligned = []
+        area = 0
+        for rect in dirty_rects:
+            rect = rect.clip(self.virtual_rect)
+            if not rect.width or not rect.height:
+                continue
+            x0 = rect.x // qx * qx
+            y0 = rect.y // qy * qy
+            x1 = min(BASE_WIDTH, -(-rect.right // qx) * qx)
+            y1 = min(BASE_HEIGHT, -(-rect.bottom // qy) * qy)
+            aligned.append(pygame.Rect(x0, y0, x1 - x0, y1 - y0))
+            area += (x1 - x0) * (y1 - y0)
+        if area > BASE_WIDTH * BASE_HEIGHT * self.dirty_area_limit:
+            return None
+        return aligned
+
+    def _present_dirty(self, dirty_rects):
+        """Escala/copia solo las regiones sucias y actualiza solo esas zonas de la ventana"""
+        screen = self.screen
+        source = self.virtual_surface
+        offset_x = self.offset_x
+        offset_y = self.offset_y
+        updated = []
+        if self.scale == 1.0:
+            for rect in dirty_rects:
+                dest = rect.move(offset_x, offset_y)
+                screen.blit(source, dest, area=rect)
+                updated.append(dest)
+        else:
+            scale_x = self.scale_x
+            scale_y = self.scale_y
+            for rect in dirty_rects:
+                dest_x = int(rect.x * scale_x)
+                dest_y = int(rect.y * scale_y)
+                dest = pygame.Rect(dest_x, dest_y,
+                                   int(rect.right * scale_x) - dest_x,
+                                   int(rect.bottom * scale_y) - dest_y)
+                self._scale_region(source.subsurface(rect), dest)
+                updated.append(dest.move(offset_x, offset_y))
+        pygame.display.update(updated)
+
+    def _scale_region(self, source, dest):
+        """Escala una región al mismo lugar que ocuparía en el escalado completo"""
+        target = self.scale_target
+        if target.get_parent() is self.screen:
+            try:
+                pygame.transform.scale(source, dest.size, target.subsurface(dest))
+                return
+            except (ValueError, pygame.error):
+                self.scale_into_screen = False
+                self._prepare_scale_target()
+                target = self.scale_target
+        pygame.transform.scale(source, dest.size, target.subsurface(dest))
+        self.screen.blit(target, (dest.x + self.offset_x, dest.y + self.offset_y), area=dest)
+
+    def _present_layered(self, world_surface, overlay_rects):
+        """Un solo escalado de la capa reducida a la ventana y la UI encima"""
+        if self.scale_target is None:
+            # A escala 1:1 no hay destino preparado: la capa se escala igual
+            self._prepare_scale_target()
+        self._scale_into_target(world_surface)
+        scale_x = self.scale_x
+        scale_y = self.scale_y
+        source = self.virtual_surface
+        for rect in overlay_rects:
+            rect = rect.clip(self.virtual_rect)
+            if not rect.width or not rect.height:
+                continue
+            dest_x = int(rect.x * scale_x)
+            dest_y = int(rect.y * scale_y)
+            dest = pygame.Rect(dest_x, dest_y,
+                               int(rect.right * scale_x) - dest_x,
+                               int(rect.bottom * scale_y) - dest_y)
+            if self.scale == 1.0:
+                self.screen.blit(source, dest.move(self.offset_x, self.offset_y), area=rect)
+            else:
+                self._scale_region(source.subsurface(rect), dest)
+        pygame.display.flip()
+
+    def _scale_into_target(self, source=None):
+        if source is None:
+            source = self.virtual_surface
+        target = self.scale_target
+        if target.get_parent() is self.screen:
+            try:
+                pygame.transform.scale(source, self.scaled_size, target)
+                return
+            except (ValueError, pygame.error):
+                # Formato incompatible con la pantalla: usar buffer propio
+                self.scale_into_screen = False
+                self._prepare_scale_target()
+                target = self.scale_target
+        pygame.transform.scale(source, self.scaled_size, target)
+        self.screen.blit(target, (self.offset_x, self.offset_y))
+
+    def _present_sdl2(self, dirty_rects=None):
+        renderer = self.renderer
+        if dirty_rects is None:
+            self.texture.update(self.virtual_surface)
+        else:
+            # Solo se suben a la textura las regiones que cambiaron
+            for rect in dirty_rects:
+                self.texture.update(self.virtual_surface.subsurface(rect), area=rect)
+        renderer.draw_color = (0, 0, 0, 255)
+        renderer.clear()
+        self.texture.draw(dstrect=self.dest_rect)
+        renderer.present()
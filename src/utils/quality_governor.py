@@ -0,0 +1,111 @@
+"""
+Gobernador de calidad adaptativo
+Observa el tiempo real de update + render y mueve varios ajustes a la vez
+(con histéresis) para sostener el FPS objetivo en la máquina actual.
+"""
+from settings import FPS
+
+class QualityGovernor:
+    """
+    Cada nivel define TODOS los ajustes juntos, de peor (0) a mejor calidad.
+    - particle_quality: calidad del ParticleSystem (0=Low, 1=Mid, 2=High)
+    - burst_scale: multiplicador de tamaño de las ráfagas de partículas
+    - hit_cooldown: frames entre salpicaduras de impacto
+    - ai_interval: cada cuántos frames se recalcula la IA de un enemigo
+    - bake_budget: máximo de partículas horneadas en blood_surface por frame
+    - render_detail: 2=completo, 1=sin barras de vida, 0=además sin grid de fondo
+    """
+    LEVELS = (
+        {'particle_quality': 0, 'burst_scale': 0.5, 'hit_cooldown': 8, 'ai_interval': 8, 'bake_budget': 40, 'render_detail': 0},
+        {'particle_quality': 1, 'burst_scale': 0.6, 'hit_cooldown': 5, 'ai_interval': 6, 'bake_budget': 80, 'render_detail': 1},
+        {'particle_quality': 1, 'burst_scale': 1.0, 'hit_cooldown': 4, 'ai_interval': 5, 'bake_budget': 160, 'render_detail': 2},
+        {'particle_quality': 2, 'burst_scale': 0.8, 'hit_cooldown': 2, 'ai_interval': 4, 'bake_budget': 300, 'render_detail': 2},
+        {'particle_quality': 2, 'burst_scale': 1.0, 'hit_cooldown': 1, 'ai_interval': 4, 'bake_budget': 800, 'render_detail': 2},
+    )
+
+    def __init__(self, target_fps=FPS, fixed_level=None):
+        self.target_fps = target_fps
+        # Nivel fijo (simulaciones headless reproducibles): no se adapta al tiempo medido
+        self.fixed_level = fixed_level
+        # Presupuesto de trabajo: dejamos margen para HUD, escalado y flip
+        self.budget_ms = (1000.0 / target_fps) * 0.75
+        self.upgrade_ratio = 0.55      # Subir solo si vamos MUY holgados
+        self.downgrade_frames = 15     # Frames seguidos sobre presupuesto para bajar
+        self.upgrade_frames = 120      # Frames seguidos holgados para subir
+        self.change_cooldown = 30      # Frames de espera tras cada cambio
+        self.smoothing = 0.1           # Peso del frame nuevo en la media móvil
+        self.reset()
+
+    def reset(self):
+        """Vuelve a la calidad máxima (o al nivel fijo) y limpia las mediciones"""
+        self.level = len(self.LEVELS) - 1 if self.fixed_level is None else self.fixed_level
+        self.settings = self.LEVELS[self.level]
+        self.update_ms = 0.0
+        self.render_ms = 0.0
+        self.avg_frame_ms = 0.0
+        self.over_budget_count = 0
+        self.under_budget_count = 0
+        self.cooldown = 0
+        self.has_samples = False
+
+    def record_update(self, ms):
+        self.update_ms = ms
+
+    def record_render(self, ms):
+        self.render_ms = ms
+
+    def update(self):
+        """
+        Integra la última medición y decide si cambiar de nivel.
+        Retorna True si el nivel cambió en este frame.
+        """
+        work_ms = self.update_ms + self.render_ms
+        if not self.has_samples:
+            self.avg_frame_ms = work_ms
+            self.has_samples = True
+        else:
+            self.avg_frame_ms += (work_ms - self.avg_frame_ms) * self.smoothing
+
+        if self.fixed_level is not None:
+            return False
+
+        if self.cooldown > 0:
+            self.cooldown -= 1
+            return False
+
+        if self.avg_frame_ms > self.budget_ms:
+            self.over_budget_count += 1
+            self.under_budget_count = 0
+        elif self.avg_frame_ms < self.budget_ms * self.upgrade_ratio:
+            self.under_budget_count += 1
+            self.over_budget_count = 0
+        else:
+            # Zona muerta: ni subimos ni bajamos (histéresis)
+            self.over_budget_count = 0
+            self.under_budget_count = 0
+
+        if self.over_budget_count >= self.downgrade_frames and self.level > 0:
+            return self._set_level(self.level - 1)
+        if self.under_budget_count >= self.upgrade_frames and self.level < len(self.LEVELS) - 1:
+            return self._set_level(self.level + 1)
+        return False
+
+    def _set_level(self, level):
+        self.level = level
+        self.settings = self.LEVELS[level]
+        self.over_budget_count = 0
+        self.under_budget_count = 0
+        self.cooldown = self.change_cooldown
+        return True
+
+    def get_debug_info(self):
+        """Retorna las decisiones actuales para el overlay F3"""
+        info = dict(self.settings)
+        info['level'] = self.level
+        info['fixed'] = self.fixed_level is not None
+        info['max_level'] = len(self.LEVELS) - 1
+        info['avg_frame_ms'] = self.avg_frame_ms
+        info['update_ms'] = self.update_ms
+        info['render_ms'] = self.render_ms
+        info['budget_ms'] = self.budget_ms
+        return info
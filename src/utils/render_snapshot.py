@@ -0,0 +1,111 @@
+"""
+Instantáneas de render y su doble buffer
+La simulación copia al final de cada paso lo que necesita el render
+(posiciones, sprites, partículas, datos del HUD) y lo publica; el render
+solo lee la última instantánea publicada, nunca las entidades vivas.
+Así ambos pueden correr en hilos distintos (ver managers/simulation_thread.py).
+"""
+import threading
+
+class RenderSnapshot:
+    """Estado de un frame de simulación listo para dibujar (listas reutilizadas)"""
+    # Sangre pendiente que se conserva si nadie dibuja el buffer (se descartan las más viejas)
+    MAX_PENDING_BAKES = 1024
+    __slots__ = (
+        'frame', 'camera_prev_x', 'camera_prev_y', 'camera_x', 'camera_y', 'player', 'beams', 'enemies', 'projectiles',
+        'floor_particles', 'air_particles', 'blood_bakes', 'bakes_applied',
+        'show_health_bars', 'wave', 'score', 'wave_completed', 'wave_progress',
+        'enemies_total', 'projectiles_total', 'particles_active',
+    )
+
+    def __init__(self):
+        self.beams = []
+        self.enemies = []
+        self.projectiles = []
+        self.floor_particles = []
+        self.air_particles = []
+        self.blood_bakes = []
+        self.bakes_applied = True
+        self.reset()
+
+    def reset(self):
+        """Vacía el contenido; la sangre pendiente de hornear se conserva si nadie la aplicó"""
+        self.frame = 0
+        self.camera_prev_x = 0
+        self.camera_prev_y = 0
+        self.camera_x = 0
+        self.camera_y = 0
+        self.player = None
+        self.beams.clear()
+        self.enemies.clear()
+        self.projectiles.clear()
+        self.floor_particles.clear()
+        self.air_particles.clear()
+        if self.bakes_applied:
+            self.blood_bakes.clear()
+        elif len(self.blood_bakes) > self.MAX_PENDING_BAKES:
+            del self.blood_bakes[:len(self.blood_bakes) - self.MAX_PENDING_BAKES]
+        self.bakes_applied = False
+        self.show_health_bars = True
+        self.wave = 1
+        self.score = 0
+        self.wave_completed = False
+        self.wave_progress = 0.0
+        self.enemies_total = 0
+        self.projectiles_total = 0
+        self.particles_active = 0
+
+
+class SnapshotBuffer:
+    """
+    Doble buffer de instantáneas.
+    El productor llena el buffer trasero (begin_write) y lo publica con un
+    intercambio (publish); el consumidor toma el delantero (acquire/release).
+    Si el consumidor aún lee el buffer que toca escribir, el productor espera.
+    """
+    def __init__(self):
+        self.buffers = (RenderSnapshot(), RenderSnapshot())
+        self.front = None
+        self.reading = None
+        self.condition = threading.Condition()
+
+    def clear(self):
+        with self.condition:
+            self.front = None
+            for snapshot in self.buffers:
+                snapshot.bakes_applied = True
+                snapshot.reset()
+
+    def begin_write(self):
+        """Retorna el buffer trasero vacío, listo para llenar"""
+        with self.condition:
+            back = 1 if self.front == 0 else 0
+            while self.reading == back:
+                self.condition.wait()
+        snapshot = self.buffers[back]
+        snapshot.reset()
+        return snapshot
+
+    def publish(self, snapshot):
+        """Convierte 'snapshot' (de begin_write) en la instantánea visible"""
+        with self.condition:
+            self.front = self.buffers.index(snapshot)
+            self.condition.notify_all()
+
+    def acquire(self):
+        """Última instantánea publicada (o None); devolver con release()"""
+        with self.condition:
+            if self.front is None:
+                return None
+            self.reading = self.front
+            return self.buffers[self.front]
+
+    def release(self):
+        with self.condition:
+            self.reading = None
+            self.condition.notify_all()
+
+    def peek(self):
+        """Última instantánea sin reservarla (solo para leer contadores)"""
+        front = self.front
+        return None if front is None else self.buffers[front]
@@ -0,0 +1,82 @@
+"""
+Escalado dinámico de resolución para la capa del mundo
+Elige cada frame la fracción de BASE_WIDTH x BASE_HEIGHT a la que se dibuja
+el mundo según los tiempos de render recientes (con histéresis).
+"""
+from settings import FPS
+
+class ResolutionScaler:
+    # Fracciones permitidas (cuantizadas para reutilizar superficies y sprites)
+    SCALES = (0.5, 0.6, 0.7, 0.85, 1.0)
+
+    def __init__(self, target_fps=FPS, enabled=True):
+        self.enabled = enabled
+        # El mundo puede usar como mucho la mitad del frame
+        self.budget_ms = (1000.0 / target_fps) * 0.5
+        self.upgrade_ratio = 0.6
+        self.downgrade_frames = 10
+        self.upgrade_frames = 90
+        self.change_cooldown = 30
+        self.smoothing = 0.15
+        self.reset()
+
+    def reset(self):
+        self.index = len(self.SCALES) - 1
+        self.avg_render_ms = 0.0
+        self.over_budget_count = 0
+        self.under_budget_count = 0
+        self.cooldown = 0
+        self.has_samples = False
+
+    @property
+    def scale(self):
+        return self.SCALES[self.index] if self.enabled else 1.0
+
+    def record_render(self, ms):
+        """
+        Integra el tiempo de render del mundo (medido a la escala actual).
+        Retorna True si la escala cambió para el próximo frame.
+        """
+        if not self.enabled:
+            return False
+
+        if not self.has_samples:
+            self.avg_render_ms = ms
+            self.has_samples = True
+        else:
+            self.avg_render_ms += (ms - self.avg_render_ms) * self.smoothing
+
+        if self.cooldown > 0:
+            self.cooldown -= 1
+            return False
+
+        if self.avg_render_ms > self.budget_ms:
+            self.over_budget_count += 1
+            self.under_budget_count = 0
+        elif self.avg_render_ms < self.budget_ms * self.upgrade_ratio:
+            self.under_budget_count += 1
+            self.over_budget_count = 0
+        else:
+            self.over_budget_count = 0
+            self.under_budget_count = 0
+
+        if self.over_budget_count >= self.downgrade_frames and self.index > 0:
+            return self._set_index(self.index - 1)
+        if self.under_budget_count >= self.upgrade_frames and self.index < len(self.SCALES) - 1:
+            return self._set_index(self.index + 1)
+        return False
+
+    def _set_index(self, index):
+        self.index = index
+        self.over_budget_count = 0
+        self.under_budget_count = 0
+        self.cooldown = self.change_cooldown
+        return True
+
+    def get_debug_info(self):
+        return {
+            'enabled': self.enabled,
+            'scale': self.scale,
+            'avg_render_ms': self.avg_render_ms,
+            'budget_ms': self.budget_ms,
+        }
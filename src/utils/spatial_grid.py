@@ -56,4 +56,52 @@ class SpatialGrid:
                 cell = (cell_x, cell_y)
                 entities.extend(self.grid.get(cell, []))
         
-        return list(set(entities))
\ No newline at end of file
+        return list(set(entities))
+    
+    def query_bounds(self, left, top, right, bottom):
+        """
+        Obtiene las entidades de las celdas que cubren un rectángulo de mundo.
+        Pensado para culling: el rango de celdas se calcula una vez por consulta.
+        """
+        cell_size = self.cell_size
+        min_cx = int(left // cell_size)
+        min_cy = int(top // cell_size)
+        max_cx = int(right // cell_size)
+        max_cy = int(bottom // cell_size)
+        
+        entities = []
+        range_cells = (max_cx - min_cx + 1) * (max_cy - min_cy + 1)
+        
+        if len(self.grid) < range_cells:
+            # Pocas celdas ocupadas: recorrer el grid es más barato que el rango
+            for (cell_x, cell_y), cell in self.grid.items():
+                if min_cx <= cell_x <= max_cx and min_cy <= cell_y <= max_cy:
+                    entities.extend(cell)
+        else:
+            grid_get = self.grid.get
+            for cell_x in range(min_cx, max_cx + 1):
+                for cell_y in range(min_cy, max_cy + 1):
+                    cell = grid_get((cell_x, cell_y))
+                    if cell:
+                        entities.extend(cell)
+        
+        return entities
+    
+    def densest_cell(self, left, top, right, bottom):
+        """
+        Celda más poblada dentro de un rectángulo de mundo (sin copiar listas).
+        Retorna la lista de entidades de esa celda, o None si no hay ninguna.
+        """
+        cell_size = self.cell_size
+        min_cx = int(left // cell_size)
+        min_cy = int(top // cell_size)
+        max_cx = int(right // cell_size)
+        max_cy = int(bottom // cell_size)
+        
+        best = None
+        best_count = 0
+        for (cell_x, cell_y), cell in self.grid.items():
+            if len(cell) > best_count and min_cx <= cell_x <= max_cx and min_cy <= cell_y <= max_cy:
+                best = cell
+                best_count = len(cell)
+        return best
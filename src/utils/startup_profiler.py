@@ -0,0 +1,90 @@
+"""
+Perfilado de arranque y de transiciones entre escenas
+- Arranque: hitos con el tiempo transcurrido desde que se importó este módulo
+  (main lo importa primero) hasta el primer frame presentado
+- Transiciones: desde que la escena pide el cambio hasta que se presenta el
+  primer frame de la nueva, desglosado en preparación / salida / entrada / primer frame
+- Etapas sueltas (p. ej. el precalentamiento) con su duración
+Siempre mide (es barato); solo imprime el informe si PROFILE_STARTUP.
+"""
+import time
+from settings import PROFILE_STARTUP
+
+PROCESS_START = time.perf_counter()
+
+class StartupProfiler:
+    def __init__(self, start=PROCESS_START, verbose=PROFILE_STARTUP):
+        self.start = start
+        self.verbose = verbose
+        # (nombre, ms desde el arranque)
+        self.marks = []
+        # (nombre, ms)
+        self.stages = []
+        self.startup_ms = None
+        self.last_transition = None
+        self.transition = None
+
+    def mark(self, name):
+        """Hito de arranque"""
+        self.marks.append((name, (time.perf_counter() - self.start) * 1000.0))
+
+    def record_stage(self, name, ms):
+        self.stages.append((name, ms))
+        if self.verbose:
+            print(f"[perfil] etapa {name}: {ms:.1f}ms")
+
+    def first_frame_presented(self):
+        """Cierra el arranque (solo la primera vez)"""
+        if self.startup_ms is not None:
+            return
+        self.mark("primer frame")
+        self.startup_ms = self.marks[-1][1]
+        if self.verbose:
+            self.print_startup()
+
+    # --- TRANSICIONES ---
+    def begin_transition(self, name, start=None):
+        """start: instante en que la escena pidió el cambio (incluye construir la nueva)"""
+        self.transition = (name, start if start is not None else time.perf_counter(), [])
+
+    def transition_step(self, label):
+        """Cierra el tramo 'label' de la transición en curso"""
+        if self.transition is not None:
+            self.transition[2].append((label, time.perf_counter()))
+
+    def end_transition(self):
+        """Se llama tras presentar el primer frame de la nueva escena"""
+        if self.transition is None:
+            return
+        name, start, steps = self.transition
+        self.transition = None
+        steps.append(("primer frame", time.perf_counter()))
+        parts = []
+        previous = start
+        for label, t in steps:
+            parts.append((label, (t - previous) * 1000.0))
+            previous = t
+        self.last_transition = {
+            'name': name,
+            'total_ms': (previous - start) * 1000.0,
+            'parts': parts,
+        }
+        if self.verbose:
+            detail = " | ".join(f"{label} {ms:.1f}" for label, ms in parts)
+            print(f"[perfil] transición {name}: {self.last_transition['total_ms']:.1f}ms ({detail})")
+
+    def print_startup(self):
+        previous = 0.0
+        for name, ms in self.marks:
+            print(f"[perfil] {name}: {ms:.1f}ms (+{ms - previous:.1f})")
+            previous = ms
+
+    def get_debug_info(self):
+        return {
+            'startup_ms': self.startup_ms or 0.0,
+            'stages_ms': sum(ms for _, ms in self.stages),
+            'last_transition': self.last_transition,
+        }
+
+
+PROFILER = StartupProfiler()
@@ -0,0 +1,65 @@
+"""
+Fábrica de superficies en el formato de pixel del display
+Las superficies de larga vida (cachés, capas del mundo) se crean o convierten
+con convert()/convert_alpha() para que los blits no pasen por la ruta lenta
+de conversión de formato. Las cachés se registran para reconvertirse cuando
+cambia el modo de video (F11).
+"""
+import weakref
+import pygame
+
+# Color clave para sprites estáticos sin alpha por pixel (no aparece en la paleta)
+COLORKEY = (255, 0, 255)
+
+# Callbacks de reconversión registrados por las cachés
+_converters = []
+
+def display_ready():
+    """True si ya existe un display (convert() lo necesita)"""
+    return pygame.display.get_init() and pygame.display.get_surface() is not None
+
+def to_display(surface, alpha=True):
+    """Convierte una superficie al formato del display (si ya existe)"""
+    if not display_ready():
+        return surface
+    return surface.convert_alpha() if alpha else surface.convert()
+
+def to_display_colorkey(surface, colorkey=COLORKEY):
+    """Sprite estático con color clave: formato del display + aceleración RLE"""
+    if display_ready():
+        surface = surface.convert()
+    surface.set_colorkey(colorkey, pygame.RLEACCEL)
+    return surface
+
+def create_surface(size, alpha=False):
+    """Crea una superficie nueva ya en el formato del display"""
+    if alpha:
+        surface = pygame.Surface(size, pygame.SRCALPHA)
+    else:
+        surface = pygame.Surface(size)
+    return to_display(surface, alpha)
+
+def register_cache(converter):
+    """
+    Registra un callback que reconvierte una caché al formato actual.
+    Los métodos de instancia se guardan con referencia débil para no
+    mantener vivos a sus dueños.
+    """
+    if hasattr(converter, '__self__'):
+        _converters.append(weakref.WeakMethod(converter))
+    else:
+        _converters.append(lambda: converter)
+
+def convert_all():
+    """Reconvierte todas las cachés registradas (llamar tras set_mode)"""
+    if not display_ready():
+        return 0
+    alive = []
+    for ref in _converters:
+        converter = ref()
+        if converter is None:
+            continue
+        converter()
+        alive.append(ref)
+    _converters[:] = alive
+    return len(alive)
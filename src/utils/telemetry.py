@@ -0,0 +1,182 @@
+"""
+Telemetría por frame de cada partida
+- Cada frame se escribe en un buffer circular preasignado (array de doubles,
+  sin crear objetos por frame)
+- Un hilo de fondo vuelca lo pendiente a disco cada medio segundo: el bucle
+  del juego nunca espera por I/O. Si el escritor se atrasa más que el
+  tamaño del buffer, los frames más viejos se pierden (y se cuentan)
+- Formato del archivo (.telemetry): una línea JSON de cabecera con los
+  campos y el orden de bytes, seguida de los registros como doubles
+  (ver tools/perf_report.py)
+- Para el resumen de fin de partida se lleva además un histograma de
+  tiempos de frame (también preasignado)
+- Los archivos van a TELEMETRY_DIR dentro de la raíz del proyecto (no del
+  directorio actual) y al empezar cada partida se borran los más viejos
+  hasta dejar TELEMETRY_KEEP
+"""
+import json
+import os
+import sys
+import threading
+import time
+from array import array
+from settings import TELEMETRY_ENABLED, TELEMETRY_DIR, TELEMETRY_KEEP
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+FIELDS = (
+    'time_s', 'dt_ms', 'work_ms', 'wait_ms', 'update_ms', 'render_ms',
+    'enemies', 'projectiles', 'particles', 'wave', 'quality', 'gc_collections', 'gc_pause_ms',
+)
+
+class Telemetry:
+    def __init__(self, enabled=TELEMETRY_ENABLED, output_dir=TELEMETRY_DIR, capacity=4096, keep=TELEMETRY_KEEP):
+        self.enabled = enabled
+        self.output_dir = os.path.join(PROJECT_ROOT, output_dir)
+        self.keep = keep
+        self.capacity = capacity
+        self.width = len(FIELDS)
+        self.buffer = array('d', bytes(8 * capacity * self.width))
+        # Registros escritos / volcados desde el inicio de la partida (no se reinician por vuelta)
+        self.written = 0
+        self.flushed = 0
+        self.dropped = 0
+
+        # Histograma de dt en pasos de 0.1 ms (el último cubo acumula todo lo mayor)
+        self.bucket_ms = 0.1
+        self.histogram = array('l', bytes(array('l').itemsize * 2000))
+        self.total_ms = 0.0
+        self.worst_ms = 0.0
+
+        self.file = None
+        self.path = None
+        self.thread = None
+        self.running = False
+        self.wake = threading.Event()
+        self.flush_interval = 0.5
+        self.run_start = 0.0
+
+    # --- PARTIDA ---
+    def begin_run(self):
+        if not self.enabled or self.running:
+            return
+        os.makedirs(self.output_dir, exist_ok=True)
+        self._rotate()
+        self.path = os.path.join(self.output_dir, f"partida_{time.strftime('%Y%m%d-%H%M%S')}.telemetry")
+        self.file = open(self.path, 'wb')
+        header = {'fields': FIELDS, 'byteorder': sys.byteorder, 'version': 1}
+        self.file.write((json.dumps(header) + "\n").encode('utf-8'))
+
+        self.written = 0
+        self.flushed = 0
+        self.dropped = 0
+        for i in range(len(self.histogram)):
+            self.histogram[i] = 0
+        self.total_ms = 0.0
+        self.worst_ms = 0.0
+        self.run_start = time.perf_counter()
+
+        self.running = True
+        self.thread = threading.Thread(target=self._writer, name="telemetry-writer", daemon=True)
+        self.thread.start()
+
+    def end_run(self):
+        """Vuelca lo pendiente y cierra el archivo"""
+        if not self.running:
+            return
+        self.running = False
+        self.wake.set()
+        self.thread.join()
+        self.thread = None
+        self.file.close()
+        self.file = None
+
+    def _rotate(self):
+        """Borra las partidas más viejas: junto con la que empieza quedan 'keep'"""
+        names = sorted(name for name in os.listdir(self.output_dir)
+                       if name.startswith("partida_") and name.endswith(".telemetry"))
+        for name in names[:max(0, len(names) - self.keep + 1)]:
+            try:
+                os.remove(os.path.join(self.output_dir, name))
+            except OSError:
+                pass
+
+    # --- REGISTRO (hilo principal) ---
+    def record(self, dt_ms, work_ms, wait_ms, update_ms, render_ms,
+               enemies, projectiles, particles, wave, quality, gc_collections, gc_pause_ms):
+        if not self.running:
+            return
+        buffer = self.buffer
+        i = (self.written % self.capacity) * self.width
+        buffer[i] = time.perf_counter() - self.run_start
+        buffer[i + 1] = dt_ms
+        buffer[i + 2] = work_ms
+        buffer[i + 3] = wait_ms
+        buffer[i + 4] = update_ms
+        buffer[i + 5] = render_ms
+        buffer[i + 6] = enemies
+        buffer[i + 7] = projectiles
+        buffer[i + 8] = particles
+        buffer[i + 9] = wave
+        buffer[i + 10] = quality
+        buffer[i + 11] = gc_collections
+        buffer[i + 12] = gc_pause_ms
+        # Se publica después de escribir: el escritor nunca lee un registro a medias
+        self.written += 1
+
+        bucket = min(int(dt_ms / self.bucket_ms), len(self.histogram) - 1)
+        self.histogram[bucket] += 1
+        self.total_ms += dt_ms
+        if dt_ms > self.worst_ms:
+            self.worst_ms = dt_ms
+
+    # --- ESCRITOR (hilo de fondo) ---
+    def _writer(self):
+        while self.running:
+            self.wake.wait(self.flush_interval)
+            self.wake.clear()
+            self._flush()
+        self._flush()
+
+    def _flush(self):
+        written = self.written
+        start = self.flushed
+        if written - start > self.capacity:
+            # El buffer dio la vuelta: esos registros ya se sobrescribieron
+            self.dropped += written - start - self.capacity
+            start = written - self.capacity
+        width = self.width
+        while start < written:
+            first = start % self.capacity
+            count = min(written - start, self.capacity - first)
+            chunk = self.buffer[first * width:(first + count) * width]
+            self.file.write(chunk.tobytes())
+            start += count
+        self.file.flush()
+        self.flushed = written
+
+    # --- RESUMEN ---
+    def get_summary(self):
+        """FPS promedio, 1% bajo (FPS del percentil 99 de dt) y peor frame de la partida"""
+        frames = self.written
+        if not frames:
+            return None
+        threshold = frames * 0.99
+        seen = 0
+        p99_ms = self.worst_ms
+        for bucket, count in enumerate(self.histogram):
+            seen += count
+            if seen >= threshold:
+                p99_ms = (bucket + 1) * self.bucket_ms
+                break
+        return {
+            'frames': frames,
+            'avg_fps': 1000.0 * frames / self.total_ms if self.total_ms > 0 else 0.0,
+            'low_1_fps': 1000.0 / p99_ms if p99_ms > 0 else 0.0,
+            'worst_ms': self.worst_ms,
+            'dropped': self.dropped,
+            'path': self.path,
+        }
+
+
+TELEMETRY = Telemetry()
@@ -0,0 +1,58 @@
+"""
+Registro de fuentes y caché de texto renderizado (compartidos por todo el proceso)
+Evita abrir pygame.font.Font y rasterizar el mismo texto 60 veces por segundo.
+"""
+import pygame
+from collections import OrderedDict
+
+# (nombre, tamaño) -> pygame.font.Font
+_FONTS = {}
+
+def get_font(size, name=None):
+    """Retorna la fuente compartida para (name, size); se abre solo la primera vez"""
+    key = (name, size)
+    font = _FONTS.get(key)
+    if font is None:
+        font = pygame.font.Font(name, size)
+        _FONTS[key] = font
+    return font
+
+
+class TextCache:
+    """
+    Caché LRU de superficies de texto.
+    Clave: (fuente, tamaño, texto, color, antialias).
+    Las superficies se comparten: quien las use NO debe modificarlas
+    (para cambiar su alpha, trabajar sobre una copia).
+    """
+    def __init__(self, max_entries=512):
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def render(self, text, size, color, antialias=True, name=None):
+        key = (name, size, text, color, antialias)
+        entries = self.entries
+        surf = entries.get(key)
+        if surf is not None:
+            entries.move_to_end(key)
+            self.hits += 1
+            return surf
+
+        self.misses += 1
+        surf = get_font(size, name).render(text, antialias, color)
+        entries[key] = surf
+        if len(entries) > self.max_entries:
+            entries.popitem(last=False)
+        return surf
+
+    def clear(self):
+        self.entries.clear()
+
+
+TEXT_CACHE = TextCache()
+
+def render_text(text, size, color, antialias=True, name=None):
+    """Atajo a la caché global: retorna la superficie (compartida) del texto"""
+    return TEXT_CACHE.render(text, size, color, antialias, name)